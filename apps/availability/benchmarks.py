@@ -0,0 +1,405 @@
+"""
+Availability benchmark suite.
+
+Builds a synthetic organizer with configurable amounts of schedule and busy
+data and measures the availability entry points on it:
+
+- ``calculate_available_slots`` (one-on-one and group event types)
+- ``AvailabilityCalculator.get_available_slots``
+- the ``calculated_slots`` API view, end-to-end
+
+Each target is measured on the cache miss path (cache cleared before every
+run) and on the cache hit path, reporting wall time, query count and
+allocations. ``run_benchmarks`` returns a JSON-serializable dict so results
+can be stored and compared across releases (see the
+``benchmark_availability`` management command).
+"""
+import logging
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta, time as dt_time
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from .models import AvailabilityRule, BlockedTime, BufferTime, DateOverrideRule, RecurringBlockedTime
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# Default amount of synthetic data per organizer
+DEFAULT_COUNTS = {
+    'days': 30,
+    'rules': 10,
+    'overrides': 5,
+    'recurring_blocks': 5,
+    'blocked_times': 20,
+    'bookings': 40,
+    'group_bookings': 10,
+    'external_busy': 30,
+}
+
+EXTERNAL_SOURCES = ['google_calendar', 'outlook_calendar', 'external_sync']
+
+
+class BenchmarkScenario:
+    """Synthetic organizer data created for one benchmark run."""
+
+    def __init__(self, organizer, event_type, group_event_type, start_date, end_date, counts, seed):
+        self.organizer = organizer
+        self.event_type = event_type
+        self.group_event_type = group_event_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.counts = counts
+        self.seed = seed
+
+    def describe(self):
+        """Return the JSON-serializable scenario description."""
+        return {
+            'seed': self.seed,
+            'organizer_timezone': self.organizer.profile.timezone_name,
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat(),
+            'counts': dict(self.counts),
+        }
+
+
+def _random_datetime(rng, organizer_tz, start_date, days, start_hour=8, end_hour=18):
+    """Return a random quarter-hour aligned aware datetime within the window."""
+    day = start_date + timedelta(days=rng.randrange(days))
+    minutes = rng.randrange(start_hour * 4, end_hour * 4) * 15
+    return timezone.make_aware(
+        datetime.combine(day, dt_time(minutes // 60, minutes % 60)), organizer_tz
+    )
+
+
+def build_synthetic_organizer(seed=0, timezone_name='America/New_York', **counts):
+    """
+    Create a synthetic organizer with schedule, bookings and busy data.
+
+    Rows are inserted with ``bulk_create`` so post_save signals (cache
+    invalidation, notifications, calendar sync) do not fire while building.
+
+    Args:
+        seed: Random seed, so the same arguments produce the same data
+        timezone_name: Organizer's IANA timezone
+        **counts: Overrides for ``DEFAULT_COUNTS`` (days, rules, overrides,
+            recurring_blocks, blocked_times, bookings, group_bookings,
+            external_busy)
+
+    Returns:
+        BenchmarkScenario
+    """
+    from apps.users.models import Profile
+    from apps.events.models import Attendee, Booking, EventType
+    from .timezones import get_zone
+
+    counts = {**DEFAULT_COUNTS, **{key: value for key, value in counts.items() if value is not None}}
+    rng = random.Random(seed)
+    organizer_tz = get_zone(timezone_name)
+    days = max(counts['days'], 1)
+
+    email = f'benchmark-{seed}-{rng.randrange(10 ** 9)}@benchmark.local'
+    organizer = User.objects.create_user(
+        email=email,
+        password=None,
+        first_name='Benchmark',
+        last_name='Organizer',
+        is_organizer=True,
+        is_email_verified=True,
+        account_status='active'
+    )
+    profile, _ = Profile.objects.get_or_create(user=organizer)
+    profile.timezone_name = timezone_name
+    profile.save()
+    organizer.profile = profile
+    BufferTime.objects.get_or_create(organizer=organizer)
+
+    event_type = EventType.objects.create(
+        organizer=organizer,
+        name='Benchmark Meeting',
+        duration=30,
+        min_scheduling_notice=0
+    )
+    group_event_type = EventType.objects.create(
+        organizer=organizer,
+        name='Benchmark Workshop',
+        duration=60,
+        max_attendees=10,
+        min_scheduling_notice=0
+    )
+
+    start_date = timezone.now().date() + timedelta(days=1)
+    end_date = start_date + timedelta(days=days - 1)
+
+    # Availability rules spread over the week (several per weekday once rules > 7)
+    AvailabilityRule.objects.bulk_create([
+        AvailabilityRule(
+            organizer=organizer,
+            day_of_week=i % 7,
+            start_time=dt_time(8 + (i // 7) * 2 % 8, 0),
+            end_time=dt_time(min(12 + (i // 7) * 2 % 8 + 1, 23), 0)
+        )
+        for i in range(counts['rules'])
+    ])
+
+    DateOverrideRule.objects.bulk_create([
+        DateOverrideRule(
+            organizer=organizer,
+            date=start_date + timedelta(days=rng.randrange(days)),
+            is_available=bool(i % 2),
+            start_time=dt_time(10, 0) if i % 2 else None,
+            end_time=dt_time(14, 0) if i % 2 else None,
+            reason='Benchmark override'
+        )
+        for i in range(counts['overrides'])
+    ])
+
+    RecurringBlockedTime.objects.bulk_create([
+        RecurringBlockedTime(
+            organizer=organizer,
+            name=f'Benchmark block {i}',
+            day_of_week=rng.randrange(7),
+            start_time=dt_time(rng.randrange(8, 17), 0),
+            end_time=dt_time(rng.randrange(17, 20), 0)
+        )
+        for i in range(counts['recurring_blocks'])
+    ])
+
+    blocked_times = []
+    for i in range(counts['blocked_times']):
+        start = _random_datetime(rng, organizer_tz, start_date, days)
+        blocked_times.append(BlockedTime(
+            organizer=organizer,
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=rng.choice([30, 60, 120])),
+            reason='Benchmark block',
+            source='manual'
+        ))
+
+    # External busy periods are stored the way calendar sync stores them
+    for i in range(counts['external_busy']):
+        start = _random_datetime(rng, organizer_tz, start_date, days)
+        blocked_times.append(BlockedTime(
+            organizer=organizer,
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=rng.choice([15, 30, 45, 60])),
+            reason='Busy',
+            source=rng.choice(EXTERNAL_SOURCES),
+            external_id=f'benchmark-{seed}-{i}'
+        ))
+    BlockedTime.objects.bulk_create(blocked_times)
+
+    now = timezone.now()
+    bookings = []
+    for i in range(counts['bookings']):
+        start = _random_datetime(rng, organizer_tz, start_date, days)
+        bookings.append(Booking(
+            event_type=event_type,
+            organizer=organizer,
+            invitee_name=f'Invitee {i}',
+            invitee_email=f'invitee{i}@benchmark.local',
+            start_time=start,
+            end_time=start + timedelta(minutes=event_type.duration),
+            status='confirmed',
+            access_token_expires_at=now + timedelta(days=30)
+        ))
+
+    group_bookings = []
+    for i in range(counts['group_bookings']):
+        start = _random_datetime(rng, organizer_tz, start_date, days)
+        group_bookings.append(Booking(
+            event_type=group_event_type,
+            organizer=organizer,
+            invitee_name=f'Group invitee {i}',
+            invitee_email=f'group{i}@benchmark.local',
+            start_time=start,
+            end_time=start + timedelta(minutes=group_event_type.duration),
+            status='confirmed',
+            attendee_count=rng.randrange(1, group_event_type.max_attendees),
+            access_token_expires_at=now + timedelta(days=30)
+        ))
+    Booking.objects.bulk_create(bookings + group_bookings)
+
+    Attendee.objects.bulk_create([
+        Attendee(
+            booking=booking,
+            name=f'Attendee {booking.invitee_name} {n}',
+            email=f'attendee{n}-{booking.invitee_email}',
+            status='confirmed'
+        )
+        for booking in group_bookings
+        for n in range(booking.attendee_count)
+    ])
+
+    return BenchmarkScenario(organizer, event_type, group_event_type, start_date, end_date, counts, seed)
+
+
+def clear_availability_cache(scenario, event_type=None):
+    """Remove cached availability of a scenario from every cache backend."""
+    from apps.events.models import EventTypeAvailabilityCache
+    from .engine import invalidate_availability_chunks
+
+    targets = [event_type] if event_type else [scenario.event_type, scenario.group_event_type]
+    invalidate_availability_chunks(
+        scenario.organizer, scenario.start_date, scenario.end_date, [target.id for target in targets]
+    )
+    # Dirty rows would still cost a lookup; drop them for a true cold path
+    EventTypeAvailabilityCache.objects.filter(event_type__in=targets).delete()
+
+
+def measure(func, repeat=5, setup=None):
+    """
+    Measure a callable.
+
+    Timed runs and the allocation run are separate, since tracemalloc slows
+    allocation-heavy code down considerably.
+
+    Args:
+        func: Callable to measure
+        repeat: Number of timed runs
+        setup: Optional callable run (untimed) before every run
+
+    Returns:
+        dict: Wall time (ms), query count and allocation statistics
+    """
+    durations = []
+    query_counts = []
+
+    for _ in range(max(repeat, 1)):
+        if setup:
+            setup()
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - started) * 1000)
+        query_counts.append(len(context.captured_queries))
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'runs': len(durations),
+        'wall_time_ms': {
+            'min': round(min(durations), 3),
+            'median': round(statistics.median(durations), 3),
+            'max': round(max(durations), 3),
+        },
+        'queries': {
+            'min': min(query_counts),
+            'max': max(query_counts),
+        },
+        'allocations': {
+            'peak_bytes': peak - before,
+            'net_bytes': after - before,
+        },
+    }
+
+
+def _benchmark_targets(scenario):
+    """Return (name, callable, event type) tuples for every benchmark target."""
+    from apps.events.utils import AvailabilityCalculator
+    from .utils import calculate_available_slots
+    from .views import calculated_slots
+
+    factory = RequestFactory()
+    organizer_slug = scenario.organizer.profile.organizer_slug
+
+    def slots_for(event_type):
+        return lambda: calculate_available_slots(
+            organizer=scenario.organizer,
+            event_type=event_type,
+            start_date=scenario.start_date,
+            end_date=scenario.end_date,
+            invitee_timezone='UTC'
+        )
+
+    def calculator():
+        return AvailabilityCalculator(
+            scenario.organizer, scenario.event_type, 'UTC'
+        ).get_available_slots(scenario.start_date, scenario.end_date)
+
+    def view():
+        request = factory.get('/', {
+            'event_type_slug': scenario.event_type.event_type_slug,
+            'start_date': scenario.start_date.isoformat(),
+            'end_date': scenario.end_date.isoformat(),
+            'invitee_timezone': 'UTC',
+        })
+        response = calculated_slots(request, organizer_slug=organizer_slug)
+        if response.status_code != 200:
+            raise RuntimeError(f"calculated_slots returned {response.status_code}: {response.data}")
+        return response
+
+    return [
+        ('calculate_available_slots', slots_for(scenario.event_type), scenario.event_type),
+        ('calculate_available_slots_group', slots_for(scenario.group_event_type), scenario.group_event_type),
+        ('availability_calculator', calculator, scenario.event_type),
+        ('calculated_slots_view', view, scenario.event_type),
+    ]
+
+
+def run_benchmarks(scenario, repeat=5):
+    """
+    Run every benchmark target on a scenario, on both cache paths.
+
+    Args:
+        scenario: BenchmarkScenario from ``build_synthetic_organizer``
+        repeat: Number of timed runs per target and path
+
+    Returns:
+        dict: JSON-serializable results
+    """
+    results = {}
+
+    for name, func, event_type in _benchmark_targets(scenario):
+        def clear(event_type=event_type):
+            clear_availability_cache(scenario, event_type)
+
+        clear()
+        slot_count = _slot_count(func())
+
+        results[name] = {
+            'slots': slot_count,
+            'cache_miss': measure(func, repeat, setup=clear),
+            # The last miss run filled the cache, so these runs are all hits
+            'cache_hit': measure(func, repeat),
+        }
+
+    clear_availability_cache(scenario)
+
+    return {
+        'scenario': scenario.describe(),
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'cache_backend': settings.CACHES['default']['BACKEND'],
+            'availability_cache_backend': getattr(settings, 'AVAILABILITY_CACHE_BACKEND', 'redis'),
+            'slot_engine': getattr(settings, 'AVAILABILITY_SLOT_ENGINE', 'sweep'),
+        },
+        'results': results,
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def _slot_count(result):
+    """Return the number of slots in a target's return value."""
+    if hasattr(result, 'data'):
+        return result.data.get('total_slots', 0)
+    return result.get('total_slots', len(result.get('slots', [])))
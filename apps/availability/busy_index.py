@@ -0,0 +1,349 @@
+"""
+Busy-interval index and sweep-line slot placement for the availability engine.
+
+All busy sources for a request (blocked times, recurring blocks, external
+calendar events and existing bookings) are loaded once, converted to UTC and
+kept as sorted interval lists so that every slot check is a bisect instead of
+a linear scan over every busy record. The sweep engine goes one step further
+and turns the busy intervals into ranges of forbidden slot starts, so a whole
+availability window is placed in a single pass.
+"""
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from django.db.models import Count, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def confirmed_attendee_count(booking):
+    """
+    Return the number of confirmed attendees of a booking.
+
+    Uses the ``confirmed_attendee_count`` annotation (see
+    ``annotate_confirmed_attendees``) when present so capacity checks do not
+    query per booking.
+    """
+    annotated = getattr(booking, 'confirmed_attendee_count', None)
+    if annotated is not None:
+        return annotated
+    return booking.attendees.filter(status='confirmed').count()
+
+
+def annotate_confirmed_attendees(bookings):
+    """Annotate a Booking queryset with its confirmed attendee counts in the same query."""
+    return bookings.annotate(
+        confirmed_attendee_count=Count('attendees', filter=Q(attendees__status='confirmed'))
+    )
+
+
+class IntervalSet:
+    """Sorted, merged set of half-open UTC intervals with O(log n) overlap lookup."""
+
+    def __init__(self, intervals=None):
+        self.starts = []
+        self.ends = []
+        if intervals:
+            self._build(intervals)
+
+    def _build(self, intervals):
+        """Sort and merge overlapping or touching intervals."""
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                if end > self.ends[-1]:
+                    self.ends[-1] = end
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(zip(self.starts, self.ends))
+
+    def overlaps(self, start_time, end_time):
+        """Check whether [start_time, end_time) overlaps any interval in the set."""
+        # Last interval starting before the query end; intervals are disjoint and
+        # sorted, so it also has the greatest end among the candidates.
+        index = bisect_left(self.starts, end_time) - 1
+        return index >= 0 and self.ends[index] > start_time
+
+
+class BookingIntervalIndex:
+    """
+    Existing bookings indexed by their buffered UTC interval.
+
+    Each booking is padded with its own event type's buffers up front, so the
+    conflict check only has to look at bookings whose buffered window can
+    overlap the candidate slot.
+    """
+
+    def __init__(self, bookings=()):
+        records = []
+        self.exact = {}
+
+        for booking in bookings:
+            booking_event_type = booking.event_type
+            buffered_start = booking.start_time - timedelta(minutes=booking_event_type.buffer_time_before)
+            buffered_end = booking.end_time + timedelta(minutes=booking_event_type.buffer_time_after)
+            records.append((buffered_start, buffered_end, booking))
+
+            # First booking wins, matching the original linear scan order
+            exact_key = (booking_event_type.id, booking.start_time, booking.end_time)
+            self.exact.setdefault(exact_key, booking)
+
+        records.sort(key=lambda record: record[0])
+        self.starts = [record[0] for record in records]
+        self.ends = [record[1] for record in records]
+        self.bookings = [record[2] for record in records]
+        self.max_length = max(
+            (end - start for start, end in zip(self.starts, self.ends)),
+            default=timedelta(0)
+        )
+
+    def __len__(self):
+        return len(self.bookings)
+
+    def __iter__(self):
+        return iter(self.bookings)
+
+    def overlapping(self, start_time, end_time):
+        """Return bookings whose buffered interval overlaps [start_time, end_time)."""
+        if not self.bookings:
+            return []
+
+        # Only bookings starting after (start_time - longest booking) can reach the slot
+        low = bisect_right(self.starts, start_time - self.max_length)
+        high = bisect_left(self.starts, end_time)
+
+        return [
+            self.bookings[i] for i in range(low, high)
+            if self.ends[i] > start_time
+        ]
+
+    def find_exact(self, event_type_id, start_time, end_time):
+        """Return the booking of an event type at exactly this slot, if any."""
+        return self.exact.get((event_type_id, start_time, end_time))
+
+
+def expand_recurring_blocks(recurring_blocks, organizer_tz, start_date, end_date):
+    """
+    Expand recurring blocked times into concrete UTC intervals.
+
+    Args:
+        recurring_blocks: Iterable of RecurringBlockedTime instances
+        organizer_tz: ZoneInfo of the organizer
+        start_date: First date to expand
+        end_date: Last date to expand
+
+    Returns:
+        list: (start_utc, end_utc) tuples
+    """
+    blocks_by_weekday = {}
+    for recurring_block in recurring_blocks:
+        blocks_by_weekday.setdefault(recurring_block.day_of_week, []).append(recurring_block)
+
+    intervals = []
+    current_date = start_date
+
+    while current_date <= end_date:
+        for recurring_block in blocks_by_weekday.get(current_date.weekday(), ()):
+            if not recurring_block.applies_to_date(current_date):
+                continue
+
+            # Midnight-spanning blocks become one continuous interval into the next day
+            end_day = current_date + timedelta(days=1) if recurring_block.spans_midnight() else current_date
+            block_start = datetime.combine(current_date, recurring_block.start_time).replace(tzinfo=organizer_tz)
+            block_end = datetime.combine(end_day, recurring_block.end_time).replace(tzinfo=organizer_tz)
+
+            intervals.append((block_start.astimezone(timezone.utc), block_end.astimezone(timezone.utc)))
+
+        current_date += timedelta(days=1)
+
+    return intervals
+
+
+def merge_open_ranges(ranges):
+    """
+    Merge open (start, end) ranges that strictly overlap.
+
+    Ranges that only touch are kept apart because their shared endpoint is
+    itself an allowed value.
+
+    Args:
+        ranges: Iterable of (start, end) tuples
+
+    Returns:
+        tuple: (starts, ends) sorted lists of disjoint open ranges
+    """
+    starts = []
+    ends = []
+    for start, end in sorted(ranges):
+        if end <= start:
+            continue
+        if ends and start < ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def sweep_slot_starts(range_start, range_end, duration, slot_interval, accepted_step, forbidden,
+                      earliest_start=None, latest_start=None, accept=None):
+    """
+    Place aligned slot starts in a window, skipping forbidden start ranges.
+
+    Walks the same candidate grid as the per-slot loop (advance by
+    ``slot_interval`` after a rejection, by ``accepted_step`` after an
+    accepted slot) but jumps over each forbidden range in one step.
+
+    Args:
+        range_start: UTC datetime where the window opens
+        range_end: UTC datetime where the window closes
+        duration: timedelta of a slot
+        slot_interval: timedelta between candidate starts
+        accepted_step: timedelta to advance after an accepted slot
+        forbidden: (starts, ends) of merged open ranges of disallowed starts
+        earliest_start: Starts before this are rejected (minimum notice)
+        latest_start: Starts after this end the window (scheduling horizon)
+        accept: Optional callable(start) for remaining per-slot rules
+
+    Returns:
+        list: Accepted UTC slot start datetimes
+    """
+    forbidden_starts, forbidden_ends = forbidden
+    last_start = range_end - duration
+    index = bisect_right(forbidden_ends, range_start)
+    current = range_start
+    accepted = []
+
+    while current <= last_start:
+        if latest_start is not None and current > latest_start:
+            break
+
+        if earliest_start is not None and current < earliest_start:
+            current += -((current - earliest_start) // slot_interval) * slot_interval
+            continue
+
+        while index < len(forbidden_ends) and forbidden_ends[index] <= current:
+            index += 1
+
+        if index < len(forbidden_ends) and forbidden_starts[index] < current:
+            # Jump to the first aligned candidate at or past the end of the range
+            current += -((current - forbidden_ends[index]) // slot_interval) * slot_interval
+            continue
+
+        if accept is not None and not accept(current):
+            current += slot_interval
+            continue
+
+        accepted.append(current)
+        current += accepted_step
+
+    return accepted
+
+
+class BusyIntervalIndex:
+    """
+    All busy sources for one availability request, indexed once.
+
+    Attributes:
+        blocked: IntervalSet of BlockedTime periods
+        recurring: IntervalSet of expanded RecurringBlockedTime occurrences
+        external: IntervalSet of external calendar busy periods
+        bookings: BookingIntervalIndex of confirmed bookings
+    """
+
+    def __init__(self, blocked, recurring, external, bookings):
+        self.blocked = blocked
+        self.recurring = recurring
+        self.external = external
+        self.bookings = bookings
+
+    @classmethod
+    def build(cls, organizer_tz, start_date, end_date, blocked_times=(), recurring_blocks=(),
+              external_busy_times=(), existing_bookings=()):
+        """
+        Build the index for a date range.
+
+        Args:
+            organizer_tz: ZoneInfo of the organizer
+            start_date: First date of the request
+            end_date: Last date of the request
+            blocked_times: Iterable of BlockedTime instances
+            recurring_blocks: Iterable of RecurringBlockedTime instances
+            external_busy_times: List of dicts with 'start_time' and 'end_time'
+            existing_bookings: Iterable of Booking instances (with event_type loaded,
+                ideally from annotate_confirmed_attendees)
+
+        Returns:
+            BusyIntervalIndex
+        """
+        # Slots can spill into neighbouring days (midnight-spanning rules), so
+        # expand recurring blocks one day either side of the requested range.
+        recurring_intervals = expand_recurring_blocks(
+            recurring_blocks, organizer_tz,
+            start_date - timedelta(days=1), end_date + timedelta(days=1)
+        )
+
+        return cls(
+            blocked=IntervalSet(
+                (blocked.start_datetime, blocked.end_datetime) for blocked in blocked_times
+            ),
+            recurring=IntervalSet(recurring_intervals),
+            external=IntervalSet(
+                (busy['start_time'], busy['end_time']) for busy in external_busy_times
+            ),
+            bookings=BookingIntervalIndex(existing_bookings),
+        )
+
+    def forbidden_start_ranges(self, event_type, duration, buffer_before, buffer_after, attendee_count=1):
+        """
+        Convert the indexed busy intervals into ranges of forbidden slot starts.
+
+        Mirrors the per-slot checks: blocked, recurring and external intervals
+        are tested against the unbuffered slot, bookings against the slot
+        padded with this event type's buffers. A same-type group booking with
+        spare capacity leaves its exact matching start open.
+
+        Args:
+            event_type: EventType being scheduled
+            duration: timedelta of a slot
+            buffer_before: timedelta buffer before the slot
+            buffer_after: timedelta buffer after the slot
+            attendee_count: Number of attendees requested
+
+        Returns:
+            tuple: (starts, ends) of merged open ranges
+        """
+        ranges = []
+
+        for interval_set in (self.blocked, self.recurring, self.external):
+            for busy_start, busy_end in interval_set:
+                ranges.append((busy_start - duration, busy_end))
+
+        for busy_start, busy_end, booking in zip(self.bookings.starts, self.bookings.ends, self.bookings.bookings):
+            range_start = busy_start - duration - buffer_after
+            range_end = busy_end + buffer_before
+
+            if (booking.event_type.id == event_type.id and
+                event_type.is_group_event() and
+                booking.end_time - booking.start_time == duration + buffer_before + buffer_after):
+
+                current_attendees = confirmed_attendee_count(booking)
+                if current_attendees + attendee_count <= event_type.max_attendees:
+                    # Joining this booking is allowed at exactly its own start
+                    open_start = booking.start_time + buffer_before
+                    ranges.append((range_start, open_start))
+                    ranges.append((open_start, range_end))
+                    continue
+
+            ranges.append((range_start, range_end))
+
+        return merge_open_ranges(ranges)
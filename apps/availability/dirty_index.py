@@ -0,0 +1,130 @@
+"""
+Index of organizers with pending availability cache changes.
+
+``mark_cache_dirty`` records each change for an organizer; the index keeps
+the organizers ordered by the time of their oldest pending change so
+``process_dirty_cache_flags`` can drain them oldest first, in bounded
+batches, without scanning the keyspace.
+
+With the Redis cache the index is a sorted set (``ZADD NX`` scored by the
+first change time) plus one list of JSON changes per organizer, and a drain
+claims an organizer's changes in one MULTI transaction. Other cache
+backends (local memory in development and tests) use a cached dict instead.
+"""
+import json
+import logging
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+INDEX_KEY = 'availability_dirty_index'
+
+
+def _changes_key(organizer_id):
+    return f"dirty_cache:{organizer_id}"
+
+
+def _changes_timeout():
+    # Long enough for batch processing, and always past the debounced flush
+    return max(600, settings.AVAILABILITY_CACHE_DEBOUNCE_SECONDS * 2)
+
+
+class RedisDirtyIndex:
+    """Dirty index stored in Redis structures next to the Django cache keys."""
+
+    def __init__(self, client):
+        self.client = client
+        self.index_key = cache.make_key(INDEX_KEY)
+
+    def mark(self, organizer_id, change):
+        """Record a change for an organizer."""
+        changes_key = cache.make_key(_changes_key(organizer_id))
+        pipe = self.client.pipeline()
+        pipe.rpush(changes_key, json.dumps(change))
+        pipe.expire(changes_key, _changes_timeout())
+        # NX keeps the time of the oldest pending change
+        pipe.zadd(self.index_key, {str(organizer_id): time.time()}, nx=True)
+        pipe.execute()
+
+    def organizers(self, limit=None, older_than=None):
+        """Return dirty organizer IDs, oldest first."""
+        max_score = time.time() - older_than if older_than else '+inf'
+        if limit:
+            members = self.client.zrangebyscore(self.index_key, '-inf', max_score, start=0, num=limit)
+        else:
+            members = self.client.zrangebyscore(self.index_key, '-inf', max_score)
+        return [member.decode() if isinstance(member, bytes) else member for member in members]
+
+    def pop(self, organizer_id):
+        """Claim and remove the pending changes of an organizer."""
+        changes_key = cache.make_key(_changes_key(organizer_id))
+        pipe = self.client.pipeline(transaction=True)
+        pipe.lrange(changes_key, 0, -1)
+        pipe.delete(changes_key)
+        pipe.zrem(self.index_key, str(organizer_id))
+        raw_changes, _, _ = pipe.execute()
+        return [json.loads(raw_change) for raw_change in raw_changes]
+
+    def size(self):
+        """Return the number of dirty organizers."""
+        return self.client.zcard(self.index_key)
+
+
+class CacheDirtyIndex:
+    """Dirty index stored as plain cache values, for non-Redis cache backends."""
+
+    def _index(self):
+        return cache.get(INDEX_KEY, {})
+
+    def mark(self, organizer_id, change):
+        """Record a change for an organizer."""
+        changes = cache.get(_changes_key(organizer_id), [])
+        changes.append(change)
+        cache.set(_changes_key(organizer_id), changes, timeout=_changes_timeout())
+
+        index = self._index()
+        index.setdefault(str(organizer_id), time.time())
+        cache.set(INDEX_KEY, index, timeout=None)
+
+    def organizers(self, limit=None, older_than=None):
+        """Return dirty organizer IDs, oldest first."""
+        max_score = time.time() - older_than if older_than else float('inf')
+        members = [
+            organizer_id for organizer_id, score in sorted(self._index().items(), key=lambda item: item[1])
+            if score <= max_score
+        ]
+        return members[:limit] if limit else members
+
+    def pop(self, organizer_id):
+        """Claim and remove the pending changes of an organizer."""
+        changes = cache.get(_changes_key(organizer_id), [])
+        cache.delete(_changes_key(organizer_id))
+
+        index = self._index()
+        if index.pop(str(organizer_id), None) is not None:
+            cache.set(INDEX_KEY, index, timeout=None)
+        return changes
+
+    def size(self):
+        """Return the number of dirty organizers."""
+        return len(self._index())
+
+
+def get_redis_client():
+    """Return the raw client of the Django Redis cache, or None for other cache backends."""
+    try:
+        if hasattr(cache, '_cache') and hasattr(cache._cache, 'get_client'):
+            return cache._cache.get_client(write=True)
+    except Exception as e:
+        logger.warning(f"Redis client unavailable: {str(e)}")
+    return None
+
+
+def get_dirty_index():
+    """Return the dirty index for the configured cache backend."""
+    client = get_redis_client()
+    if client is not None:
+        return RedisDirtyIndex(client)
+    return CacheDirtyIndex()
@@ -0,0 +1,1155 @@
+"""
+Availability engine.
+
+One entry point for every availability consumer (the availability API, the
+public booking pages, booking validation and cache warming). The engine is
+assembled from three pluggable parts:
+
+- a loader, which reads schedule and busy data for a query
+  (``DatabaseAvailabilityLoader``)
+- a cache backend, which stores weekly slot chunks
+  (``DjangoCacheBackend`` for the Redis cache, ``RedisHashCacheBackend`` for
+  one Redis hash per organizer and week, ``DatabaseCacheBackend`` for
+  ``EventTypeAvailabilityCache``)
+- a slot engine, ``'sweep'`` or ``'loop'``, used by ``generate_slots``
+
+Chunks hold the raw UTC slots of one organizer-local week, computed for a
+single attendee with the remaining capacity of each slot. They do not depend
+on the invitee timezone or attendee count, so any date range is assembled
+from the chunks of its weeks and localized after the cache read.
+
+Changes tied to dates invalidate exactly the weeks they touch. Other changes
+(rules, buffers, event type settings) bump a per-organizer or per-event-type
+generation counter that is part of every Redis chunk key, so one INCR
+retires all of an organizer's chunks and the old entries age out by TTL.
+
+Concurrent misses on the same weeks are coalesced: one request computes
+them under a short cache lock while the others serve the previous (stale)
+chunks, or wait briefly for the fresh ones.
+
+``get_availability_engine()`` builds the engine configured in settings.
+"""
+import logging
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.utils import timezone
+from .models import AvailabilityRule, BlockedTime, BufferTime, DateOverrideRule, RecurringBlockedTime
+from .busy_index import BusyIntervalIndex, annotate_confirmed_attendees
+from .dirty_index import get_redis_client
+from .local_cache import get_local_cache
+from .metrics import record_availability_request, record_recompute, record_stale_serve
+from .slot_set import SlotSet
+from .timezones import get_zone
+from .utils import (
+    PerformanceProfiler, _get_reasonable_hours, generate_slots_for_override, generate_slots_for_rule,
+    bump_availability_generation, get_availability_chunk_key, get_availability_generations,
+    get_chunk_lock_key, get_external_busy_times, get_stale_chunk_key, get_week_starts, validate_timezone
+)
+from apps.events.models import Booking, EventType, EventTypeAvailabilityCache
+
+logger = logging.getLogger(__name__)
+
+# How far ahead date-scoped invalidation reaches when a change has no end date
+INVALIDATION_HORIZON_DAYS = 90
+
+
+class AvailabilityQuery:
+    """Parameters of one availability request."""
+
+    def __init__(self, organizer, event_type, start_date, end_date, invitee_timezone='UTC',
+                 attendee_count=1, invitee_timezones=None):
+        self.organizer = organizer
+        self.event_type = event_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.invitee_timezone = invitee_timezone
+        self.attendee_count = attendee_count
+        self.invitee_timezones = invitee_timezones or []
+
+    @property
+    def is_multi_invitee(self):
+        return len(self.invitee_timezones) > 1
+
+
+class AvailabilityData:
+    """Schedule and busy data loaded for one query."""
+
+    def __init__(self, organizer_timezone, rules_by_weekday, overrides_by_date, busy_index,
+                 buffer_settings, daily_booking_counts=None):
+        self.organizer_timezone = organizer_timezone
+        self.rules_by_weekday = rules_by_weekday
+        self.overrides_by_date = overrides_by_date
+        self.busy_index = busy_index
+        self.buffer_settings = buffer_settings
+        self.daily_booking_counts = daily_booking_counts
+
+
+class DatabaseAvailabilityLoader:
+    """Load rules, overrides and busy data from the database in a fixed number of queries."""
+
+    def load(self, query, profiler=None):
+        """
+        Load everything needed to generate slots for a query.
+
+        Args:
+            query: AvailabilityQuery
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            AvailabilityData
+        """
+        organizer = query.organizer
+        event_type = query.event_type
+        start_date = query.start_date
+        end_date = query.end_date
+        organizer_timezone = organizer.profile.timezone_name
+
+        # Get availability rules that apply to this event type
+        availability_rules = AvailabilityRule.objects.filter(
+            organizer=organizer,
+            is_active=True
+        ).filter(
+            models.Q(event_types__isnull=True) | models.Q(event_types=event_type)
+        ).distinct().prefetch_related('event_types')
+
+        # Bucket rules by weekday once instead of filtering inside the day loop
+        rules_by_weekday = {}
+        for rule in availability_rules:
+            if rule.applies_to_event_type(event_type):
+                rules_by_weekday.setdefault(rule.day_of_week, []).append(rule)
+
+        if profiler:
+            profiler.checkpoint('rules_query')
+
+        # Get date overrides that apply to this event type
+        date_overrides = DateOverrideRule.objects.filter(
+            organizer=organizer,
+            is_active=True,
+            date__gte=start_date,
+            date__lte=end_date
+        ).filter(
+            models.Q(event_types__isnull=True) | models.Q(event_types=event_type)
+        ).distinct().order_by('pk')
+
+        # First override per date wins, as with .first() on the date
+        overrides_by_date = {}
+        for override in date_overrides:
+            overrides_by_date.setdefault(override.date, override)
+
+        busy_index, buffer_settings = self._load_busy_data(organizer, organizer_timezone, start_date, end_date)
+
+        if profiler:
+            profiler.checkpoint('data_queries')
+
+        return AvailabilityData(
+            organizer_timezone=organizer_timezone,
+            rules_by_weekday=rules_by_weekday,
+            overrides_by_date=overrides_by_date,
+            busy_index=busy_index,
+            buffer_settings=buffer_settings,
+            daily_booking_counts=self._load_daily_booking_counts(event_type, start_date, end_date)
+        )
+
+    def load_event_types(self, organizer, event_types, start_date, end_date, profiler=None):
+        """
+        Load the data of several event types of one organizer at once.
+
+        Rules, overrides and busy data are queried once for the organizer and
+        split per event type in memory.
+
+        Args:
+            organizer: User instance (organizer)
+            event_types: List of EventType instances
+            start_date: datetime.date object
+            end_date: datetime.date object
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            dict: {event_type_id: AvailabilityData}
+        """
+        organizer_timezone = organizer.profile.timezone_name
+
+        availability_rules = list(AvailabilityRule.objects.filter(
+            organizer=organizer,
+            is_active=True
+        ).prefetch_related('event_types'))
+
+        date_overrides = list(DateOverrideRule.objects.filter(
+            organizer=organizer,
+            is_active=True,
+            date__gte=start_date,
+            date__lte=end_date
+        ).order_by('pk').prefetch_related('event_types'))
+
+        busy_index, buffer_settings = self._load_busy_data(organizer, organizer_timezone, start_date, end_date)
+
+        if profiler:
+            profiler.checkpoint('data_queries')
+
+        data_by_event_type = {}
+        for event_type in event_types:
+            rules_by_weekday = {}
+            for rule in availability_rules:
+                if rule.applies_to_event_type(event_type):
+                    rules_by_weekday.setdefault(rule.day_of_week, []).append(rule)
+
+            overrides_by_date = {}
+            for override in date_overrides:
+                if override.applies_to_event_type(event_type):
+                    overrides_by_date.setdefault(override.date, override)
+
+            data_by_event_type[event_type.id] = AvailabilityData(
+                organizer_timezone=organizer_timezone,
+                rules_by_weekday=rules_by_weekday,
+                overrides_by_date=overrides_by_date,
+                busy_index=busy_index,
+                buffer_settings=buffer_settings,
+                daily_booking_counts=self._load_daily_booking_counts(event_type, start_date, end_date)
+            )
+
+        return data_by_event_type
+
+    def _load_busy_data(self, organizer, organizer_timezone, start_date, end_date):
+        """Load and index every busy source of an organizer; returns (busy_index, buffer_settings)."""
+        blocked_times = BlockedTime.objects.filter(
+            organizer=organizer,
+            is_active=True,
+            start_datetime__date__lte=end_date,
+            end_datetime__date__gte=start_date
+        )
+
+        recurring_blocks = RecurringBlockedTime.objects.filter(
+            organizer=organizer,
+            is_active=True
+        )
+
+        # Existing bookings (ALL event types for this organizer), with
+        # confirmed attendee counts for group capacity in the same query
+        existing_bookings = annotate_confirmed_attendees(Booking.objects.filter(
+            organizer=organizer,
+            status='confirmed',
+            start_time__date__lte=end_date,
+            end_time__date__gte=start_date
+        ).select_related('event_type'))
+
+        external_busy_times = get_external_busy_times(organizer, start_date, end_date)
+
+        buffer_settings, _ = BufferTime.objects.get_or_create(organizer=organizer)
+
+        # Index every busy source once so per-slot checks are bisects, not scans
+        busy_index = BusyIntervalIndex.build(
+            get_zone(organizer_timezone), start_date, end_date,
+            blocked_times=blocked_times,
+            recurring_blocks=recurring_blocks,
+            external_busy_times=external_busy_times,
+            existing_bookings=existing_bookings
+        )
+
+        return busy_index, buffer_settings
+
+    def _load_daily_booking_counts(self, event_type, start_date, end_date):
+        """Per-day confirmed booking counts for max_bookings_per_day, read once."""
+        if not event_type.max_bookings_per_day:
+            return None
+
+        from apps.events.utils import get_daily_booking_counts
+        return get_daily_booking_counts(
+            event_type, start_date - timedelta(days=1), end_date + timedelta(days=1)
+        )
+
+
+class DjangoCacheBackend:
+    """
+    Store weekly slot chunks in the Django cache (Redis in production).
+
+    Args:
+        timeout: Chunk lifetime in seconds (default: AVAILABILITY_CACHE_TIMEOUT)
+        local_cache: Optional ``LocalLRUCache`` read before Redis, for hot
+            public pages
+    """
+
+    name = 'redis'
+
+    def __init__(self, timeout=None, local_cache=None):
+        self.timeout = timeout or settings.AVAILABILITY_CACHE_TIMEOUT
+        self.local_cache = local_cache
+
+    def generation(self, organizer, event_type):
+        """Return the current cache generation of an event type."""
+        if self.local_cache is None:
+            return get_availability_generations(organizer.id, [event_type.id])[event_type.id]
+
+        local_key = f"generation:{organizer.id}:{event_type.id}"
+        generation = self.local_cache.get(local_key)
+        if generation is None:
+            generation = get_availability_generations(organizer.id, [event_type.id])[event_type.id]
+            self.local_cache.set(local_key, generation, settings.AVAILABILITY_LOCAL_GENERATION_TIMEOUT)
+        return generation
+
+    def get_chunks(self, organizer, event_type, week_starts, generation=None):
+        """Return the cached chunks of the given weeks as {week_start: SlotSet}."""
+        generation = generation or self.generation(organizer, event_type)
+        keys = {
+            get_availability_chunk_key(organizer.id, event_type.id, week_start, generation): week_start
+            for week_start in week_starts
+        }
+
+        cached_chunks = {}
+        remote_keys = list(keys)
+        if self.local_cache is not None:
+            cached_chunks = self.local_cache.get_many(remote_keys)
+            remote_keys = [key for key in remote_keys if key not in cached_chunks]
+
+        if remote_keys:
+            remote_chunks = cache.get_many(remote_keys)
+            if self.local_cache is not None:
+                self.local_cache.set_many(remote_chunks)
+            cached_chunks.update(remote_chunks)
+
+        return {keys[key]: chunk for key, chunk in cached_chunks.items()}
+
+    def set_chunks(self, organizer, event_type, chunks, timeout=None, generation=None):
+        """
+        Cache chunks given as {week_start: SlotSet}.
+
+        Pass the generation read before computing the chunks: if the cache was
+        invalidated meanwhile, the chunks land under the retired generation
+        and are never served.
+        """
+        generation = generation or self.generation(organizer, event_type)
+        data = {
+            get_availability_chunk_key(organizer.id, event_type.id, week_start, generation): chunk
+            for week_start, chunk in chunks.items()
+        }
+        cache.set_many(data, timeout=timeout or self.timeout)
+        if self.local_cache is not None:
+            self.local_cache.set_many(data)
+
+        # Kept past invalidation and expiry, to serve while a recompute runs
+        cache.set_many({
+            get_stale_chunk_key(organizer.id, event_type.id, week_start): chunk
+            for week_start, chunk in chunks.items()
+        }, timeout=settings.AVAILABILITY_STALE_TIMEOUT)
+
+    def get_stale_chunks(self, organizer, event_type, week_starts):
+        """Return the last chunks cached for the given weeks, of any generation."""
+        keys = {get_stale_chunk_key(organizer.id, event_type.id, week_start): week_start for week_start in week_starts}
+        return {keys[key]: chunk for key, chunk in cache.get_many(list(keys)).items()}
+
+    def touch_chunks(self, organizer, event_type, week_starts, timeout=None):
+        """Extend the lifetime of cached chunks; False if any of them is missing."""
+        generation = self.generation(organizer, event_type)
+        return all(
+            cache.touch(get_availability_chunk_key(organizer.id, event_type.id, week_start, generation),
+                        timeout or self.timeout)
+            for week_start in week_starts
+        )
+
+    def invalidate(self, organizer, event_type_ids, week_starts):
+        """Delete the current chunks of the given event types and weeks."""
+        generations = get_availability_generations(organizer.id, event_type_ids)
+        keys = [
+            get_availability_chunk_key(organizer.id, event_type_id, week_start, generations[event_type_id])
+            for event_type_id in event_type_ids
+            for week_start in week_starts
+        ]
+        cache.delete_many(keys)
+        # Other processes drop their copies when the local entries expire
+        get_local_cache().delete_many(keys)
+
+    def invalidate_all(self, organizer, event_type_ids=None):
+        """Retire every chunk of an organizer, or of some event types, by bumping generations."""
+        if event_type_ids is None:
+            bump_availability_generation(organizer.id)
+            return
+
+        for event_type_id in event_type_ids:
+            bump_availability_generation(organizer.id, event_type_id)
+        get_local_cache().delete_many([
+            f"generation:{organizer.id}:{event_type_id}" for event_type_id in event_type_ids
+        ])
+
+
+class DatabaseCacheBackend:
+    """
+    Store weekly slot chunks in ``EventTypeAvailabilityCache`` rows.
+
+    A chunk row is dated by its week start and stored for UTC and a single
+    attendee, since chunks are timezone and attendee independent.
+    """
+
+    name = 'database'
+
+    CHUNK_TIMEZONE = 'UTC'
+    CHUNK_ATTENDEE_COUNT = 1
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or settings.AVAILABILITY_CACHE_TIMEOUT
+
+    def generation(self, organizer, event_type):
+        """Rows are invalidated in place, so there is no generation."""
+        return None
+
+    def get_chunks(self, organizer, event_type, week_starts, generation=None):
+        """Return the cached chunks of the given weeks as {week_start: SlotSet}."""
+        cache_entries = EventTypeAvailabilityCache.objects.filter(
+            organizer=organizer,
+            event_type=event_type,
+            date__in=week_starts,
+            timezone_name=self.CHUNK_TIMEZONE,
+            attendee_count=self.CHUNK_ATTENDEE_COUNT,
+            is_dirty=False,
+            expires_at__gt=timezone.now()
+        )
+        return {entry.date: SlotSet.from_payload(entry.available_slots) for entry in cache_entries}
+
+    def get_stale_chunks(self, organizer, event_type, week_starts):
+        """Return the chunk rows of the given weeks, including dirty and expired ones."""
+        cache_entries = EventTypeAvailabilityCache.objects.filter(
+            organizer=organizer,
+            event_type=event_type,
+            date__in=week_starts,
+            timezone_name=self.CHUNK_TIMEZONE,
+            attendee_count=self.CHUNK_ATTENDEE_COUNT
+        )
+        return {entry.date: SlotSet.from_payload(entry.available_slots) for entry in cache_entries}
+
+    def set_chunks(self, organizer, event_type, chunks, timeout=None, generation=None):
+        """Cache chunks given as {week_start: SlotSet} with one bulk upsert."""
+        self.set_event_type_chunks(organizer, {event_type: chunks}, timeout)
+
+    def set_event_type_chunks(self, organizer, chunks_by_event_type, timeout=None):
+        """Cache the chunks of several event types, {EventType: {week_start: SlotSet}}, with one bulk upsert."""
+        expires_at = timezone.now() + timedelta(seconds=timeout or self.timeout)
+
+        EventTypeAvailabilityCache.objects.bulk_create(
+            [
+                EventTypeAvailabilityCache(
+                    organizer=organizer,
+                    event_type=event_type,
+                    date=week_start,
+                    timezone_name=self.CHUNK_TIMEZONE,
+                    attendee_count=self.CHUNK_ATTENDEE_COUNT,
+                    available_slots=chunk.to_payload(),
+                    expires_at=expires_at,
+                    is_dirty=False
+                )
+                for event_type, chunks in chunks_by_event_type.items()
+                for week_start, chunk in chunks.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['organizer', 'event_type', 'date', 'timezone_name', 'attendee_count'],
+            update_fields=['available_slots', 'expires_at', 'is_dirty']
+        )
+
+    def touch_chunks(self, organizer, event_type, week_starts, timeout=None):
+        """Extend the lifetime of cached chunks; False if any of them is missing."""
+        touched = EventTypeAvailabilityCache.objects.filter(
+            organizer=organizer,
+            event_type=event_type,
+            date__in=week_starts,
+            timezone_name=self.CHUNK_TIMEZONE,
+            attendee_count=self.CHUNK_ATTENDEE_COUNT,
+            is_dirty=False,
+            expires_at__gt=timezone.now()
+        ).update(expires_at=timezone.now() + timedelta(seconds=timeout or self.timeout))
+        return touched == len(week_starts)
+
+    def invalidate(self, organizer, event_type_ids, week_starts):
+        """Mark the chunks of the given event types and weeks dirty."""
+        EventTypeAvailabilityCache.objects.filter(
+            organizer=organizer,
+            event_type_id__in=event_type_ids,
+            date__in=week_starts
+        ).update(is_dirty=True)
+
+    def invalidate_all(self, organizer, event_type_ids=None):
+        """Mark every chunk of an organizer, or of some event types, dirty."""
+        cache_entries = EventTypeAvailabilityCache.objects.filter(organizer=organizer)
+        if event_type_ids is not None:
+            cache_entries = cache_entries.filter(event_type_id__in=event_type_ids)
+        cache_entries.update(is_dirty=True)
+
+
+class RedisHashCacheBackend:
+    """
+    Store weekly slot chunks in one Redis hash per organizer and week.
+
+    Each event type is a field holding its generation and the compact
+    binary form of the chunk (``SlotSet.to_bytes``), so the weeks of a
+    request are read and written in one pipeline and a week of every event
+    type expires together. Without a Redis cache the backend stores nothing.
+    """
+
+    name = 'redis_hash'
+
+    def __init__(self, timeout=None, client=None):
+        self.timeout = timeout or settings.AVAILABILITY_CACHE_TIMEOUT
+        self.client = client if client is not None else get_redis_client()
+
+    def _hash_key(self, organizer_id, week_start):
+        return cache.make_key(f"availability_week:{organizer_id}:{week_start}")
+
+    def _read(self, organizer, event_type, week_starts):
+        if self.client is None or not week_starts:
+            return []
+
+        pipe = self.client.pipeline(transaction=False)
+        for week_start in week_starts:
+            pipe.hget(self._hash_key(organizer.id, week_start), str(event_type.id))
+        return zip(week_starts, pipe.execute())
+
+    def generation(self, organizer, event_type):
+        """Return the current cache generation of an event type."""
+        return get_availability_generations(organizer.id, [event_type.id])[event_type.id]
+
+    def get_chunks(self, organizer, event_type, week_starts, generation=None):
+        """Return the cached chunks of the given weeks as {week_start: SlotSet}."""
+        prefix = f"{generation or self.generation(organizer, event_type)}|".encode()
+        return {
+            week_start: SlotSet.from_bytes(value[len(prefix):])
+            for week_start, value in self._read(organizer, event_type, week_starts)
+            if value is not None and value.startswith(prefix)
+        }
+
+    def get_stale_chunks(self, organizer, event_type, week_starts):
+        """Return the last chunks cached for the given weeks, of any generation."""
+        return {
+            week_start: SlotSet.from_bytes(value.split(b'|', 1)[1])
+            for week_start, value in self._read(organizer, event_type, week_starts)
+            if value is not None
+        }
+
+    def set_chunks(self, organizer, event_type, chunks, timeout=None, generation=None):
+        """Cache chunks given as {week_start: SlotSet}."""
+        if self.client is None:
+            return
+
+        prefix = f"{generation or self.generation(organizer, event_type)}|".encode()
+        pipe = self.client.pipeline(transaction=False)
+        for week_start, chunk in chunks.items():
+            hash_key = self._hash_key(organizer.id, week_start)
+            pipe.hset(hash_key, str(event_type.id), prefix + chunk.to_bytes())
+            pipe.expire(hash_key, timeout or self.timeout)
+        pipe.execute()
+
+    def touch_chunks(self, organizer, event_type, week_starts, timeout=None):
+        """Extend the lifetime of cached chunks; False if any of them is missing."""
+        if len(self.get_chunks(organizer, event_type, week_starts)) < len(week_starts):
+            return False
+
+        pipe = self.client.pipeline(transaction=False)
+        for week_start in week_starts:
+            pipe.expire(self._hash_key(organizer.id, week_start), timeout or self.timeout)
+        pipe.execute()
+        return True
+
+    def invalidate(self, organizer, event_type_ids, week_starts):
+        """Drop the chunks of the given event types and weeks."""
+        if self.client is None:
+            return
+
+        fields = [str(event_type_id) for event_type_id in event_type_ids]
+        pipe = self.client.pipeline(transaction=False)
+        for week_start in week_starts:
+            pipe.hdel(self._hash_key(organizer.id, week_start), *fields)
+        pipe.execute()
+
+    def invalidate_all(self, organizer, event_type_ids=None):
+        """
+        Retire every chunk of an organizer, or of some event types, by bumping generations.
+
+        The counters are shared with ``DjangoCacheBackend``.
+        """
+        if event_type_ids is None:
+            bump_availability_generation(organizer.id)
+            return
+
+        for event_type_id in event_type_ids:
+            bump_availability_generation(organizer.id, event_type_id)
+
+
+CACHE_BACKENDS = {
+    DjangoCacheBackend.name: DjangoCacheBackend,
+    RedisHashCacheBackend.name: RedisHashCacheBackend,
+    DatabaseCacheBackend.name: DatabaseCacheBackend,
+}
+
+
+def get_cache_backend(name=None):
+    """
+    Build a chunk cache backend.
+
+    Args:
+        name: 'redis', 'redis_hash' or 'database' (default: AVAILABILITY_CACHE_BACKEND)
+
+    Returns:
+        Cache backend instance
+    """
+    return CACHE_BACKENDS[name or settings.AVAILABILITY_CACHE_BACKEND]()
+
+
+def reset_availability_cache():
+    """
+    Retire the cached chunks of every backend.
+
+    Invalidations only reach the configured backend, so chunks left in
+    another backend are stale once AVAILABILITY_CACHE_BACKEND changes.
+    This marks every database chunk dirty and bumps the generation of
+    every organizer, which retires the chunks of both Redis backends.
+
+    Returns:
+        dict: Database rows marked dirty and organizers whose generation was bumped
+    """
+    dirty_rows = EventTypeAvailabilityCache.objects.filter(is_dirty=False).update(is_dirty=True)
+
+    organizer_ids = EventType.objects.values_list('organizer_id', flat=True).distinct()
+    organizer_count = 0
+    for organizer_id in organizer_ids.iterator():
+        bump_availability_generation(organizer_id)
+        organizer_count += 1
+
+    return {'dirty_rows': dirty_rows, 'organizers': organizer_count}
+
+
+class AvailabilityEngine:
+    """
+    Compute available slots through pluggable loading, generation and caching.
+
+    Args:
+        loader: Object with ``load(query, profiler)`` returning AvailabilityData
+        cache_backend: Object with ``generation``, ``get_chunks``, ``get_stale_chunks``,
+            ``set_chunks``, ``touch_chunks``, ``invalidate`` and ``invalidate_all``
+        slot_engine: 'sweep' or 'loop' (default: AVAILABILITY_SLOT_ENGINE)
+    """
+
+    def __init__(self, loader=None, cache_backend=None, slot_engine=None):
+        self.loader = loader or DatabaseAvailabilityLoader()
+        self.cache_backend = cache_backend or DjangoCacheBackend()
+        self.slot_engine = slot_engine or settings.AVAILABILITY_SLOT_ENGINE
+
+    def get_available_slots(self, organizer, event_type, start_date, end_date, invitee_timezone='UTC',
+                            attendee_count=1, invitee_timezones=None, use_cache=True, refresh=False,
+                            cache_timeout=None):
+        """
+        Calculate available time slots, reading and filling the cache backend.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            start_date: datetime.date object
+            end_date: datetime.date object
+            invitee_timezone: IANA timezone string (primary invitee)
+            attendee_count: Number of attendees for this booking (default: 1)
+            invitee_timezones: List of IANA timezone strings for multi-invitee scheduling
+            use_cache: Whether to read and write the cache backend
+            refresh: Recompute and overwrite the cached chunks (cache warming)
+            cache_timeout: Cache lifetime in seconds (default: backend timeout)
+
+        Returns:
+            Dict with 'slots' (SlotSet), 'warnings', 'cache_hit', 'total_slots'
+            and 'performance_metrics'
+
+        Raises:
+            ValueError: If invitee_timezone is not a valid IANA timezone
+        """
+        with PerformanceProfiler(f"calculate_available_slots for {organizer.email}") as profiler:
+            warnings = []
+
+            # Validate timezone strings
+            if not validate_timezone(invitee_timezone):
+                raise ValueError(f"Invalid timezone: {invitee_timezone}")
+
+            if invitee_timezones:
+                valid_timezones = []
+                for tz in invitee_timezones:
+                    if validate_timezone(tz):
+                        valid_timezones.append(tz)
+                    else:
+                        warnings.append(f"Invalid timezone '{tz}' was skipped")
+                        logger.warning(f"Invalid timezone '{tz}' provided for multi-invitee scheduling")
+                invitee_timezones = valid_timezones
+
+            profiler.checkpoint('timezone_validation')
+
+            query = AvailabilityQuery(
+                organizer, event_type, start_date, end_date,
+                invitee_timezone, attendee_count, invitee_timezones
+            )
+
+            if use_cache:
+                week_starts = get_week_starts(start_date, end_date)
+                generation = self.cache_backend.generation(organizer, event_type)
+                chunks = {} if refresh else self.cache_backend.get_chunks(
+                    organizer, event_type, week_starts, generation
+                )
+                missing_weeks = [week_start for week_start in week_starts if week_start not in chunks]
+
+                profiler.checkpoint('cache_lookup')
+
+                if missing_weeks:
+                    chunks.update(self.fill_chunks(
+                        organizer, event_type, missing_weeks, generation, cache_timeout, profiler
+                    ))
+
+                cache_hit = not missing_weeks
+                available_slots = SlotSet.concatenate(
+                    (chunks[week_start] for week_start in week_starts),
+                    organizer.profile.timezone_name
+                )
+            else:
+                cache_hit = False
+                # The day before can reach past midnight into the first requested date
+                available_slots = self.compute_slots(
+                    organizer, event_type, start_date - timedelta(days=1), end_date, profiler
+                )
+
+            profiler.checkpoint('slot_generation')
+
+            available_slots = self.process_slots(query, available_slots)
+
+            profiler.checkpoint('multi_invitee_processing')
+
+        record_availability_request(organizer.id, cache_hit, profiler.metrics)
+
+        return {
+            'slots': available_slots,
+            'warnings': warnings,
+            'cache_hit': cache_hit,
+            'total_slots': len(available_slots),
+            'performance_metrics': profiler.metrics
+        }
+
+    def compute_slots(self, organizer, event_type, start_date, end_date, profiler=None):
+        """
+        Compute the raw UTC slots of a date range for a single attendee.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            start_date: datetime.date object
+            end_date: datetime.date object
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            SlotSet of unmerged, unlocalized slots with per-slot capacity
+        """
+        query = AvailabilityQuery(organizer, event_type, start_date, end_date)
+        data = self.loader.load(query, profiler)
+
+        if profiler:
+            profiler.checkpoint('busy_index')
+
+        return self.generate_slots(query, data)
+
+    def compute_chunks(self, organizer, event_type, week_starts, profiler=None):
+        """
+        Compute the chunks of the given weeks from one load of their data.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            week_starts: List of Mondays, in order
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            dict: {week_start: SlotSet}
+        """
+        started = time.perf_counter()
+        # Start a day early so the previous Sunday's rules can reach past midnight
+        slots = self.compute_slots(
+            organizer, event_type, week_starts[0] - timedelta(days=1), week_starts[-1] + timedelta(days=6), profiler
+        )
+        chunks = {
+            week_start: slots.restricted(week_start, week_start + timedelta(days=6))
+            for week_start in week_starts
+        }
+        record_recompute(time.perf_counter() - started, len(chunks))
+        return chunks
+
+    def compute_organizer_chunks(self, organizer, weeks_by_event_type, profiler=None):
+        """
+        Compute the chunks of several event types of one organizer from one load.
+
+        Args:
+            organizer: User instance (organizer)
+            weeks_by_event_type: {EventType: list of Mondays}
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            dict: {EventType: {week_start: SlotSet}}
+        """
+        started = time.perf_counter()
+        all_weeks = sorted({week_start for week_starts in weeks_by_event_type.values() for week_start in week_starts})
+        # Start a day early so the previous Sunday's rules can reach past midnight
+        data_by_event_type = self.loader.load_event_types(
+            organizer, list(weeks_by_event_type), all_weeks[0] - timedelta(days=1),
+            all_weeks[-1] + timedelta(days=6), profiler
+        )
+
+        chunks_by_event_type = {}
+        for event_type, week_starts in weeks_by_event_type.items():
+            week_starts = sorted(week_starts)
+            query = AvailabilityQuery(
+                organizer, event_type, week_starts[0] - timedelta(days=1), week_starts[-1] + timedelta(days=6)
+            )
+            slots = self.generate_slots(query, data_by_event_type[event_type.id])
+            chunks_by_event_type[event_type] = {
+                week_start: slots.restricted(week_start, week_start + timedelta(days=6))
+                for week_start in week_starts
+            }
+
+        record_recompute(
+            time.perf_counter() - started, sum(len(chunks) for chunks in chunks_by_event_type.values())
+        )
+        return chunks_by_event_type
+
+    def fill_chunks(self, organizer, event_type, week_starts, generation, cache_timeout=None, profiler=None):
+        """
+        Compute and cache missing chunks, once across concurrent requests.
+
+        The first request to miss the weeks takes a short cache lock and
+        computes them. Requests arriving meanwhile serve the stale chunks of
+        those weeks if there are any, otherwise wait up to
+        AVAILABILITY_LOCK_WAIT_SECONDS for the fresh ones before computing
+        on their own.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            week_starts: List of Mondays, in order
+            generation: Cache generation read before the lookup
+            cache_timeout: Cache lifetime in seconds (default: backend timeout)
+            profiler: Optional PerformanceProfiler for checkpoints
+
+        Returns:
+            dict: {week_start: SlotSet}
+        """
+        lock_key = get_chunk_lock_key(organizer.id, event_type.id, week_starts, generation)
+
+        if not cache.add(lock_key, True, timeout=settings.AVAILABILITY_LOCK_TIMEOUT):
+            stale_chunks = self.cache_backend.get_stale_chunks(organizer, event_type, week_starts)
+            if len(stale_chunks) == len(week_starts):
+                logger.info(f"Serving stale availability for {organizer.email} while it is recomputed")
+                record_stale_serve(organizer.id)
+                return stale_chunks
+
+            deadline = time.monotonic() + settings.AVAILABILITY_LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                chunks = self.cache_backend.get_chunks(organizer, event_type, week_starts, generation)
+                if len(chunks) == len(week_starts):
+                    return chunks
+
+            # The lock holder is slow or gone; compute without it
+            logger.warning(f"Timed out waiting for availability of {organizer.email}, computing")
+            chunks = self.compute_chunks(organizer, event_type, week_starts, profiler)
+            self.cache_backend.set_chunks(organizer, event_type, chunks, cache_timeout, generation)
+            return chunks
+
+        try:
+            chunks = self.compute_chunks(organizer, event_type, week_starts, profiler)
+            self.cache_backend.set_chunks(organizer, event_type, chunks, cache_timeout, generation)
+            return chunks
+        finally:
+            cache.delete(lock_key)
+
+    def warm(self, organizer, event_type, start_date, end_date, cache_timeout=None):
+        """
+        Recompute and cache the chunks covering a date range.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            start_date: datetime.date object
+            end_date: datetime.date object
+            cache_timeout: Cache lifetime in seconds (default: backend timeout)
+
+        Returns:
+            int: Number of chunks cached
+        """
+        return self.warm_weeks(organizer, event_type, get_week_starts(start_date, end_date), cache_timeout)
+
+    def warm_weeks(self, organizer, event_type, week_starts, cache_timeout=None):
+        """
+        Recompute and cache the chunks of the given weeks only.
+
+        Consecutive weeks share one load; other cached weeks are left as is.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            week_starts: Iterable of Mondays
+            cache_timeout: Cache lifetime in seconds (default: backend timeout)
+
+        Returns:
+            int: Number of chunks cached
+        """
+        runs = []
+        for week_start in sorted(set(week_starts)):
+            if runs and week_start == runs[-1][-1] + timedelta(days=7):
+                runs[-1].append(week_start)
+            else:
+                runs.append([week_start])
+
+        generation = self.cache_backend.generation(organizer, event_type)
+        chunks = {}
+        for run in runs:
+            chunks.update(self.compute_chunks(organizer, event_type, run))
+
+        if chunks:
+            self.cache_backend.set_chunks(organizer, event_type, chunks, cache_timeout, generation)
+        return len(chunks)
+
+    def extend(self, organizer, event_type, start_date, end_date, cache_timeout=None):
+        """
+        Extend the lifetime of the cached chunks covering a date range.
+
+        Args:
+            organizer: User instance (organizer)
+            event_type: EventType instance
+            start_date: datetime.date object
+            end_date: datetime.date object
+            cache_timeout: Cache lifetime in seconds (default: backend timeout)
+
+        Returns:
+            bool: False if any chunk was missing and needs computing
+        """
+        return self.cache_backend.touch_chunks(
+            organizer, event_type, get_week_starts(start_date, end_date), cache_timeout
+        )
+
+    def generate_slots(self, query, data):
+        """
+        Generate raw slots for every bookable date of a query.
+
+        Args:
+            query: AvailabilityQuery
+            data: AvailabilityData from the loader
+
+        Returns:
+            SlotSet of unmerged slots
+        """
+        event_type = query.event_type
+        busy_index = data.busy_index
+
+        # The sweep engine needs the busy intervals as forbidden slot-start ranges
+        forbidden_starts = None
+        if self.slot_engine == 'sweep':
+            forbidden_starts = busy_index.forbidden_start_ranges(
+                event_type,
+                timedelta(minutes=event_type.duration),
+                timedelta(minutes=event_type.buffer_time_before),
+                timedelta(minutes=event_type.buffer_time_after),
+                query.attendee_count
+            )
+
+        slot_kwargs = {
+            'event_type': event_type,
+            'organizer_timezone': data.organizer_timezone,
+            'invitee_timezone': query.invitee_timezone,
+            'blocked_times': busy_index.blocked,
+            'recurring_blocks': busy_index.recurring,
+            'existing_bookings': busy_index.bookings,
+            'external_busy_times': busy_index.external,
+            'buffer_settings': data.buffer_settings,
+            'attendee_count': query.attendee_count,
+            'forbidden_starts': forbidden_starts,
+            'daily_booking_counts': data.daily_booking_counts,
+        }
+
+        available_slots = SlotSet(data.organizer_timezone)
+        today = timezone.now().date()
+        current_date = query.start_date
+
+        while current_date <= query.end_date:
+            # Skip past dates and dates the event type can't be booked on
+            if current_date < today or not event_type.can_book_on_date(current_date):
+                current_date += timedelta(days=1)
+                continue
+
+            # Check for date-specific overrides first
+            date_override = data.overrides_by_date.get(current_date)
+
+            if date_override:
+                if date_override.is_available:
+                    # Use override times instead of regular rules
+                    day_slots = generate_slots_for_override(
+                        override=date_override, date=current_date, **slot_kwargs
+                    )
+                else:
+                    # Entire day is blocked
+                    day_slots = []
+            else:
+                day_slots = []
+                for rule in data.rules_by_weekday.get(current_date.weekday(), []):
+                    day_slots.extend(generate_slots_for_rule(rule=rule, date=current_date, **slot_kwargs))
+
+            for slot in day_slots:
+                available_slots.append(slot['start_time'], slot['end_time'], slot['available_spots'])
+
+            current_date += timedelta(days=1)
+
+        return available_slots
+
+    def process_slots(self, query, available_slots):
+        """
+        Select, merge, DST-filter, localize and (for several invitees) rank raw slots.
+
+        Args:
+            query: AvailabilityQuery
+            available_slots: Raw SlotSet from ``compute_slots`` or cached chunks
+
+        Returns:
+            SlotSet
+        """
+        event_type = query.event_type
+        now = timezone.now()
+
+        # Keep the requested dates and re-apply the booking window, since
+        # cached chunks were computed earlier
+        available_slots = available_slots.restricted(
+            query.start_date, query.end_date,
+            now + timedelta(minutes=event_type.min_scheduling_notice),
+            now + timedelta(minutes=event_type.max_scheduling_horizon)
+        )
+
+        # Chunks are computed for one attendee; apply the requested count
+        available_slots = available_slots.with_capacity(
+            query.attendee_count, event_type.max_attendees if event_type.is_group_event() else None
+        )
+
+        # Merge overlapping or adjacent slots (sorted by start time)
+        available_slots = available_slots.merged()
+
+        # Apply DST safety checks and localize for the invitee
+        available_slots = available_slots.localized(query.invitee_timezone)
+
+        # Handle multi-invitee timezone intersection if needed
+        if query.is_multi_invitee:
+            reasonable_start_hour, reasonable_end_hour = _get_reasonable_hours(query.organizer)
+            available_slots = available_slots.within_reasonable_hours(
+                query.invitee_timezones, reasonable_start_hour, reasonable_end_hour
+            )
+
+        return available_slots
+
+
+def get_public_cache_backend():
+    """
+    Get the cache backend for public booking pages.
+
+    Returns:
+        DjangoCacheBackend reading through this process's local cache, or
+        None (the configured backend) when the local cache is disabled or
+        the database backend is configured
+    """
+    if settings.AVAILABILITY_CACHE_BACKEND != DjangoCacheBackend.name or settings.AVAILABILITY_LOCAL_CACHE_SIZE <= 0:
+        return None
+    return DjangoCacheBackend(local_cache=get_local_cache())
+
+
+def get_availability_engine(cache_backend=None, slot_engine=None, **kwargs):
+    """
+    Build the availability engine configured in settings.
+
+    Args:
+        cache_backend: Backend instance or name ('redis', 'redis_hash' or 'database');
+            defaults to AVAILABILITY_CACHE_BACKEND
+        slot_engine: 'sweep' or 'loop' (default: AVAILABILITY_SLOT_ENGINE)
+        **kwargs: Passed to AvailabilityEngine (e.g. loader)
+
+    Returns:
+        AvailabilityEngine
+    """
+    if cache_backend is None or isinstance(cache_backend, str):
+        cache_backend = get_cache_backend(cache_backend)
+
+    return AvailabilityEngine(cache_backend=cache_backend, slot_engine=slot_engine, **kwargs)
+
+
+def invalidate_availability_chunks(organizer, start_date=None, end_date=None, event_type_ids=None):
+    """
+    Invalidate the cached chunks of the weeks covering a date range.
+
+    Without dates every chunk of the organizer (or of the given event types)
+    is invalidated through ``invalidate_availability_generation``.
+
+    Args:
+        organizer: User instance (organizer)
+        start_date: First affected date (default: today)
+        end_date: Last affected date (default: INVALIDATION_HORIZON_DAYS ahead)
+        event_type_ids: Affected event type IDs (default: all of the organizer's)
+
+    Returns:
+        int: Number of weeks invalidated per event type, or None for all weeks
+    """
+    if start_date is None and end_date is None:
+        invalidate_availability_generation(organizer, event_type_ids)
+        return None
+
+    today = timezone.now().date()
+    return invalidate_availability_ranges(
+        organizer,
+        [(start_date or today, end_date or today + timedelta(days=INVALIDATION_HORIZON_DAYS))],
+        event_type_ids
+    )
+
+
+def get_affected_week_starts(date_ranges):
+    """
+    Get the chunk weeks a set of changed date ranges touches.
+
+    Args:
+        date_ranges: List of (start_date, end_date) tuples
+
+    Returns:
+        Sorted list of Mondays
+    """
+    # Dates may come from UTC datetimes; widen by a day to cover the organizer's local dates
+    week_starts = set()
+    for start_date, end_date in date_ranges:
+        week_starts.update(get_week_starts(start_date - timedelta(days=1), end_date + timedelta(days=1)))
+    return sorted(week_starts)
+
+
+def invalidate_availability_ranges(organizer, date_ranges, event_type_ids=None):
+    """
+    Invalidate the cached chunks of the weeks covering several date ranges at once.
+
+    Only the configured cache backend is invalidated; ``reset_availability_cache``
+    retires the chunks of the others when AVAILABILITY_CACHE_BACKEND changes.
+
+    Args:
+        organizer: User instance (organizer)
+        date_ranges: List of (start_date, end_date) tuples
+        event_type_ids: Affected event type IDs (default: all of the organizer's)
+
+    Returns:
+        int: Number of weeks invalidated per event type
+    """
+    if event_type_ids is None:
+        event_type_ids = list(EventType.objects.filter(organizer=organizer).values_list('id', flat=True))
+
+    week_starts = get_affected_week_starts(date_ranges)
+
+    get_cache_backend().invalidate(organizer, event_type_ids, week_starts)
+
+    return len(week_starts)
+
+
+def invalidate_availability_generation(organizer, event_type_ids=None):
+    """
+    Invalidate every cached chunk of an organizer, or of some event types.
+
+    Used for changes that are not tied to dates. With the Redis cache this is
+    one INCR per generation counter instead of deleting guessed keys.
+
+    Args:
+        organizer: User instance (organizer)
+        event_type_ids: Affected event type IDs (default: all of the organizer's)
+    """
+    get_cache_backend().invalidate_all(organizer, event_type_ids)
@@ -0,0 +1,104 @@
+"""
+Per-process LRU cache in front of Redis for hot public booking pages.
+
+Entries live for a few seconds only. Chunk keys carry the cache generation,
+which is itself cached locally for an even shorter time, so a generation
+bump reaches every worker within AVAILABILITY_LOCAL_GENERATION_TIMEOUT and
+date-scoped deletions within AVAILABILITY_LOCAL_CACHE_TIMEOUT. Invalidation
+in the current process evicts local entries immediately.
+"""
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+
+
+class LocalLRUCache:
+    """
+    Thread-safe in-memory LRU cache with per-entry expiry.
+
+    Args:
+        max_entries: Entries kept before the least recently used are evicted
+        timeout: Default lifetime in seconds
+    """
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return a live entry, or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys):
+        """Return the live entries of the given keys as a dict."""
+        values = {}
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                values[key] = value
+        return values
+
+    def set(self, key, value, timeout=None):
+        """Store an entry, evicting the least recently used ones if full."""
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + (timeout if timeout is not None else self.timeout)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set_many(self, data, timeout=None):
+        """Store several entries."""
+        for key, value in data.items():
+            self.set(key, value, timeout)
+
+    def delete_many(self, keys):
+        """Evict entries."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Evict every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_MISSING = object()
+
+_local_cache = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache():
+    """Return this process's local cache, built from settings on first use."""
+    global _local_cache
+
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalLRUCache(
+                    settings.AVAILABILITY_LOCAL_CACHE_SIZE,
+                    settings.AVAILABILITY_LOCAL_CACHE_TIMEOUT
+                )
+    return _local_cache
@@ -0,0 +1,72 @@
+"""
+Management command to benchmark availability calculation on synthetic organizers.
+"""
+import json
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.availability.benchmarks import DEFAULT_COUNTS, build_synthetic_organizer, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Benchmark availability calculation on a synthetic organizer and emit JSON results'
+    
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(
+                f"--{name.replace('_', '-')}",
+                type=int,
+                default=default,
+                help=f'Number of synthetic {name.replace("_", " ")} (default: {default})',
+            )
+        parser.add_argument(
+            '--timezone',
+            type=str,
+            default='America/New_York',
+            help='Organizer timezone (default: America/New_York)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timed runs per benchmark and cache path (default: 5)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for the synthetic data (default: 0)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the JSON results to this file instead of stdout',
+        )
+        parser.add_argument(
+            '--keep-data',
+            action='store_true',
+            help='Keep the synthetic organizer instead of rolling it back',
+        )
+    
+    def handle(self, *args, **options):
+        counts = {name: options[name] for name in DEFAULT_COUNTS}
+        
+        # Synthetic data is rolled back unless explicitly kept
+        with transaction.atomic():
+            scenario = build_synthetic_organizer(
+                seed=options['seed'],
+                timezone_name=options['timezone'],
+                **counts
+            )
+            results = run_benchmarks(scenario, repeat=options['repeat'])
+            
+            if not options['keep_data']:
+                transaction.set_rollback(True)
+        
+        output = json.dumps(results, indent=2)
+        
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                output_file.write(output + '\n')
+            self.stdout.write(self.style.SUCCESS(f"✅ Benchmark results written to {options['output']}"))
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,17 @@
+"""
+Management command to retire cached availability chunks after switching cache backends.
+"""
+from django.core.management.base import BaseCommand
+from apps.availability.engine import reset_availability_cache
+
+
+class Command(BaseCommand):
+    help = 'Retire the cached availability chunks of every backend; run after changing AVAILABILITY_CACHE_BACKEND'
+    
+    def handle(self, *args, **options):
+        result = reset_availability_cache()
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Marked {result['dirty_rows']} database chunks dirty and bumped "
+            f"{result['organizers']} organizer generations"
+        ))
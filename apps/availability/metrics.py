@@ -0,0 +1,252 @@
+"""
+Availability cache and latency metrics.
+
+The engine records cache hits, misses and stale serves, recompute
+durations and the per-stage timings of ``PerformanceProfiler`` checkpoints.
+Counters are added to a time bucket of AVAILABILITY_METRICS_BUCKET_SECONDS,
+kept for AVAILABILITY_METRICS_RETENTION_SECONDS, and (except the
+per-organizer cache counters) to running totals.
+``get_metrics_summary`` sums the buckets of a recent window (for
+``availability_stats``); ``render_prometheus`` exposes the totals.
+
+With the Redis cache each bucket is one hash updated with HINCRBYFLOAT in a
+single pipeline; other cache backends use cached dicts instead.
+"""
+import logging
+import time
+from django.conf import settings
+from django.core.cache import cache
+from .dirty_index import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+TOTALS_KEY = 'availability_metrics:total'
+
+# Counters exported to Prometheus, with their help text
+COUNTERS = {
+    'requests': 'Availability requests served',
+    'request_seconds': 'Time spent serving availability requests',
+    'cache_hits': 'Availability requests served entirely from cached chunks',
+    'cache_misses': 'Availability requests that computed at least one chunk',
+    'stale_serves': 'Chunk sets served stale while another request recomputed them',
+    'recomputes': 'Chunk computations',
+    'recompute_seconds': 'Time spent computing chunks',
+    'recomputed_chunks': 'Weekly chunks computed',
+}
+
+
+def _bucket_key(bucket):
+    return f"availability_metrics:{bucket}"
+
+
+def _current_bucket():
+    bucket_seconds = settings.AVAILABILITY_METRICS_BUCKET_SECONDS
+    return int(time.time()) // bucket_seconds * bucket_seconds
+
+
+class RedisMetricsStore:
+    """Metrics stored as Redis hashes next to the Django cache keys."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def add(self, values):
+        """Add values to the current bucket and the totals."""
+        bucket_key = cache.make_key(_bucket_key(_current_bucket()))
+        totals_key = cache.make_key(TOTALS_KEY)
+
+        pipe = self.client.pipeline(transaction=False)
+        for field, value in values.items():
+            pipe.hincrbyfloat(bucket_key, field, value)
+            if not field.startswith('organizer:'):
+                pipe.hincrbyfloat(totals_key, field, value)
+        pipe.expire(bucket_key, settings.AVAILABILITY_METRICS_RETENTION_SECONDS)
+        pipe.execute()
+
+    def buckets(self, buckets):
+        """Return the values of several buckets as a list of dicts."""
+        pipe = self.client.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.hgetall(cache.make_key(_bucket_key(bucket)))
+        return [_decode(values) for values in pipe.execute()]
+
+    def totals(self):
+        """Return the running totals."""
+        return _decode(self.client.hgetall(cache.make_key(TOTALS_KEY)))
+
+
+class CacheMetricsStore:
+    """Metrics stored as plain cache values, for non-Redis cache backends."""
+
+    def add(self, values):
+        """Add values to the current bucket and the totals."""
+        bucket_key = _bucket_key(_current_bucket())
+        for key, timeout in ((bucket_key, settings.AVAILABILITY_METRICS_RETENTION_SECONDS), (TOTALS_KEY, None)):
+            stored = cache.get(key, {})
+            for field, value in values.items():
+                if key == TOTALS_KEY and field.startswith('organizer:'):
+                    continue
+                stored[field] = stored.get(field, 0) + value
+            cache.set(key, stored, timeout=timeout)
+
+    def buckets(self, buckets):
+        """Return the values of several buckets as a list of dicts."""
+        stored = cache.get_many([_bucket_key(bucket) for bucket in buckets])
+        return [stored.get(_bucket_key(bucket), {}) for bucket in buckets]
+
+    def totals(self):
+        """Return the running totals."""
+        return cache.get(TOTALS_KEY, {})
+
+
+def _decode(values):
+    return {
+        (field.decode() if isinstance(field, bytes) else field): float(value)
+        for field, value in values.items()
+    }
+
+
+def get_metrics_store():
+    """Return the metrics store for the configured cache backend."""
+    client = get_redis_client()
+    if client is not None:
+        return RedisMetricsStore(client)
+    return CacheMetricsStore()
+
+
+def get_stage_durations(profiler_metrics):
+    """
+    Turn cumulative ``PerformanceProfiler`` checkpoints into per-stage durations.
+
+    Args:
+        profiler_metrics: ``profiler.metrics`` ({checkpoint: seconds since start})
+
+    Returns:
+        dict: {stage: seconds spent since the previous checkpoint}
+    """
+    durations = {}
+    previous = 0.0
+    for name, elapsed in profiler_metrics.items():
+        if name == 'duration':
+            continue
+        durations[name] = max(elapsed - previous, 0.0)
+        previous = elapsed
+    return durations
+
+
+def record_metrics(values):
+    """Add counter values; metrics never fail the request that records them."""
+    if not settings.AVAILABILITY_METRICS_ENABLED:
+        return
+    try:
+        get_metrics_store().add(values)
+    except Exception as e:
+        logger.warning(f"Could not record availability metrics: {str(e)}")
+
+
+def record_availability_request(organizer_id, cache_hit, profiler_metrics):
+    """
+    Record one availability request.
+
+    Args:
+        organizer_id: UUID of the organizer
+        cache_hit: Whether every chunk came from the cache
+        profiler_metrics: ``profiler.metrics`` of the request
+    """
+    outcome = 'cache_hits' if cache_hit else 'cache_misses'
+    values = {
+        'requests': 1,
+        'request_seconds': profiler_metrics.get('duration', 0.0),
+        outcome: 1,
+        f"organizer:{organizer_id}:{outcome}": 1,
+    }
+    for stage, seconds in get_stage_durations(profiler_metrics).items():
+        values[f"stage:{stage}:seconds"] = seconds
+        values[f"stage:{stage}:count"] = 1
+    record_metrics(values)
+
+
+def record_recompute(seconds, chunk_count):
+    """Record a chunk computation and its duration."""
+    record_metrics({'recomputes': 1, 'recompute_seconds': seconds, 'recomputed_chunks': chunk_count})
+
+
+def record_stale_serve(organizer_id):
+    """Record chunks served stale while another request recomputed them."""
+    record_metrics({'stale_serves': 1, f"organizer:{organizer_id}:stale_serves": 1})
+
+
+def get_metrics_summary(window_seconds=3600, organizer_id=None):
+    """
+    Sum the metrics of a recent window.
+
+    Args:
+        window_seconds: Window length in seconds
+        organizer_id: Limit cache counters to one organizer (latency stays global)
+
+    Returns:
+        dict: Counters, cache hit rate and average latencies per stage
+    """
+    bucket_seconds = settings.AVAILABILITY_METRICS_BUCKET_SECONDS
+    current = _current_bucket()
+    buckets = range(current - window_seconds + bucket_seconds, current + 1, bucket_seconds)
+
+    totals = {}
+    for values in get_metrics_store().buckets(list(buckets)):
+        for field, value in values.items():
+            totals[field] = totals.get(field, 0) + value
+
+    prefix = f"organizer:{organizer_id}:" if organizer_id else ''
+    hits = totals.get(f"{prefix}cache_hits", 0)
+    misses = totals.get(f"{prefix}cache_misses", 0)
+    requests = totals.get('requests', 0)
+    recomputes = totals.get('recomputes', 0)
+
+    stages = {}
+    for field, value in totals.items():
+        if field.startswith('stage:') and field.endswith(':seconds'):
+            stage = field[len('stage:'):-len(':seconds')]
+            count = totals.get(f"stage:{stage}:count", 0)
+            stages[stage] = round(value / count * 1000, 2) if count else 0.0
+
+    return {
+        'window_seconds': window_seconds,
+        'cache_hits': int(hits),
+        'cache_misses': int(misses),
+        'stale_serves': int(totals.get(f"{prefix}stale_serves", 0)),
+        'cache_hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        'requests': int(requests),
+        'average_request_ms': round(totals.get('request_seconds', 0) / requests * 1000, 2) if requests else 0.0,
+        'recomputes': int(recomputes),
+        'average_recompute_ms': (
+            round(totals.get('recompute_seconds', 0) / recomputes * 1000, 2) if recomputes else 0.0
+        ),
+        'average_stage_ms': stages,
+    }
+
+
+def render_prometheus():
+    """
+    Render the running totals in the Prometheus text exposition format.
+
+    Returns:
+        str
+    """
+    totals = get_metrics_store().totals()
+    lines = []
+
+    for name, help_text in COUNTERS.items():
+        metric = f"availability_{name}_total"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {totals.get(name, 0)}")
+
+    stages = sorted({field.split(':')[1] for field in totals if field.startswith('stage:')})
+    for suffix, help_text in (('seconds', 'Time spent per availability stage'), ('count', 'Availability stage runs')):
+        metric = f"availability_stage_{suffix}_total"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for stage in stages:
+            lines.append(f'{metric}{{stage="{stage}"}} {totals.get(f"stage:{stage}:{suffix}", 0)}')
+
+    return '\n'.join(lines) + '\n'
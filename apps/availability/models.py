@@ -54,10 +54,16 @@ class AvailabilityRule(models.Model):
         return self.end_time < self.start_time
     
     def applies_to_event_type(self, event_type):
-        """Check if this rule applies to the given event type."""
-        if not self.event_types.exists():
+        """
+        Check if this rule applies to the given event type.
+        
+        Uses prefetched event_types when available, so callers that load rules
+        with prefetch_related('event_types') pay no query per rule.
+        """
+        event_type_ids = [rule_event_type.id for rule_event_type in self.event_types.all()]
+        if not event_type_ids:
             return True  # Applies to all event types
-        return self.event_types.filter(id=event_type.id).exists()
+        return event_type.id in event_type_ids
 
 
 class DateOverrideRule(models.Model):
@@ -119,10 +125,11 @@ class DateOverrideRule(models.Model):
         return self.end_time < self.start_time
     
     def applies_to_event_type(self, event_type):
-        """Check if this override applies to the given event type."""
-        if not self.event_types.exists():
+        """Check if this override applies to the given event type (prefetch-aware)."""
+        event_type_ids = [override_event_type.id for override_event_type in self.event_types.all()]
+        if not event_type_ids:
             return True  # Applies to all event types
-        return self.event_types.filter(id=event_type.id).exists()
+        return event_type.id in event_type_ids
 
 
 class RecurringBlockedTime(models.Model):
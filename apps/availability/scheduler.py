@@ -0,0 +1,151 @@
+"""
+Scheduling of the periodic availability cache refresh.
+
+``refresh_availability_cache_for_all_organizers`` orders organizers by
+refresh priority (recent public booking page traffic and upcoming booking
+density), splits them into shards and spreads the shards over the refresh
+interval. A shard skips organizers whose availability inputs hash the same
+as at their last precompute, extending their cached chunks instead.
+"""
+import hashlib
+import logging
+from datetime import timedelta
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Hours of public page traffic counted towards priority
+TRAFFIC_WINDOW_HOURS = 2
+
+# Days of upcoming bookings counted towards priority
+BOOKING_DENSITY_DAYS = 7
+
+# One upcoming booking weighs as much as this many page views
+BOOKING_DENSITY_WEIGHT = 5
+
+
+def _page_views_key(organizer_id, hour):
+    return f"public_page_views:{organizer_id}:{hour:%Y%m%d%H}"
+
+
+def _input_hash_key(organizer_id):
+    return f"availability_input_hash:{organizer_id}"
+
+
+def record_public_page_view(organizer_id):
+    """
+    Count a public booking page view of an organizer in the current hour.
+
+    Args:
+        organizer_id: UUID of the organizer
+    """
+    key = _page_views_key(organizer_id, timezone.now())
+    try:
+        cache.incr(key)
+    except ValueError:
+        # First view this hour
+        if not cache.add(key, 1, timeout=(TRAFFIC_WINDOW_HOURS + 1) * 3600):
+            cache.incr(key)
+
+
+def get_refresh_priorities(organizer_ids):
+    """
+    Score organizers by recent page traffic and upcoming booking density.
+
+    Args:
+        organizer_ids: List of organizer UUIDs
+
+    Returns:
+        dict: {organizer_id: score}, higher refreshes first
+    """
+    from apps.events.models import Booking
+
+    now = timezone.now()
+    hours = [now - timedelta(hours=offset) for offset in range(TRAFFIC_WINDOW_HOURS)]
+    keys = {
+        _page_views_key(organizer_id, hour): organizer_id
+        for organizer_id in organizer_ids
+        for hour in hours
+    }
+
+    priorities = dict.fromkeys(organizer_ids, 0)
+    for key, views in cache.get_many(list(keys)).items():
+        priorities[keys[key]] += views
+
+    upcoming_bookings = Booking.objects.filter(
+        organizer_id__in=organizer_ids,
+        status='confirmed',
+        start_time__gte=now,
+        start_time__lt=now + timedelta(days=BOOKING_DENSITY_DAYS)
+    ).values('organizer_id').annotate(count=Count('id'))
+
+    for row in upcoming_bookings:
+        priorities[row['organizer_id']] += row['count'] * BOOKING_DENSITY_WEIGHT
+
+    return priorities
+
+
+def get_refresh_shards(organizer_ids, shard_size):
+    """
+    Split organizers into shards, highest priority first.
+
+    Args:
+        organizer_ids: List of organizer UUIDs
+        shard_size: Organizers per shard
+
+    Returns:
+        List of lists of organizer UUIDs
+    """
+    priorities = get_refresh_priorities(organizer_ids)
+    ordered = sorted(organizer_ids, key=lambda organizer_id: priorities[organizer_id], reverse=True)
+    return [ordered[index:index + shard_size] for index in range(0, len(ordered), shard_size)]
+
+
+def get_availability_input_hash(organizer):
+    """
+    Hash everything an organizer's cached availability is computed from.
+
+    Each input table contributes its row count and latest ``updated_at``, so
+    creates, edits and deletes all change the hash. The current date is
+    included since the precompute window moves daily.
+
+    Args:
+        organizer: User instance (organizer)
+
+    Returns:
+        str: Hex digest
+    """
+    from apps.events.models import Attendee, Booking, EventType
+    from .models import AvailabilityRule, BlockedTime, BufferTime, DateOverrideRule, RecurringBlockedTime
+
+    now = timezone.now()
+    profile = getattr(organizer, 'profile', None)
+    parts = [now.date().isoformat(), getattr(profile, 'timezone_name', '')]
+
+    querysets = [
+        AvailabilityRule.objects.filter(organizer=organizer),
+        DateOverrideRule.objects.filter(organizer=organizer),
+        RecurringBlockedTime.objects.filter(organizer=organizer),
+        BlockedTime.objects.filter(organizer=organizer, end_datetime__gte=now),
+        BufferTime.objects.filter(organizer=organizer),
+        EventType.objects.filter(organizer=organizer),
+        Booking.objects.filter(organizer=organizer, end_time__gte=now),
+        Attendee.objects.filter(booking__organizer=organizer, booking__end_time__gte=now),
+    ]
+    for queryset in querysets:
+        summary = queryset.aggregate(count=Count('pk'), last_updated=Max('updated_at'))
+        parts.append(f"{summary['count']}:{summary['last_updated']}")
+
+    return hashlib.sha256('|'.join(parts).encode()).hexdigest()
+
+
+def get_stored_input_hash(organizer_id):
+    """Return the input hash recorded at the organizer's last precompute."""
+    return cache.get(_input_hash_key(organizer_id))
+
+
+def store_input_hash(organizer_id, input_hash):
+    """Record the input hash of a completed precompute."""
+    cache.set(_input_hash_key(organizer_id), input_hash, timeout=None)
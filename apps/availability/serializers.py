@@ -130,6 +130,7 @@ class AvailableSlotSerializer(serializers.Serializer):
     start_time = serializers.DateTimeField()
     end_time = serializers.DateTimeField()
     duration_minutes = serializers.IntegerField()
+    available_spots = serializers.IntegerField(required=False)
     
     # Optional localized times for display
     local_start_time = serializers.DateTimeField(required=False)
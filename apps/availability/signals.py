@@ -1,3 +1,5 @@
+import threading
+from contextlib import contextmanager
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -7,15 +9,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_suppression = threading.local()
+
+
+@contextmanager
+def suppress_cache_invalidation():
+    """
+    Skip the per-row cache invalidation of availability model signals.
+    
+    For bulk writes (e.g. calendar reconciliation) that invalidate the
+    affected dates once for the whole batch instead.
+    """
+    previous = getattr(_suppression, 'active', False)
+    _suppression.active = True
+    try:
+        yield
+    finally:
+        _suppression.active = previous
+
+
+def _invalidation_suppressed():
+    return getattr(_suppression, 'active', False)
+
 
 @receiver(post_save, sender=AvailabilityRule)
 @receiver(post_delete, sender=AvailabilityRule)
 def invalidate_cache_on_availability_rule_change(sender, instance, **kwargs):
     """Invalidate cache when availability rules change."""
-    from .tasks import clear_availability_cache
+    if _invalidation_suppressed():
+        return
     
-    logger.info(f"Availability rule changed for {instance.organizer.email}, clearing cache")
-    clear_availability_cache.delay(
+    from .tasks import queue_cache_invalidation
+    
+    logger.info(f"Availability rule changed for {instance.organizer.email}, queueing cache invalidation")
+    queue_cache_invalidation(
         instance.organizer.id, 
         cache_type='availability_rule_change',
         day_of_week=instance.day_of_week
@@ -26,10 +53,13 @@ def invalidate_cache_on_availability_rule_change(sender, instance, **kwargs):
 @receiver(post_delete, sender=DateOverrideRule)
 def invalidate_cache_on_date_override_change(sender, instance, **kwargs):
     """Invalidate cache when date override rules change."""
-    from .tasks import clear_availability_cache
+    if _invalidation_suppressed():
+        return
+    
+    from .tasks import queue_cache_invalidation
     
-    logger.info(f"Date override changed for {instance.organizer.email} on {instance.date}, clearing cache")
-    clear_availability_cache.delay(
+    logger.info(f"Date override changed for {instance.organizer.email} on {instance.date}, queueing cache invalidation")
+    queue_cache_invalidation(
         instance.organizer.id,
         cache_type='date_override_change',
         affected_date=instance.date.isoformat()
@@ -40,10 +70,13 @@ def invalidate_cache_on_date_override_change(sender, instance, **kwargs):
 @receiver(post_delete, sender=RecurringBlockedTime)
 def invalidate_cache_on_recurring_block_change(sender, instance, **kwargs):
     """Invalidate cache when recurring blocked times change."""
-    from .tasks import clear_availability_cache
+    if _invalidation_suppressed():
+        return
+    
+    from .tasks import queue_cache_invalidation
     
-    logger.info(f"Recurring block changed for {instance.organizer.email}, clearing cache")
-    clear_availability_cache.delay(
+    logger.info(f"Recurring block changed for {instance.organizer.email}, queueing cache invalidation")
+    queue_cache_invalidation(
         instance.organizer.id,
         cache_type='recurring_block_change',
         day_of_week=instance.day_of_week,
@@ -56,10 +89,13 @@ def invalidate_cache_on_recurring_block_change(sender, instance, **kwargs):
 @receiver(post_delete, sender=BlockedTime)
 def invalidate_cache_on_blocked_time_change(sender, instance, **kwargs):
     """Invalidate cache when blocked times change."""
-    from .tasks import clear_availability_cache
+    if _invalidation_suppressed():
+        return
     
-    logger.info(f"Blocked time changed for {instance.organizer.email}, clearing cache")
-    clear_availability_cache.delay(
+    from .tasks import queue_cache_invalidation
+    
+    logger.info(f"Blocked time changed for {instance.organizer.email}, queueing cache invalidation")
+    queue_cache_invalidation(
         instance.organizer.id,
         cache_type='blocked_time_change',
         start_date=instance.start_datetime.date().isoformat(),
@@ -70,10 +106,13 @@ def invalidate_cache_on_blocked_time_change(sender, instance, **kwargs):
 @receiver(post_save, sender=BufferTime)
 def invalidate_cache_on_buffer_time_change(sender, instance, **kwargs):
     """Invalidate cache when buffer time settings change."""
-    from .tasks import clear_availability_cache
+    if _invalidation_suppressed():
+        return
+    
+    from .tasks import queue_cache_invalidation
     
-    logger.info(f"Buffer time settings changed for {instance.organizer.email}, clearing cache")
-    clear_availability_cache.delay(
+    logger.info(f"Buffer time settings changed for {instance.organizer.email}, queueing cache invalidation")
+    queue_cache_invalidation(
         instance.organizer.id,
         cache_type='buffer_time_change'
     )
@@ -0,0 +1,458 @@
+"""
+Compact slot storage for the availability pipeline.
+
+Generated slots are kept as parallel integer arrays (UTC epoch seconds of
+the start, length in seconds and available spots per slot) instead of one dict of aware
+datetimes per slot. The post-processing stages (merging, DST filtering and
+multi-invitee filtering) are linear scans over those arrays, and the set
+pickles to a few bytes per slot when cached. Slot dicts are only built when
+the set is iterated, i.e. at the serializer boundary.
+"""
+from array import array
+import logging
+import struct
+import sys
+from .timezones import (
+    EPOCH, SECONDS_PER_DAY, from_epoch_seconds, get_transition_table, get_zone, to_epoch_seconds
+)
+
+logger = logging.getLogger(__name__)
+
+# Adjacent slots separated by at most this many seconds are merged
+MERGE_GAP_SECONDS = 5 * 60
+
+
+def fairness_score_for_hour(local_hour):
+    """Score how reasonable a local start hour is (peak = 10 AM - 4 PM)."""
+    if 10 <= local_hour <= 16:
+        return 100  # Perfect time
+    elif 8 <= local_hour <= 18:
+        return 80   # Good time
+    elif 7 <= local_hour <= 20:
+        return 60   # Acceptable time
+    elif 6 <= local_hour <= 22:
+        return 40   # Early/late but manageable
+    return 0        # Too early/late
+
+
+class SlotSet:
+    """
+    Available slots backed by parallel arrays.
+
+    Behaves as a read-only sequence of slot dicts with the same keys the
+    list-based pipeline produces (``start_time``, ``end_time``,
+    ``duration_minutes``, ``available_spots`` and, once localized,
+    ``local_start_time``, ``local_end_time`` and ``dst_info``; multi-invitee
+    sets add ``invitee_times`` and ``fairness_score``).
+    """
+
+    __slots__ = (
+        'starts', 'lengths', 'spots', 'organizer_timezone', 'invitee_timezone',
+        'invitee_timezones', 'fairness',
+    )
+
+    def __init__(self, organizer_timezone='UTC', invitee_timezone=None):
+        self.starts = array('q')
+        self.lengths = array('i')
+        self.spots = array('i')
+        self.organizer_timezone = organizer_timezone
+        # Set once the slots carry localized display times
+        self.invitee_timezone = invitee_timezone
+        self.invitee_timezones = None
+        self.fairness = None
+
+    @classmethod
+    def from_slots(cls, slots, organizer_timezone='UTC'):
+        """
+        Build an unlocalized set from slot dicts.
+
+        Args:
+            slots: Iterable of dicts with 'start_time', 'end_time' and
+                optionally 'available_spots'
+            organizer_timezone: Organizer's IANA timezone
+
+        Returns:
+            SlotSet
+        """
+        slot_set = cls(organizer_timezone)
+        for slot in slots:
+            slot_set.append(slot['start_time'], slot['end_time'], slot.get('available_spots', 1))
+        return slot_set
+
+    def to_payload(self):
+        """Return a JSON-serializable representation of the set."""
+        return {
+            'starts': list(self.starts),
+            'lengths': list(self.lengths),
+            'spots': list(self.spots),
+            'organizer_timezone': self.organizer_timezone,
+            'invitee_timezone': self.invitee_timezone,
+            'invitee_timezones': list(self.invitee_timezones) if self.invitee_timezones is not None else None,
+            'fairness': list(self.fairness) if self.fairness is not None else None,
+        }
+
+    @classmethod
+    def from_payload(cls, payload):
+        """Rebuild a set from ``to_payload`` output."""
+        slot_set = cls(payload['organizer_timezone'], payload.get('invitee_timezone'))
+        slot_set.starts = array('q', payload['starts'])
+        slot_set.lengths = array('i', payload['lengths'])
+        slot_set.spots = array('i', payload['spots'])
+        if payload.get('invitee_timezones') is not None:
+            slot_set.invitee_timezones = tuple(payload['invitee_timezones'])
+            slot_set.fairness = array('d', payload['fairness'])
+        return slot_set
+
+    def to_bytes(self):
+        """
+        Return a compact binary form of an unlocalized set.
+
+        Layout: the organizer and invitee timezone names (length-prefixed
+        UTF-8), the slot count, then the starts, lengths and spots arrays,
+        all little-endian.
+        """
+        if self.invitee_timezones is not None:
+            raise ValueError("Multi-invitee slot sets have no binary form")
+
+        parts = []
+        for name in (self.organizer_timezone, self.invitee_timezone or ''):
+            encoded = name.encode()
+            parts.append(struct.pack('<H', len(encoded)))
+            parts.append(encoded)
+        parts.append(struct.pack('<I', len(self.starts)))
+
+        for values in (self.starts, self.lengths, self.spots):
+            if sys.byteorder == 'big':
+                values = array(values.typecode, values)
+                values.byteswap()
+            parts.append(values.tobytes())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a set from ``to_bytes`` output."""
+        names = []
+        offset = 0
+        for _ in range(2):
+            (length,) = struct.unpack_from('<H', data, offset)
+            offset += 2
+            names.append(data[offset:offset + length].decode())
+            offset += length
+        (count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+
+        slot_set = cls(names[0], names[1] or None)
+        for attribute in ('starts', 'lengths', 'spots'):
+            values = getattr(slot_set, attribute)
+            size = values.itemsize * count
+            values.frombytes(data[offset:offset + size])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            offset += size
+        return slot_set
+
+    @classmethod
+    def concatenate(cls, slot_sets, organizer_timezone='UTC'):
+        """
+        Join unlocalized sets (e.g. cached weekly chunks) into one set.
+
+        Args:
+            slot_sets: Iterable of SlotSet, in time order
+            organizer_timezone: Organizer's IANA timezone
+
+        Returns:
+            SlotSet
+        """
+        joined = cls(organizer_timezone)
+        for slot_set in slot_sets:
+            joined.starts.extend(slot_set.starts)
+            joined.lengths.extend(slot_set.lengths)
+            joined.spots.extend(slot_set.spots)
+        return joined
+
+    def _empty_like(self):
+        """Return an empty set with the same display context."""
+        slot_set = SlotSet(self.organizer_timezone, self.invitee_timezone)
+        slot_set.invitee_timezones = self.invitee_timezones
+        return slot_set
+
+    def _take(self, indexes):
+        """Return a new set holding the slots at the given indexes, in order."""
+        slot_set = self._empty_like()
+        slot_set.starts = array('q', (self.starts[i] for i in indexes))
+        slot_set.lengths = array('i', (self.lengths[i] for i in indexes))
+        slot_set.spots = array('i', (self.spots[i] for i in indexes))
+        if self.fairness is not None:
+            slot_set.fairness = array('d', (self.fairness[i] for i in indexes))
+        return slot_set
+
+    def _window(self):
+        """Return the (first start, last end) UTC epoch seconds covered by the set."""
+        return min(self.starts), max(start + length for start, length in zip(self.starts, self.lengths))
+
+    def append(self, start_time, end_time, available_spots=1):
+        """Append a slot given as aware datetimes."""
+        start = to_epoch_seconds(start_time)
+        self.starts.append(start)
+        self.lengths.append(to_epoch_seconds(end_time) - start)
+        self.spots.append(available_spots)
+
+    def sorted(self):
+        """Return the slots ordered by start time (stable)."""
+        starts = self.starts
+        if all(starts[i] <= starts[i + 1] for i in range(len(starts) - 1)):
+            return self
+        return self._take(sorted(range(len(starts)), key=starts.__getitem__))
+
+    def merged(self, max_gap_seconds=MERGE_GAP_SECONDS):
+        """
+        Merge overlapping or adjacent slots into continuous blocks.
+
+        Same rules as ``merge_overlapping_slots``: slots are merged when the
+        next one starts at most ``max_gap_seconds`` after the current block
+        ends, and a merged block keeps the minimum available spots.
+        """
+        source = self.sorted()
+        merged = source._empty_like()
+        if not len(source):
+            return merged
+
+        starts, lengths, spots = source.starts, source.lengths, source.spots
+        current_start, current_end, current_spots = starts[0], starts[0] + lengths[0], spots[0]
+
+        for i in range(1, len(starts)):
+            if current_end + max_gap_seconds >= starts[i]:
+                current_end = max(current_end, starts[i] + lengths[i])
+                current_spots = min(current_spots, spots[i])
+            else:
+                merged.starts.append(current_start)
+                merged.lengths.append(current_end - current_start)
+                merged.spots.append(current_spots)
+                current_start, current_end, current_spots = starts[i], starts[i] + lengths[i], spots[i]
+
+        merged.starts.append(current_start)
+        merged.lengths.append(current_end - current_start)
+        merged.spots.append(current_spots)
+        return merged
+
+    def restricted(self, start_date, end_date, earliest_start=None, latest_start=None):
+        """
+        Keep slots on the given organizer-local dates that start within a window.
+
+        Args:
+            start_date: First organizer-local date to keep
+            end_date: Last organizer-local date to keep
+            earliest_start: Optional aware datetime; earlier starts are dropped
+                (minimum scheduling notice)
+            latest_start: Optional aware datetime; later starts are dropped
+                (scheduling horizon)
+
+        Returns:
+            SlotSet
+        """
+        if not self.starts:
+            return self._take([])
+
+        window = self._window()
+        org_table = get_transition_table(self.organizer_timezone, *window)
+        first_day = (start_date - EPOCH.date()).days
+        last_day = (end_date - EPOCH.date()).days
+        earliest = to_epoch_seconds(earliest_start) if earliest_start else window[0]
+        latest = to_epoch_seconds(latest_start) if latest_start else window[1]
+
+        return self._take([
+            i for i, slot_start in enumerate(self.starts)
+            if earliest <= slot_start <= latest and first_day <= org_table.local_day(slot_start) <= last_day
+        ])
+
+    def with_capacity(self, attendee_count, max_attendees=None):
+        """
+        Apply a requested attendee count to slots computed for one attendee.
+
+        Group slots with an existing booking are kept while its remaining
+        capacity covers the attendees; unbooked group slots are always kept.
+        One-on-one slots have no spot for more than one attendee.
+
+        Args:
+            attendee_count: Number of attendees requested
+            max_attendees: Capacity of a group event type, or None for
+                one-on-one events
+
+        Returns:
+            SlotSet
+        """
+        if attendee_count <= 1:
+            return self
+
+        if max_attendees is not None:
+            return self._take([
+                i for i, spots in enumerate(self.spots)
+                if spots >= attendee_count or spots == max_attendees
+            ])
+
+        slot_set = self._take(range(len(self.starts)))
+        slot_set.spots = array('i', [0]) * len(slot_set.starts)
+        return slot_set
+
+    def localized(self, invitee_timezone):
+        """
+        Drop slots that cross a DST transition in the organizer's timezone
+        and attach localized display times for the invitee.
+
+        Args:
+            invitee_timezone: Invitee's IANA timezone
+
+        Returns:
+            SlotSet
+        """
+        get_zone(self.organizer_timezone)
+        get_zone(invitee_timezone)  # Fail early on an invalid timezone
+        kept = []
+
+        if self.starts:
+            org_table = get_transition_table(self.organizer_timezone, *self._window())
+
+            for i in range(len(self.starts)):
+                slot_start = self.starts[i]
+                slot_end = slot_start + self.lengths[i]
+
+                if org_table.is_dst(slot_start) != org_table.is_dst(slot_end):
+                    # Skip slots that cross DST boundaries to avoid confusion
+                    logger.warning(
+                        f"DST transition during slot {from_epoch_seconds(slot_start)} - "
+                        f"{from_epoch_seconds(slot_end)}"
+                    )
+                    continue
+
+                kept.append(i)
+
+        slot_set = self._take(kept)
+        slot_set.invitee_timezone = invitee_timezone
+        return slot_set
+
+    def within_reasonable_hours(self, invitee_timezones, reasonable_start_hour=7, reasonable_end_hour=22):
+        """
+        Keep slots that fall within reasonable hours for every invitee,
+        ordered by fairness score (higher is better).
+
+        Args:
+            invitee_timezones: List of IANA timezone strings for all invitees
+            reasonable_start_hour: Earliest acceptable local start hour
+            reasonable_end_hour: Latest acceptable local end hour
+
+        Returns:
+            SlotSet
+        """
+        # Repeated timezones count once, as in the per-timezone dict of the list pipeline
+        tz_names = tuple(dict.fromkeys(invitee_timezones))
+        try:
+            window = self._window() if self.starts else (0, 0)
+            tables = [get_transition_table(tz_name, *window) for tz_name in tz_names]
+        except Exception as e:
+            logger.warning(f"Invalid timezone in {invitee_timezones}: {e}")
+            return self._take([])
+
+        kept = []
+        scores = {}
+
+        for i in range(len(self.starts)):
+            slot_start = self.starts[i]
+            slot_end = slot_start + self.lengths[i]
+            total_score = 0
+
+            for table in tables:
+                # Local wall-clock seconds: one bisect per instant instead of astimezone()
+                local_start = table.local_seconds(slot_start)
+                local_end = table.local_seconds(slot_end)
+                start_hour = local_start // 3600 % 24
+
+                if (start_hour < reasonable_start_hour or
+                    local_end // 3600 % 24 > reasonable_end_hour or
+                    local_start // SECONDS_PER_DAY != local_end // SECONDS_PER_DAY):  # Avoid cross-date slots
+                    break
+
+                total_score += fairness_score_for_hour(start_hour)
+            else:
+                kept.append(i)
+                scores[i] = total_score / len(tables) if tables else 0
+
+        # sorted() is stable, so equally fair slots stay in time order
+        kept.sort(key=lambda i: -scores[i])
+
+        slot_set = self._take(kept)
+        slot_set.invitee_timezones = tz_names
+        slot_set.fairness = array('d', (scores[i] for i in kept))
+        return slot_set
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __bool__(self):
+        return len(self.starts) > 0
+
+    def __iter__(self):
+        for i in range(len(self.starts)):
+            yield self._materialize(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(range(*index.indices(len(self.starts))))
+        if index < 0:
+            index += len(self.starts)
+        if not 0 <= index < len(self.starts):
+            raise IndexError('slot index out of range')
+        return self._materialize(index)
+
+    def __eq__(self, other):
+        if isinstance(other, SlotSet):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"<SlotSet: {len(self)} slots>"
+
+    def to_list(self):
+        """Materialize every slot as a dict."""
+        return list(self)
+
+    def _materialize(self, index):
+        """Build the slot dict for one index."""
+        start_time = from_epoch_seconds(self.starts[index])
+        end_time = from_epoch_seconds(self.starts[index] + self.lengths[index])
+
+        slot = {
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration_minutes': self.lengths[index] // 60,
+            'available_spots': self.spots[index],
+        }
+
+        if self.invitee_timezone is not None:
+            invitee_tz = get_zone(self.invitee_timezone)
+            local_start = start_time.astimezone(invitee_tz)
+            slot['local_start_time'] = local_start
+            slot['local_end_time'] = end_time.astimezone(invitee_tz)
+            slot['dst_info'] = {
+                'organizer_dst': bool(start_time.astimezone(get_zone(self.organizer_timezone)).dst()),
+                'invitee_dst': bool(local_start.dst()),
+                'dst_transition': False
+            }
+
+        if self.invitee_timezones is not None:
+            invitee_times = {}
+            for tz_name in self.invitee_timezones:
+                tz = get_zone(tz_name)
+                local_start = start_time.astimezone(tz)
+                local_end = end_time.astimezone(tz)
+                invitee_times[tz_name] = {
+                    'start_time': local_start,
+                    'end_time': local_end,
+                    'start_hour': local_start.hour,
+                    'end_hour': local_end.hour
+                }
+            slot['invitee_times'] = invitee_times
+            slot['fairness_score'] = self.fairness[index]
+
+        return slot
@@ -3,7 +3,13 @@ from django.core.cache import cache
 from django.utils import timezone
 from django.conf import settings
 from datetime import datetime, timedelta
-from .utils import calculate_available_slots, get_cache_key_for_availability, get_weekly_cache_keys_for_date_range, generate_cache_key_variations
+from .engine import (
+    INVALIDATION_HORIZON_DAYS, get_affected_week_starts, get_availability_engine,
+    invalidate_availability_generation, invalidate_availability_ranges
+)
+from .utils import get_dirty_organizers, get_week_starts, mark_cache_dirty, merge_date_ranges, pop_dirty_changes
+from .metrics import get_metrics_summary
+from .scheduler import get_availability_input_hash, get_refresh_shards, get_stored_input_hash, store_input_hash
 from apps.users.models import User
 from apps.events.models import EventType
 import logging
@@ -12,13 +18,20 @@ logger = logging.getLogger(__name__)
 
 
 @shared_task
-def precompute_availability_cache(organizer_id, days_ahead=None):
+def precompute_availability_cache(organizer_id, days_ahead=None, date_ranges=None, event_type_ids=None,
+                                  skip_unchanged=False):
     """
     Precompute and cache availability for an organizer.
     
     Args:
         organizer_id: UUID of the organizer
         days_ahead: Number of days ahead to precompute (default from settings)
+        date_ranges: List of [start_date, end_date] ISO date pairs a change
+            affected; only the weeks covering them are recomputed (default:
+            the whole window)
+        event_type_ids: Event type IDs to recompute (default: all active)
+        skip_unchanged: Only extend the cached chunks if the organizer's
+            inputs hash the same as at the last full precompute
     """
     try:
         organizer = User.objects.get(id=organizer_id, is_organizer=True, is_active=True)
@@ -29,45 +42,51 @@ def precompute_availability_cache(organizer_id, days_ahead=None):
         
         # Get all active event types for this organizer
         event_types = EventType.objects.filter(organizer=organizer, is_active=True)
+        if event_type_ids is not None:
+            event_types = event_types.filter(id__in=event_type_ids)
         
         start_date = timezone.now().date()
-        
-        # Process in weekly chunks for better cache granularity
-        current_date = start_date
         end_date = start_date + timedelta(days=days_ahead)
         
+        week_starts = get_week_starts(start_date, end_date)
+        if date_ranges is not None:
+            # Untouched weeks keep their cached chunks
+            affected_weeks = set(get_affected_week_starts([
+                (datetime.fromisoformat(range_start).date(), datetime.fromisoformat(range_end).date())
+                for range_start, range_end in date_ranges
+            ]))
+            week_starts = [week_start for week_start in week_starts if week_start in affected_weeks]
+        
+        engine = get_availability_engine()
+        
+        full_window = date_ranges is None and event_type_ids is None
+        
+        if skip_unchanged and full_window and get_availability_input_hash(organizer) == get_stored_input_hash(organizer.id):
+            if all(engine.extend(organizer, event_type, start_date, end_date, cache_timeout=3600)
+                   for event_type in event_types):
+                logger.info(f"Availability inputs unchanged for {organizer.email}, extended cached chunks")
+                return f"Skipped unchanged organizer {organizer.email}"
+        
         total_cached = 0
+        failed = False
+        
+        for event_type in event_types:
+            try:
+                # Recompute the weekly UTC chunks the availability API and
+                # public booking pages assemble for every invitee timezone (1 hour)
+                total_cached += engine.warm_weeks(
+                    organizer, event_type, week_starts, cache_timeout=3600
+                )
+                
+            except Exception as e:
+                logger.error(f"Error precomputing availability for {organizer.email}, event type {event_type.name}: {str(e)}")
+                failed = True
+                continue
         
-        while current_date <= end_date:
-            # Calculate week end (or final end_date if sooner)
-            week_end = min(current_date + timedelta(days=6), end_date)
-            
-            for event_type in event_types:
-                try:
-                    # Calculate available slots for this week
-                    available_slots = calculate_available_slots(
-                        organizer=organizer,
-                        event_type=event_type,
-                        start_date=current_date,
-                        end_date=week_end,
-                        invitee_timezone='UTC'  # Store in UTC, convert on request
-                    )
-                    
-                    # Create cache key for this week
-                    cache_key = get_cache_key_for_availability(
-                        organizer.id, event_type.id, current_date, week_end, 'UTC', 1
-                    )
-                    
-                    # Cache for 1 hour
-                    cache.set(cache_key, available_slots, timeout=3600)
-                    total_cached += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error precomputing availability for {organizer.email}, event type {event_type.name}: {str(e)}")
-                    continue
-            
-            # Move to next week
-            current_date = week_end + timedelta(days=1)
+        # Hashed after computing: loading may create default inputs, and
+        # changes made meanwhile are recomputed by their own invalidation
+        if full_window and not failed:
+            store_input_hash(organizer.id, get_availability_input_hash(organizer))
         
         logger.info(f"Precomputed availability for {organizer.email} - {len(event_types)} event types, {total_cached} cache entries")
         return f"Precomputed availability for {organizer.email} - {len(event_types)} event types, {total_cached} cache entries"
@@ -84,15 +103,45 @@ def precompute_availability_cache(organizer_id, days_ahead=None):
 def refresh_availability_cache_for_all_organizers():
     """
     Refresh availability cache for all active organizers.
-    This task should be run periodically (e.g., every hour).
+    This task should be run periodically (every AVAILABILITY_REFRESH_INTERVAL_SECONDS).
+    
+    Organizers are split into shards of AVAILABILITY_REFRESH_SHARD_SIZE,
+    highest priority first, and the shards are spread evenly over the
+    refresh interval instead of being enqueued in one burst.
+    """
+    organizer_ids = list(
+        User.objects.filter(is_organizer=True, is_active=True).values_list('id', flat=True)
+    )
+    shards = get_refresh_shards(organizer_ids, settings.AVAILABILITY_REFRESH_SHARD_SIZE)
+    
+    spacing = settings.AVAILABILITY_REFRESH_INTERVAL_SECONDS / max(len(shards), 1)
+    for index, shard in enumerate(shards):
+        refresh_availability_shard.apply_async(
+            args=[[str(organizer_id) for organizer_id in shard]],
+            countdown=int(index * spacing)
+        )
+    
+    logger.info(f"Scheduled cache refresh for {len(organizer_ids)} organizers in {len(shards)} shards")
+    return f"Scheduled cache refresh for {len(organizer_ids)} organizers in {len(shards)} shards"
+
+
+@shared_task
+def refresh_availability_shard(organizer_ids):
+    """
+    Refresh the availability cache of one shard of organizers.
+    
+    Args:
+        organizer_ids: List of organizer UUIDs, highest priority first
     """
-    active_organizers = User.objects.filter(is_organizer=True, is_active=True)
+    skipped_count = 0
     
-    for organizer in active_organizers:
-        precompute_availability_cache.delay(organizer.id)
+    for organizer_id in organizer_ids:
+        result = precompute_availability_cache(organizer_id, skip_unchanged=True)
+        if result.startswith('Skipped'):
+            skipped_count += 1
     
-    logger.info(f"Triggered cache refresh for {active_organizers.count()} organizers")
-    return f"Triggered cache refresh for {active_organizers.count()} organizers"
+    logger.info(f"Refreshed shard of {len(organizer_ids)} organizers, {skipped_count} unchanged")
+    return f"Refreshed {len(organizer_ids) - skipped_count} organizers, skipped {skipped_count} unchanged"
 
 
 @shared_task
@@ -103,100 +152,51 @@ def clear_availability_cache(organizer_id, cache_type=None, **kwargs):
     Args:
         organizer_id: UUID of the organizer
         cache_type: Type of change that triggered the invalidation
-        **kwargs: Additional parameters for specific cache clearing logic
+        **kwargs: Additional parameters for specific cache clearing logic;
+            ``date_ranges`` (ISO [start_date, end_date] pairs) clears only
+            the weeks covering them, for every event type
     """
     try:
         organizer = User.objects.get(id=organizer_id)
-        event_types = EventType.objects.filter(organizer=organizer, is_active=True)
-        
-        cache_keys_to_clear = []
         
-        if cache_type == 'date_override_change':
-            # Clear cache only for the specific date
-            affected_date = kwargs.get('affected_date')
-            if affected_date:
-                affected_date_obj = datetime.fromisoformat(affected_date).date()
-                
-                for event_type in event_types:
-                    # Find all cache keys that might contain this date
-                    cache_keys_to_clear.extend(_get_cache_keys_for_date(
-                        organizer, event_type, affected_date_obj
-                    ))
-        
-        elif cache_type == 'blocked_time_change':
-            # Clear cache for the date range of the blocked time
-            start_date = kwargs.get('start_date')
-            end_date = kwargs.get('end_date')
-            
-            if start_date and end_date:
-                start_date_obj = datetime.fromisoformat(start_date).date()
-                end_date_obj = datetime.fromisoformat(end_date).date()
-                
-                for event_type in event_types:
-                    cache_keys_to_clear.extend(_get_cache_keys_for_date_range(
-                        organizer, event_type, start_date_obj, end_date_obj
-                    ))
-        
-        elif cache_type == 'recurring_block_change':
-            # Clear cache for all future dates affected by the recurring block
-            day_of_week = kwargs.get('day_of_week')
-            start_date = kwargs.get('start_date')
-            end_date = kwargs.get('end_date')
-            
-            # Calculate affected dates
+        if kwargs.get('date_ranges'):
+            # Batched changes, e.g. a calendar reconciliation
             today = timezone.now().date()
-            future_limit = today + timedelta(days=90)  # Clear up to 90 days ahead
-            
-            affected_dates = []
-            current_date = today
-            
-            while current_date <= future_limit:
-                if current_date.weekday() == day_of_week:
-                    # Check if within the recurring block's date range
-                    if start_date:
-                        start_date_obj = datetime.fromisoformat(start_date).date()
-                        if current_date < start_date_obj:
-                            current_date += timedelta(days=1)
-                            continue
-                    
-                    if end_date:
-                        end_date_obj = datetime.fromisoformat(end_date).date()
-                        if current_date > end_date_obj:
-                            break
-                    
-                    affected_dates.append(current_date)
-                
-                current_date += timedelta(days=1)
+            date_ranges = merge_date_ranges(
+                (max(datetime.fromisoformat(start).date(), today), datetime.fromisoformat(end).date())
+                for start, end in kwargs['date_ranges']
+                if datetime.fromisoformat(end).date() >= today
+            )
+            if not date_ranges:
+                return f"No cache to clear for {organizer.email}"
             
-            # Clear cache for all affected dates
-            for event_type in event_types:
-                for affected_date in affected_dates:
-                    cache_keys_to_clear.extend(_get_cache_keys_for_date(
-                        organizer, event_type, affected_date
-                    ))
-        
-        elif cache_type == 'event_type_change':
-            # Clear cache only for the specific event type
-            event_type_id = kwargs.get('event_type_id')
-            if event_type_id:
-                try:
-                    event_type = EventType.objects.get(id=event_type_id)
-                    cache_keys_to_clear.extend(_get_cache_keys_for_event_type(organizer, event_type))
-                except EventType.DoesNotExist:
-                    pass
-        
+            weeks_cleared = invalidate_availability_ranges(organizer, date_ranges)
+            logger.info(
+                f"{cache_type} cleared {weeks_cleared} weeks of availability cache for {organizer.email} "
+                f"in {len(date_ranges)} date ranges"
+            )
+            _queue_recompute(organizer_id, date_ranges)
+            return f"Cleared and refreshed cache for {organizer.email}"
+        
+        scope = _get_invalidation_scope(cache_type, **kwargs)
+        if scope is None:
+            logger.info(f"{cache_type} for {organizer.email} affects no future dates")
+            return f"No cache to clear for {organizer.email}"
+        
+        start_date, end_date, event_type_ids = scope
+        if start_date is None:
+            invalidate_availability_generation(organizer, event_type_ids)
+            logger.info(f"Bumped availability cache generation for {organizer.email}")
+            date_ranges = None
         else:
-            # Default: clear all cache for this organizer (broad invalidation)
-            for event_type in event_types:
-                cache_keys_to_clear.extend(_get_cache_keys_for_event_type(organizer, event_type))
-        
-        # Delete cache keys
-        if cache_keys_to_clear:
-            cache.delete_many(cache_keys_to_clear)
-            logger.info(f"Cleared {len(cache_keys_to_clear)} cache keys for {organizer.email}")
+            weeks_cleared = invalidate_availability_ranges(
+                organizer, [(start_date, end_date)], event_type_ids
+            )
+            logger.info(f"Cleared {weeks_cleared} weeks of availability cache for {organizer.email}")
+            date_ranges = [(start_date, end_date)]
         
-        # Trigger fresh precomputation for future availability
-        precompute_availability_cache.delay(organizer_id)
+        # Trigger fresh precomputation of the affected dates only
+        _queue_recompute(organizer_id, date_ranges, event_type_ids)
         
         return f"Cleared and refreshed cache for {organizer.email}"
         
@@ -208,45 +208,221 @@ def clear_availability_cache(organizer_id, cache_type=None, **kwargs):
         return f"Error clearing cache: {str(e)}"
 
 
-def _get_cache_keys_for_date(organizer, event_type, date):
-    """Get all cache keys that might contain the specified date."""
-    cache_keys = []
+def _queue_recompute(organizer_id, date_ranges=None, event_type_ids=None):
+    """
+    Queue a precompute of the dates and event types a change affected.
     
-    # Check weekly chunks that might contain this date
-    for days_offset in range(0, 7):
-        week_start = date - timedelta(days=days_offset)
-        week_end = week_start + timedelta(days=6)
-        
-        if week_start <= date <= week_end:
-            # This weekly chunk contains the affected date
-            base_key = f"availability:{organizer.id}:{event_type.id}:{week_start}:{week_end}"
-            cache_keys.extend(generate_cache_key_variations(base_key))
+    Args:
+        organizer_id: UUID of the organizer
+        date_ranges: List of (start_date, end_date) tuples (default: whole window)
+        event_type_ids: Event type IDs (default: all active)
+    """
+    precompute_availability_cache.delay(
+        str(organizer_id),
+        date_ranges=[
+            [start_date.isoformat(), end_date.isoformat()] for start_date, end_date in date_ranges
+        ] if date_ranges is not None else None,
+        event_type_ids=sorted(str(event_type_id) for event_type_id in event_type_ids)
+        if event_type_ids is not None else None
+    )
+
+
+def queue_cache_invalidation(organizer_id, cache_type, **kwargs):
+    """
+    Record a change for an organizer and schedule one debounced flush.
+    
+    Changes recorded within AVAILABILITY_CACHE_DEBOUNCE_SECONDS of the first
+    one are coalesced by ``flush_cache_invalidations`` into one invalidation
+    and one recompute, so bulk edits (e.g. a calendar sync touching hundreds
+    of blocked times) do not fan out into a task per row.
+    
+    Args:
+        organizer_id: UUID of the organizer
+        cache_type: Type of change (see ``clear_availability_cache``)
+        **kwargs: JSON-serializable change details (dates as ISO strings)
+    """
+    mark_cache_dirty(organizer_id, cache_type, **kwargs)
     
-    return cache_keys
+    debounce_seconds = settings.AVAILABILITY_CACHE_DEBOUNCE_SECONDS
+    
+    # Only the first change of a window schedules the flush
+    if cache.add(f"availability_flush_scheduled:{organizer_id}", True, timeout=debounce_seconds * 2 or 60):
+        flush_cache_invalidations.apply_async(args=[str(organizer_id)], countdown=debounce_seconds)
+
+
+@shared_task
+def flush_cache_invalidations(organizer_id):
+    """
+    Apply the changes recorded for an organizer during one debounce window.
+    
+    Args:
+        organizer_id: UUID of the organizer
+    """
+    try:
+        # Changes recorded from now on schedule the next window
+        cache.delete(f"availability_flush_scheduled:{organizer_id}")
+        
+        changes = pop_dirty_changes(organizer_id)
+        if not changes:
+            return f"No pending cache changes for organizer {organizer_id}"
+        
+        organizer = User.objects.get(id=organizer_id)
+        
+        # Changes tied to dates clear their weeks; the others bump generations
+        date_ranges = []
+        event_type_ids = set()
+        all_event_types = False
+        generation_event_type_ids = set()
+        all_generations = False
+        
+        for change in changes:
+            details = {key: value for key, value in change.items() if key not in ('cache_type', 'timestamp')}
+            scope = _get_invalidation_scope(change['cache_type'], **details)
+            if scope is None:
+                continue
+            
+            start_date, end_date, change_event_type_ids = scope
+            if start_date is None:
+                if change_event_type_ids is None:
+                    all_generations = True
+                else:
+                    generation_event_type_ids.update(change_event_type_ids)
+                continue
+            
+            date_ranges.append((start_date, end_date))
+            if change_event_type_ids is None:
+                all_event_types = True
+            else:
+                event_type_ids.update(change_event_type_ids)
+        
+        if all_generations:
+            # Every chunk is retired, so no week needs clearing
+            invalidate_availability_generation(organizer)
+            date_ranges = []
+        elif generation_event_type_ids:
+            invalidate_availability_generation(organizer, sorted(generation_event_type_ids))
+        
+        if date_ranges:
+            date_ranges = merge_date_ranges(date_ranges)
+            weeks_cleared = invalidate_availability_ranges(
+                organizer, date_ranges, None if all_event_types else sorted(event_type_ids)
+            )
+            logger.info(
+                f"Coalesced {len(changes)} changes for {organizer.email} into "
+                f"{len(date_ranges)} date ranges ({weeks_cleared} weeks)"
+            )
+        
+        # One recompute per kind of change, limited to what the window touched
+        if all_generations:
+            _queue_recompute(organizer_id)
+        else:
+            if generation_event_type_ids:
+                _queue_recompute(organizer_id, event_type_ids=generation_event_type_ids)
+            if date_ranges:
+                _queue_recompute(organizer_id, date_ranges, None if all_event_types else event_type_ids)
+        
+        return f"Flushed {len(changes)} cache changes for {organizer.email}"
+        
+    except User.DoesNotExist:
+        logger.error(f"Organizer {organizer_id} not found")
+        return f"Organizer {organizer_id} not found"
+    except Exception as e:
+        logger.error(f"Error flushing cache invalidations: {str(e)}")
+        return f"Error flushing cache invalidations: {str(e)}"
 
 
-def _get_cache_keys_for_date_range(organizer, event_type, start_date, end_date):
-    """Get all cache keys for a date range."""
-    cache_keys = []
-    current_date = start_date
+@shared_task
+def process_dirty_cache_flags(batch_size=None, max_batches=None):
+    """
+    Drain the dirty-organizer index in bounded batches.
+    
+    Picks up organizers whose oldest pending change is older than the
+    debounce window (i.e. whose scheduled flush was lost or is late), oldest
+    first, and flushes each one inline. At most ``batch_size * max_batches``
+    organizers are flushed per run; the rest stay indexed for the next run.
+    
+    Args:
+        batch_size: Organizers per batch (default: AVAILABILITY_DIRTY_BATCH_SIZE)
+        max_batches: Batches per run (default: AVAILABILITY_DIRTY_MAX_BATCHES)
+    """
+    batch_size = batch_size or settings.AVAILABILITY_DIRTY_BATCH_SIZE
+    max_batches = max_batches or settings.AVAILABILITY_DIRTY_MAX_BATCHES
     
-    while current_date <= end_date:
-        cache_keys.extend(_get_cache_keys_for_date(organizer, event_type, current_date))
-        current_date += timedelta(days=1)
+    processed_count = 0
     
-    # Remove duplicates
-    return list(set(cache_keys))
+    for _ in range(max_batches):
+        organizer_ids = get_dirty_organizers(
+            limit=batch_size, older_than=settings.AVAILABILITY_CACHE_DEBOUNCE_SECONDS
+        )
+        if not organizer_ids:
+            break
+        
+        for organizer_id in organizer_ids:
+            try:
+                flush_cache_invalidations(organizer_id)
+            except Exception as e:
+                logger.error(f"Error processing dirty cache flags for organizer {organizer_id}: {str(e)}")
+                # Drop the changes so one bad organizer cannot stall the queue
+                pop_dirty_changes(organizer_id)
+            processed_count += 1
+    
+    logger.info(f"Processed dirty cache flags for {processed_count} organizers")
+    return f"Processed dirty cache flags for {processed_count} organizers"
 
 
-def _get_cache_keys_for_event_type(organizer, event_type):
-    """Get all cache keys for a specific event type (future dates)."""
-    cache_keys = []
+def _get_invalidation_scope(cache_type, **kwargs):
+    """
+    Get the dates and event types a change affects.
     
-    # Clear cache for the next 90 days
-    start_date = timezone.now().date()
-    end_date = start_date + timedelta(days=90)
+    Args:
+        cache_type: Type of change that triggered the invalidation
+        **kwargs: Change details as passed to ``clear_availability_cache``
     
-    return _get_cache_keys_for_date_range(organizer, event_type, start_date, end_date)
+    Returns:
+        tuple: (start_date, end_date, event_type_ids or None for all), with
+        both dates None for changes not tied to dates, or None if the change
+        affects no future dates
+    """
+    today = timezone.now().date()
+    start_date = end_date = None
+    event_type_ids = None
+    
+    if cache_type == 'date_override_change':
+        # Clear cache only for the week of the specific date
+        if kwargs.get('affected_date'):
+            start_date = end_date = datetime.fromisoformat(kwargs['affected_date']).date()
+    
+    elif cache_type == 'blocked_time_change':
+        # Clear cache for the weeks of the blocked time
+        if kwargs.get('start_date') and kwargs.get('end_date'):
+            start_date = datetime.fromisoformat(kwargs['start_date']).date()
+            end_date = datetime.fromisoformat(kwargs['end_date']).date()
+    
+    elif cache_type == 'recurring_block_change':
+        # A weekly block touches every week within its own date range
+        if kwargs.get('start_date') or kwargs.get('end_date'):
+            start_date = today
+            end_date = today + timedelta(days=INVALIDATION_HORIZON_DAYS)
+            if kwargs.get('start_date'):
+                start_date = max(start_date, datetime.fromisoformat(kwargs['start_date']).date())
+            if kwargs.get('end_date'):
+                end_date = min(end_date, datetime.fromisoformat(kwargs['end_date']).date())
+            
+            # Narrow to the first and last occurrence of the block's weekday
+            if kwargs.get('day_of_week') is not None:
+                start_date += timedelta(days=(kwargs['day_of_week'] - start_date.weekday()) % 7)
+                end_date -= timedelta(days=(end_date.weekday() - kwargs['day_of_week']) % 7)
+            
+            if start_date > end_date:
+                return None
+    
+    elif cache_type == 'event_type_change':
+        # Clear cache only for the specific event type
+        if kwargs.get('event_type_id'):
+            event_type_ids = [kwargs['event_type_id']]
+    
+    # Anything else (rules, buffers, manual clears) clears every event type and week
+    return start_date, end_date, event_type_ids
 
 
 @shared_task
@@ -262,14 +438,15 @@ def cleanup_expired_cache_entries():
 def monitor_cache_performance():
     """Monitor cache performance and log statistics."""
     try:
-        # Get Redis info (if using Redis cache)
-        from django.core.cache import cache
+        summary = get_metrics_summary(window_seconds=3600)
         
-        # This would require Redis-specific commands in production
-        # For now, just log that monitoring ran
-        logger.info("Cache performance monitoring executed")
+        logger.info(
+            f"Availability cache (last hour): {summary['cache_hit_rate']:.1%} hit rate, "
+            f"{summary['stale_serves']} stale serves, {summary['average_request_ms']}ms average request, "
+            f"{summary['average_recompute_ms']}ms average recompute"
+        )
         
-        return "Cache performance monitoring completed"
+        return f"Cache performance monitoring completed: {summary['cache_hit_rate']:.1%} hit rate"
         
     except Exception as e:
         logger.error(f"Error monitoring cache performance: {str(e)}")
@@ -280,9 +457,6 @@ def monitor_cache_performance():
 def monitor_cache_performance_detailed():
     """Enhanced cache performance monitoring with detailed metrics."""
     try:
-        from django.core.cache import cache
-        from django.db import connection
-        
         # Get cache statistics
         cache_stats = {
             'timestamp': timezone.now().isoformat(),
@@ -310,14 +484,12 @@ def monitor_cache_performance_detailed():
         except Exception as e:
             logger.debug(f"Could not get Redis stats: {str(e)}")
         
-        # Get database query statistics
-        db_stats = {
-            'total_queries': len(connection.queries),
-        }
+        # Availability cache counters and per-stage latency recorded by the engine
+        availability_stats = get_metrics_summary(window_seconds=3600)
         
         # Log comprehensive performance data
         logger.info(f"Cache Performance: {cache_stats}")
-        logger.info(f"Database Performance: {db_stats}")
+        logger.info(f"Availability Performance: {availability_stats}")
         
         return f"Cache monitoring completed: {cache_stats.get('cache_hit_rate', 'N/A')}% hit rate"
         
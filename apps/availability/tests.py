@@ -7,8 +7,11 @@ from .models import AvailabilityRule, BlockedTime, BufferTime, DateOverrideRule,
 from .utils import (
     calculate_available_slots, is_slot_blocked, is_slot_conflicting_with_bookings,
     is_slot_blocked_by_recurring, merge_overlapping_slots, validate_timezone,
-    calculate_multi_invitee_intersection, calculate_timezone_offset_hours
+    calculate_multi_invitee_intersection, calculate_timezone_offset_hours,
+    calculate_dst_safe_time_slots
 )
+from .slot_set import SlotSet
+from .timezones import get_transition_table, get_zone, to_epoch_seconds
 from apps.events.models import EventType, Booking
 
 User = get_user_model()
@@ -879,4 +882,1141 @@ class AvailabilityModelTestCase(TestCase):
         
         serializer = DateOverrideRuleSerializer(data=invalid_data)
         self.assertFalse(serializer.is_valid())
-        self.assertIn('start_time and end_time are required', str(serializer.errors))
\ No newline at end of file
+        self.assertIn('start_time and end_time are required', str(serializer.errors))
+
+class BusyIntervalIndexTestCase(TestCase):
+    """Test suite for the busy-interval index used by slot generation."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.base = datetime(2024, 6, 3, 12, 0, tzinfo=timezone.utc)
+    
+    def test_interval_set_merges_and_bisects(self):
+        """Test merged intervals answer overlap queries like a linear scan."""
+        from .busy_index import IntervalSet
+        
+        intervals = IntervalSet([
+            (self.base, self.base + timedelta(hours=1)),
+            (self.base + timedelta(minutes=30), self.base + timedelta(hours=2)),
+            (self.base + timedelta(hours=4), self.base + timedelta(hours=5)),
+        ])
+        
+        self.assertEqual(len(intervals), 2)
+        self.assertTrue(intervals.overlaps(self.base + timedelta(minutes=90), self.base + timedelta(hours=3)))
+        self.assertFalse(intervals.overlaps(self.base + timedelta(hours=2), self.base + timedelta(hours=4)))
+        self.assertFalse(intervals.overlaps(self.base - timedelta(hours=1), self.base))
+        self.assertTrue(intervals.overlaps(self.base + timedelta(hours=3), self.base + timedelta(hours=6)))
+    
+    def test_recurring_block_spanning_midnight_is_continuous(self):
+        """Test midnight-spanning recurring blocks expand into one interval."""
+        from .busy_index import IntervalSet, expand_recurring_blocks
+        
+        organizer = User.objects.create_user(email='index@test.com', password='testpass123')
+        block = RecurringBlockedTime.objects.create(
+            organizer=organizer,
+            name='Late shift',
+            day_of_week=0,  # Monday
+            start_time=time(22, 0),
+            end_time=time(2, 0)
+        )
+        
+        org_tz = ZoneInfo('America/New_York')
+        intervals = IntervalSet(expand_recurring_blocks([block], org_tz, date(2024, 6, 3), date(2024, 6, 4)))
+        
+        self.assertEqual(len(intervals), 1)
+        
+        # 23:59 Monday to 00:30 Tuesday is inside the block
+        slot_start = datetime(2024, 6, 3, 23, 59, tzinfo=org_tz).astimezone(timezone.utc)
+        self.assertTrue(is_slot_blocked_by_recurring(
+            slot_start, slot_start + timedelta(minutes=31), intervals, org_tz
+        ))
+    
+    def test_booking_index_applies_each_booking_buffers(self):
+        """Test bookings are padded with their own event type buffers."""
+        from .busy_index import BookingIntervalIndex
+        
+        organizer = User.objects.create_user(email='bookings@test.com', password='testpass123')
+        buffered_type = EventType.objects.create(
+            organizer=organizer,
+            name='Buffered',
+            duration=30,
+            buffer_time_after=15
+        )
+        booking = Booking.objects.create(
+            event_type=buffered_type,
+            organizer=organizer,
+            invitee_name='Invitee',
+            invitee_email='invitee@test.com',
+            start_time=self.base,
+            end_time=self.base + timedelta(minutes=30),
+            status='confirmed'
+        )
+        
+        index = BookingIntervalIndex([booking])
+        
+        # Slot right after the booking falls inside its 15 minute buffer
+        self.assertEqual(index.overlapping(self.base + timedelta(minutes=40), self.base + timedelta(minutes=70)), [booking])
+        self.assertEqual(index.overlapping(self.base + timedelta(minutes=45), self.base + timedelta(minutes=75)), [])
+        self.assertTrue(is_slot_conflicting_with_bookings(
+            self.base + timedelta(minutes=40), self.base + timedelta(minutes=70), index, buffered_type
+        ))
+
+
+class SweepEngineTestCase(TestCase):
+    """Test suite comparing the sweep slot engine with the per-slot loop."""
+    
+    def setUp(self):
+        """Set up test data."""
+        from apps.users.models import Profile
+        
+        self.organizer = User.objects.create_user(email='sweep@test.com', password='testpass123')
+        Profile.objects.create(user=self.organizer, timezone_name='Europe/Berlin')
+        BufferTime.objects.create(organizer=self.organizer, minimum_gap=20)
+        
+        self.event_type = EventType.objects.create(
+            organizer=self.organizer,
+            name='Sweep Meeting',
+            duration=30,
+            buffer_time_before=10,
+            buffer_time_after=5,
+            min_scheduling_notice=0,
+            slot_interval_minutes=15
+        )
+        self.group_event = EventType.objects.create(
+            organizer=self.organizer,
+            name='Sweep Workshop',
+            duration=60,
+            max_attendees=4,
+            min_scheduling_notice=0
+        )
+        
+        for day in range(7):
+            AvailabilityRule.objects.create(
+                organizer=self.organizer,
+                day_of_week=day,
+                start_time=time(8, 0),
+                end_time=time(18, 0)
+            )
+        
+        self.start_date = timezone.now().date() + timedelta(days=1)
+        org_tz = ZoneInfo('Europe/Berlin')
+        
+        BlockedTime.objects.create(
+            organizer=self.organizer,
+            start_datetime=datetime.combine(self.start_date, time(11, 10), org_tz),
+            end_datetime=datetime.combine(self.start_date, time(12, 20), org_tz),
+            reason='Lunch'
+        )
+        RecurringBlockedTime.objects.create(
+            organizer=self.organizer,
+            name='Standup',
+            day_of_week=(self.start_date + timedelta(days=1)).weekday(),
+            start_time=time(9, 0),
+            end_time=time(9, 15)
+        )
+        
+        for offset, hour, event_type in [(0, 15, self.event_type), (2, 10, self.group_event), (3, 14, self.group_event)]:
+            booking_start = datetime.combine(self.start_date + timedelta(days=offset), time(hour, 0), org_tz)
+            Booking.objects.create(
+                event_type=event_type,
+                organizer=self.organizer,
+                invitee_name='Invitee',
+                invitee_email='invitee@test.com',
+                start_time=booking_start,
+                end_time=booking_start + timedelta(minutes=event_type.duration),
+                status='confirmed'
+            )
+    
+    def _slot_tuples(self, event_type, attendee_count, engine):
+        result = calculate_available_slots(
+            organizer=self.organizer,
+            event_type=event_type,
+            start_date=self.start_date,
+            end_date=self.start_date + timedelta(days=6),
+            invitee_timezone='America/New_York',
+            attendee_count=attendee_count,
+            engine=engine,
+            use_cache=False
+        )
+        return [(slot['start_time'], slot['end_time'], slot['available_spots']) for slot in result['slots']]
+    
+    def test_sweep_matches_loop(self):
+        """Test both engines produce identical slots."""
+        for event_type in (self.event_type, self.group_event):
+            for attendee_count in (1, 4, 5):
+                loop_slots = self._slot_tuples(event_type, attendee_count, 'loop')
+                sweep_slots = self._slot_tuples(event_type, attendee_count, 'sweep')
+                
+                self.assertGreater(len(loop_slots), 0)
+                self.assertEqual(loop_slots, sweep_slots)
+    
+    def test_sweep_slot_starts_jumps_forbidden_ranges(self):
+        """Test the sweep keeps the candidate grid aligned after a busy range."""
+        from .busy_index import merge_open_ranges, sweep_slot_starts
+        
+        base = datetime(2024, 6, 3, 9, 0, tzinfo=timezone.utc)
+        forbidden = merge_open_ranges([
+            (base + timedelta(minutes=10), base + timedelta(minutes=45)),
+            (base + timedelta(minutes=45), base + timedelta(minutes=70)),
+        ])
+        
+        starts = sweep_slot_starts(
+            base, base + timedelta(hours=2), timedelta(minutes=30),
+            timedelta(minutes=15), timedelta(minutes=15), forbidden
+        )
+        
+        # 09:45 is the shared endpoint of two touching ranges and stays open
+        self.assertEqual(starts, [
+            base,
+            base + timedelta(minutes=45),
+            base + timedelta(minutes=75),
+            base + timedelta(minutes=90),
+        ])
+
+
+class AvailabilityQueryBudgetTestCase(TestCase):
+    """Test that availability queries do not grow with the number of days."""
+    
+    QUERY_BUDGET = 15
+    
+    def setUp(self):
+        """Set up test data."""
+        from apps.users.models import Profile
+        
+        self.organizer = User.objects.create_user(email='budget@test.com', password='testpass123')
+        Profile.objects.create(user=self.organizer, timezone_name='America/New_York')
+        BufferTime.objects.create(organizer=self.organizer)
+        
+        self.event_type = EventType.objects.create(
+            organizer=self.organizer,
+            name='Budget Meeting',
+            duration=30,
+            min_scheduling_notice=0
+        )
+        other_event_type = EventType.objects.create(
+            organizer=self.organizer,
+            name='Other Meeting',
+            duration=60
+        )
+        
+        for day in range(5):
+            AvailabilityRule.objects.create(
+                organizer=self.organizer,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0)
+            )
+        
+        # A rule restricted to another event type must be ignored
+        restricted_rule = AvailabilityRule.objects.create(
+            organizer=self.organizer,
+            day_of_week=5,
+            start_time=time(9, 0),
+            end_time=time(12, 0)
+        )
+        restricted_rule.event_types.add(other_event_type)
+        
+        self.start_date = timezone.now().date() + timedelta(days=1)
+        for offset in (3, 10, 40):
+            override = DateOverrideRule.objects.create(
+                organizer=self.organizer,
+                date=self.start_date + timedelta(days=offset),
+                is_available=True,
+                start_time=time(13, 0),
+                end_time=time(15, 0)
+            )
+            override.event_types.add(self.event_type)
+    
+    def _count_queries(self, func):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as context:
+            func()
+        return len(context.captured_queries)
+    
+    def test_calculate_available_slots_query_budget(self):
+        """Test a 60-day request issues the same bounded number of queries as a 7-day one."""
+        def run(days):
+            return lambda: calculate_available_slots(
+                organizer=self.organizer,
+                event_type=self.event_type,
+                start_date=self.start_date,
+                end_date=self.start_date + timedelta(days=days),
+                invitee_timezone='UTC',
+                engine='sweep',
+                use_cache=False
+            )
+        
+        week_queries = self._count_queries(run(7))
+        horizon_queries = self._count_queries(run(60))
+        
+        self.assertLessEqual(horizon_queries, self.QUERY_BUDGET)
+        self.assertEqual(week_queries, horizon_queries)
+    
+    def test_group_capacity_query_budget(self):
+        """Test group bookings add no queries per booking or per slot."""
+        from apps.events.models import Attendee
+        from apps.events.utils import AvailabilityCalculator
+        
+        group_event = EventType.objects.create(
+            organizer=self.organizer,
+            name='Webinar',
+            duration=60,
+            max_attendees=100,
+            min_scheduling_notice=0
+        )
+        org_tz = ZoneInfo('America/New_York')
+        
+        def add_group_bookings(count, first_day):
+            for offset in range(count):
+                booking_date = self.start_date + timedelta(days=first_day + offset)
+                booking_start = datetime.combine(booking_date, time(10, 0), org_tz)
+                booking = Booking.objects.create(
+                    event_type=group_event,
+                    organizer=self.organizer,
+                    invitee_name='Host',
+                    invitee_email='host@test.com',
+                    start_time=booking_start,
+                    end_time=booking_start + timedelta(hours=1),
+                    status='confirmed'
+                )
+                for index in range(3):
+                    Attendee.objects.create(booking=booking, name='Guest', email=f'guest{index}@test.com')
+        
+        def count_both():
+            return (
+                self._count_queries(lambda: calculate_available_slots(
+                    organizer=self.organizer,
+                    event_type=group_event,
+                    start_date=self.start_date,
+                    end_date=self.start_date + timedelta(days=20),
+                    invitee_timezone='UTC',
+                    attendee_count=2,
+                    engine='sweep',
+                    use_cache=False
+                )),
+                self._count_queries(lambda: AvailabilityCalculator(
+                    self.organizer, group_event, engine='sweep'
+                ).get_available_slots(self.start_date, self.start_date + timedelta(days=20), 2, use_cache=False))
+            )
+        
+        add_group_bookings(2, first_day=0)
+        few_bookings = count_both()
+        
+        add_group_bookings(8, first_day=2)
+        many_bookings = count_both()
+        
+        self.assertEqual(few_bookings, many_bookings)
+    
+    def test_availability_calculator_query_budget(self):
+        """Test AvailabilityCalculator no longer queries per day."""
+        from apps.events.utils import AvailabilityCalculator
+        
+        def run(days):
+            calculator = AvailabilityCalculator(self.organizer, self.event_type, engine='sweep')
+            return lambda: calculator.get_available_slots(
+                self.start_date, self.start_date + timedelta(days=days), 1, use_cache=False
+            )
+        
+        week_queries = self._count_queries(run(7))
+        horizon_queries = self._count_queries(run(60))
+        
+        self.assertLessEqual(horizon_queries, self.QUERY_BUDGET)
+        self.assertEqual(week_queries, horizon_queries)
+
+
+class DailyBookingCounterTestCase(TestCase):
+    """Test suite for per-day booking counters behind max_bookings_per_day."""
+    
+    def setUp(self):
+        """Set up test data."""
+        from apps.users.models import Profile
+        
+        self.organizer = User.objects.create_user(email='counter@test.com', password='testpass123')
+        Profile.objects.create(user=self.organizer, timezone_name='America/Los_Angeles')
+        
+        self.event_type = EventType.objects.create(
+            organizer=self.organizer,
+            name='Capped Meeting',
+            duration=30,
+            min_scheduling_notice=0,
+            max_bookings_per_day=1
+        )
+        
+        self.org_tz = ZoneInfo('America/Los_Angeles')
+        self.local_date = timezone.now().date() + timedelta(days=3)
+    
+    def _create_booking(self, local_time):
+        booking_start = datetime.combine(self.local_date, local_time, self.org_tz)
+        return Booking.objects.create(
+            event_type=self.event_type,
+            organizer=self.organizer,
+            invitee_name='Invitee',
+            invitee_email='invitee@test.com',
+            start_time=booking_start,
+            end_time=booking_start + timedelta(minutes=30),
+            status='confirmed'
+        )
+    
+    def _count(self, local_date=None):
+        from apps.events.utils import get_daily_booking_counts
+        
+        local_date = local_date or self.local_date
+        return get_daily_booking_counts(self.event_type, local_date, local_date).get(local_date, 0)
+    
+    def test_counter_follows_create_cancel_and_reschedule(self):
+        """Test counters are bucketed by organizer-local date and kept in step."""
+        # 17:30 in Los Angeles is already the next day in UTC
+        booking = self._create_booking(time(17, 30))
+        self.assertEqual(self._count(), 1)
+        
+        booking.status = 'cancelled'
+        booking.save(update_fields=['status'])
+        self.assertEqual(self._count(), 0)
+        
+        booking.status = 'confirmed'
+        booking.save()
+        next_day = self.local_date + timedelta(days=1)
+        booking.start_time += timedelta(days=1)
+        booking.end_time += timedelta(days=1)
+        booking.save(update_fields=['start_time', 'end_time'])
+        self.assertEqual(self._count(), 0)
+        self.assertEqual(self._count(next_day), 1)
+        
+        booking.delete()
+        self.assertEqual(self._count(next_day), 0)
+    
+    def test_daily_limit_uses_counters(self):
+        """Test a capped day yields no slots once its counter reaches the cap."""
+        from apps.events.utils import count_daily_bookings
+        
+        AvailabilityRule.objects.create(
+            organizer=self.organizer,
+            day_of_week=self.local_date.weekday(),
+            start_time=time(9, 0),
+            end_time=time(12, 0)
+        )
+        self._create_booking(time(17, 30))
+        
+        self.assertEqual(
+            count_daily_bookings(self.event_type, self.local_date, self.local_date, 'America/Los_Angeles'),
+            {self.local_date: 1}
+        )
+        
+        result = calculate_available_slots(
+            organizer=self.organizer,
+            event_type=self.event_type,
+            start_date=self.local_date,
+            end_date=self.local_date,
+            invitee_timezone='UTC'
+        )
+        self.assertEqual(result['slots'], [])
+    
+    def test_booking_limit_check_counts_bookings(self):
+        """Test the booking-time limit check ignores a drifted counter."""
+        from apps.events.models import EventTypeDailyBookingCount
+        from apps.events.utils import AvailabilityCalculator
+        
+        booking = self._create_booking(time(10, 0))
+        calculator = AvailabilityCalculator(self.organizer, self.event_type)
+        self.assertTrue(calculator._exceeds_daily_booking_limit(booking.start_time))
+        
+        # Queryset updates bypass the signals and leave the counter stale
+        Booking.objects.filter(id=booking.id).update(status='cancelled')
+        self.assertEqual(self._count(), 1)
+        self.assertFalse(calculator._exceeds_daily_booking_limit(booking.start_time))
+        
+        EventTypeDailyBookingCount.objects.filter(event_type=self.event_type).update(booking_count=0)
+        Booking.objects.filter(id=booking.id).update(status='confirmed')
+        self.assertTrue(calculator._exceeds_daily_booking_limit(booking.start_time))
+    
+    def test_backfill_migration_fills_counters(self):
+        """Test the data migration rebuilds counters by organizer-local date."""
+        from importlib import import_module
+        from django.apps import apps
+        from apps.events.models import EventTypeDailyBookingCount
+        
+        self._create_booking(time(17, 30))
+        self._create_booking(time(9, 0))
+        EventTypeDailyBookingCount.objects.all().delete()
+        
+        migration = import_module('apps.events.migrations.0005_backfill_daily_booking_counts')
+        migration.backfill_daily_booking_counts(apps, None)
+        
+        self.assertEqual(self._count(), 2)
+        self.assertEqual(self._count(self.local_date + timedelta(days=1)), 0)
+
+
+class SlotSetTestCase(TestCase):
+    """Test the array-backed slot set against the list-based pipeline."""
+    
+    def setUp(self):
+        """Build slots around the 2026 US spring-forward transition."""
+        self.org_tz = ZoneInfo('America/New_York')
+        self.slots = []
+        
+        for day in range(7, 10):
+            for minute in range(0, 24 * 60, 45):
+                start = datetime(2026, 3, day, tzinfo=self.org_tz) + timedelta(minutes=minute)
+                start = start.astimezone(ZoneInfo('UTC'))
+                # 30-minute slots on a 45-minute grid leave 15-minute gaps,
+                # every fourth slot is pulled in so some blocks merge
+                if minute % 180 == 135:
+                    start -= timedelta(minutes=12)
+                self.slots.append({
+                    'start_time': start,
+                    'end_time': start + timedelta(minutes=30),
+                    'duration_minutes': 30,
+                    'available_spots': 1 + minute % 4,
+                })
+    
+    def _legacy_pipeline(self, invitee_timezone, invitee_timezones=None):
+        """Run the list-based merge, DST and multi-invitee stages."""
+        slots = merge_overlapping_slots(self.slots)
+        slots.sort(key=lambda x: x['start_time'])
+        slots = calculate_dst_safe_time_slots('America/New_York', invitee_timezone, slots)
+        if invitee_timezones:
+            slots = calculate_multi_invitee_intersection(slots, invitee_timezones, invitee_timezone)
+        return slots
+    
+    def _slot_set_pipeline(self, invitee_timezone, invitee_timezones=None):
+        """Run the same stages on a SlotSet."""
+        slot_set = SlotSet.from_slots(self.slots, 'America/New_York').merged().localized(invitee_timezone)
+        if invitee_timezones:
+            slot_set = slot_set.within_reasonable_hours(invitee_timezones)
+        return slot_set
+    
+    def test_matches_list_pipeline(self):
+        """Test materialized slots equal the list pipeline output."""
+        legacy = self._legacy_pipeline('Europe/London')
+        slot_set = self._slot_set_pipeline('Europe/London')
+        
+        self.assertGreater(len(legacy), 0)
+        self.assertLess(len(legacy), len(self.slots))
+        self.assertEqual(len(slot_set), len(legacy))
+        self.assertEqual(slot_set.to_list(), legacy)
+    
+    def test_matches_multi_invitee_pipeline(self):
+        """Test fairness filtering and ordering match the list pipeline."""
+        timezones = ['America/New_York', 'Europe/London', 'Europe/London']
+        legacy = self._legacy_pipeline('America/New_York', timezones)
+        slot_set = self._slot_set_pipeline('America/New_York', timezones)
+        
+        self.assertGreater(len(legacy), 0)
+        self.assertEqual(slot_set.to_list(), legacy)
+        self.assertEqual(slot_set[:2].to_list(), legacy[:2])
+    
+    def test_pickles_compactly(self):
+        """Test a pickled slot set round-trips and is much smaller than slot dicts."""
+        import pickle
+        
+        slot_set = SlotSet.from_slots(self.slots, 'America/New_York').localized('Europe/London')
+        payload = pickle.dumps(slot_set, pickle.HIGHEST_PROTOCOL)
+        
+        self.assertEqual(pickle.loads(payload), slot_set)
+        self.assertLess(len(payload) * 5, len(pickle.dumps(list(slot_set), pickle.HIGHEST_PROTOCOL)))
+    
+    def test_binary_form_round_trips(self):
+        """Test the Redis hash binary form rebuilds an equal unlocalized set."""
+        slot_set = SlotSet.from_slots(self.slots, 'America/New_York')
+        data = slot_set.to_bytes()
+        
+        self.assertEqual(SlotSet.from_bytes(data), slot_set)
+        self.assertLess(len(data), 20 * len(slot_set))
+
+
+class TimezoneServiceTestCase(TestCase):
+    """Test cached timezone transition tables against zoneinfo conversions."""
+    
+    ZONES = [
+        'America/New_York', 'Europe/London', 'Australia/Sydney',
+        'Australia/Lord_Howe', 'Asia/Kolkata', 'UTC'
+    ]
+    
+    def test_table_matches_astimezone(self):
+        """Test offsets, local hours and DST flags over a full year."""
+        start = datetime(2026, 1, 1, tzinfo=ZoneInfo('UTC'))
+        end = datetime(2027, 1, 1, tzinfo=ZoneInfo('UTC'))
+        
+        for zone_name in self.ZONES:
+            zone = ZoneInfo(zone_name)
+            table = get_transition_table(zone_name, to_epoch_seconds(start), to_epoch_seconds(end))
+            
+            instant = start
+            while instant < end:
+                seconds = to_epoch_seconds(instant)
+                local = instant.astimezone(zone)
+                
+                self.assertEqual(table.utcoffset(seconds), local.utcoffset().total_seconds())
+                self.assertEqual(table.local_hour(seconds), local.hour)
+                self.assertEqual(table.is_dst(seconds), bool(local.dst()))
+                instant += timedelta(minutes=37)
+    
+    def test_transition_found_to_the_second(self):
+        """Test the spring-forward instant is located exactly."""
+        transition = datetime(2026, 3, 8, 7, 0, tzinfo=ZoneInfo('UTC'))
+        seconds = to_epoch_seconds(transition)
+        table = get_transition_table('America/New_York', seconds - 86400, seconds + 86400)
+        
+        self.assertFalse(table.is_dst(seconds - 1))
+        self.assertTrue(table.is_dst(seconds))
+        self.assertEqual(get_zone('America/New_York'), ZoneInfo('America/New_York'))
+    
+    def test_multi_invitee_many_timezones(self):
+        """Test five-zone intersection matches per-slot zoneinfo conversions."""
+        timezones = ['America/Los_Angeles', 'America/New_York', 'Europe/London', 'Europe/Berlin', 'Asia/Kolkata']
+        slots = []
+        start = datetime(2026, 3, 27, tzinfo=ZoneInfo('UTC'))
+        for step in range(0, 4 * 24 * 4):
+            slot_start = start + timedelta(minutes=15 * step)
+            slots.append({
+                'start_time': slot_start,
+                'end_time': slot_start + timedelta(minutes=30),
+                'duration_minutes': 30,
+            })
+        
+        result = calculate_multi_invitee_intersection(slots, timezones, 'UTC')
+        
+        expected_starts = set()
+        for slot in slots:
+            locals_ = [(slot['start_time'].astimezone(ZoneInfo(tz)), slot['end_time'].astimezone(ZoneInfo(tz)))
+                       for tz in timezones]
+            if all(s.hour >= 7 and e.hour <= 22 and s.date() == e.date() for s, e in locals_):
+                expected_starts.add(slot['start_time'])
+        
+        self.assertEqual({slot['start_time'] for slot in result}, expected_starts)
+        for slot in result:
+            for tz in timezones:
+                self.assertEqual(slot['invitee_times'][tz]['start_hour'],
+                                 slot['start_time'].astimezone(ZoneInfo(tz)).hour)
+
+
+class AvailabilityEngineTestCase(TestCase):
+    """Test the shared availability engine and its cache backends."""
+    
+    def setUp(self):
+        """Set up test data."""
+        from apps.users.models import Profile
+        
+        self.organizer = User.objects.create_user(email='engine@test.com', password='testpass123')
+        self.profile = Profile.objects.create(user=self.organizer, timezone_name='Europe/Paris')
+        
+        self.event_type = EventType.objects.create(
+            organizer=self.organizer,
+            name='Engine Meeting',
+            duration=30,
+            min_scheduling_notice=0,
+            slot_interval_minutes=60
+        )
+        
+        for day in range(7):
+            AvailabilityRule.objects.create(
+                organizer=self.organizer,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(12, 0)
+            )
+        
+        self.start_date = timezone.now().date() + timedelta(days=1)
+    
+    def test_precompute_warms_public_cache(self):
+        """Test cache warming fills the cache the public booking pages read."""
+        from .tasks import precompute_availability_cache
+        from apps.events.utils import get_available_time_slots
+        
+        today = timezone.now().date()
+        precompute_availability_cache(self.organizer.id, days_ahead=6)
+        
+        result = get_available_time_slots(
+            self.organizer, self.event_type, today, today + timedelta(days=6), 'UTC', 1
+        )
+        
+        self.assertTrue(result['cache_hit'])
+        self.assertGreater(result['total_slots'], 0)
+    
+    def test_database_cache_backend_round_trip(self):
+        """Test the database backend stores compact slots and serves them back."""
+        from apps.events.models import EventTypeAvailabilityCache
+        from .engine import DatabaseCacheBackend, get_availability_engine
+        
+        engine = get_availability_engine(cache_backend=DatabaseCacheBackend())
+        
+        first = engine.get_available_slots(
+            self.organizer, self.event_type, self.start_date, self.start_date, 'Asia/Tokyo'
+        )
+        second = engine.get_available_slots(
+            self.organizer, self.event_type, self.start_date, self.start_date, 'Asia/Tokyo'
+        )
+        
+        week_start = self.start_date - timedelta(days=self.start_date.weekday())
+        entry = EventTypeAvailabilityCache.objects.get(event_type=self.event_type, date=week_start)
+        self.assertEqual(entry.timezone_name, 'UTC')
+        self.assertTrue(set(first['slots'].starts) <= set(entry.available_slots['starts']))
+        self.assertFalse(first['cache_hit'])
+        self.assertTrue(second['cache_hit'])
+        self.assertEqual(second['slots'], first['slots'])
+        
+        # Re-warming upserts the existing row in place
+        engine.cache_backend.invalidate(self.organizer, [self.event_type.id], [week_start])
+        engine.warm(self.organizer, self.event_type, self.start_date, self.start_date)
+        entries = EventTypeAvailabilityCache.objects.filter(event_type=self.event_type, date=week_start)
+        self.assertEqual(entries.count(), 1)
+        self.assertFalse(entries.get().is_dirty)
+    
+    def test_invalidation_reaches_only_configured_backend(self):
+        """Test invalidations skip other backends until the cache is reset after a switch."""
+        from io import StringIO
+        from django.core.management import call_command
+        from django.test import override_settings
+        from apps.events.models import EventTypeAvailabilityCache
+        from .engine import (
+            DatabaseCacheBackend, get_availability_engine, invalidate_availability_generation,
+            invalidate_availability_ranges
+        )
+        from .utils import get_availability_generations
+        
+        get_availability_engine(cache_backend=DatabaseCacheBackend()).warm(
+            self.organizer, self.event_type, self.start_date, self.start_date
+        )
+        entries = EventTypeAvailabilityCache.objects.filter(organizer=self.organizer)
+        
+        with override_settings(AVAILABILITY_CACHE_BACKEND='redis'):
+            invalidate_availability_ranges(self.organizer, [(self.start_date, self.start_date)])
+            invalidate_availability_generation(self.organizer)
+        self.assertFalse(entries.filter(is_dirty=True).exists())
+        
+        generation = get_availability_generations(self.organizer.id, [self.event_type.id])
+        call_command('reset_availability_cache', stdout=StringIO())
+        
+        self.assertFalse(entries.filter(is_dirty=False).exists())
+        self.assertNotEqual(get_availability_generations(self.organizer.id, [self.event_type.id]), generation)
+    
+    def test_dirty_recompute_batches_by_organizer(self):
+        """Test dirty rows are recomputed from one load per organizer and written back."""
+        from unittest import mock
+        from django.core.cache import cache
+        from apps.events.models import EventTypeAvailabilityCache
+        from apps.events.tasks import recompute_dirty_availability_cache
+        from .engine import DatabaseAvailabilityLoader, DatabaseCacheBackend, get_availability_engine
+        
+        other_event_type = EventType.objects.create(organizer=self.organizer, name='Other Meeting', duration=60)
+        engine = get_availability_engine(cache_backend=DatabaseCacheBackend())
+        for event_type in (self.event_type, other_event_type):
+            engine.warm(self.organizer, event_type, self.start_date, self.start_date + timedelta(days=13))
+        engine.cache_backend.invalidate_all(self.organizer)
+        
+        with mock.patch.object(
+            DatabaseAvailabilityLoader, 'load_event_types', autospec=True,
+            side_effect=DatabaseAvailabilityLoader.load_event_types
+        ) as load_event_types:
+            recompute_dirty_availability_cache()
+        
+        self.assertEqual(load_event_types.call_count, 1)
+        self.assertFalse(EventTypeAvailabilityCache.objects.filter(organizer=self.organizer, is_dirty=True).exists())
+        self.assertEqual(cache.get('availability_recompute_stats')['backlog'], 0)
+        
+        week_start = self.start_date - timedelta(days=self.start_date.weekday())
+        chunks = engine.cache_backend.get_chunks(self.organizer, other_event_type, [week_start])
+        fresh = engine.compute_chunks(self.organizer, other_event_type, [week_start])
+        self.assertEqual(chunks, fresh)
+    
+    def test_chunked_cache_matches_fresh_calculation(self):
+        """Test ranges assembled from cached weekly chunks match uncached results."""
+        from .engine import get_availability_engine
+        
+        engine = get_availability_engine()
+        requests = [
+            (self.start_date, self.start_date + timedelta(days=9), 'UTC', 1, None),
+            (self.start_date + timedelta(days=2), self.start_date + timedelta(days=4), 'Asia/Tokyo', 1, None),
+            (self.start_date, self.start_date + timedelta(days=5), 'America/Los_Angeles', 2, None),
+            (self.start_date, self.start_date + timedelta(days=5), 'UTC', 1, ['Europe/London', 'Asia/Kolkata']),
+        ]
+        
+        for start_date, end_date, invitee_timezone, attendee_count, invitee_timezones in requests:
+            cached = engine.get_available_slots(
+                self.organizer, self.event_type, start_date, end_date, invitee_timezone,
+                attendee_count, invitee_timezones
+            )
+            fresh = engine.get_available_slots(
+                self.organizer, self.event_type, start_date, end_date, invitee_timezone,
+                attendee_count, invitee_timezones, use_cache=False
+            )
+            self.assertEqual(cached['slots'], fresh['slots'])
+    
+    def test_week_chunk_keeps_slots_from_previous_sunday(self):
+        """Test a week computed alone keeps Monday slots of a midnight-spanning Sunday rule."""
+        from .engine import get_availability_engine
+        
+        AvailabilityRule.objects.filter(organizer=self.organizer).delete()
+        AvailabilityRule.objects.create(
+            organizer=self.organizer,
+            day_of_week=6,
+            start_time=time(22, 0),
+            end_time=time(2, 0)
+        )
+        
+        paris = ZoneInfo('Europe/Paris')
+        monday = self.start_date + timedelta(days=14 - self.start_date.weekday())
+        expected_starts = [datetime.combine(monday, time(0, 0), paris), datetime.combine(monday, time(1, 0), paris)]
+        
+        engine = get_availability_engine()
+        chunks = engine.compute_chunks(self.organizer, self.event_type, [monday])
+        # Monday 00:00 and 01:00 from the Sunday before, Sunday 22:00 and 23:00 of the week itself
+        self.assertEqual(len(chunks[monday]), 4)
+        
+        for use_cache in (True, False):
+            result = engine.get_available_slots(
+                self.organizer, self.event_type, monday, monday, 'Europe/Paris', use_cache=use_cache
+            )
+            self.assertEqual([slot['start_time'] for slot in result['slots']], expected_starts)
+    
+    def test_one_precompute_serves_every_timezone(self):
+        """Test warmed chunks serve any invitee timezone without recomputation."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .engine import get_availability_engine
+        
+        engine = get_availability_engine()
+        end_date = self.start_date + timedelta(days=6)
+        engine.warm(self.organizer, self.event_type, self.start_date, end_date)
+        
+        for invitee_timezone in ('UTC', 'Asia/Tokyo', 'America/Sao_Paulo'):
+            with CaptureQueriesContext(connection) as context:
+                result = engine.get_available_slots(
+                    self.organizer, self.event_type, self.start_date, end_date, invitee_timezone
+                )
+            self.assertTrue(result['cache_hit'])
+            self.assertEqual(len(context.captured_queries), 0)
+            self.assertGreater(result['total_slots'], 0)
+    
+    def test_invalidation_clears_only_affected_week(self):
+        """Test a blocked time change invalidates the chunk of its own week only."""
+        from .engine import get_availability_engine
+        
+        engine = get_availability_engine()
+        week_start = self.start_date - timedelta(days=self.start_date.weekday()) + timedelta(days=7)
+        engine.warm(self.organizer, self.event_type, week_start, week_start + timedelta(days=13))
+        
+        from .tasks import clear_availability_cache
+        
+        affected_date = week_start + timedelta(days=2)
+        clear_availability_cache(
+            self.organizer.id,
+            cache_type='blocked_time_change',
+            start_date=affected_date.isoformat(),
+            end_date=affected_date.isoformat()
+        )
+        
+        chunks = engine.cache_backend.get_chunks(
+            self.organizer, self.event_type, [week_start, week_start + timedelta(days=7)]
+        )
+        self.assertNotIn(week_start, chunks)
+        self.assertIn(week_start + timedelta(days=7), chunks)
+    
+    def test_precompute_limited_to_affected_dates(self):
+        """Test a targeted precompute recomputes only the weeks a change touched."""
+        from unittest import mock
+        from .engine import AvailabilityEngine
+        from .tasks import precompute_availability_cache
+        
+        today = timezone.now().date()
+        next_week = today - timedelta(days=today.weekday()) + timedelta(days=7)
+        affected_date = next_week + timedelta(days=3)
+        
+        with mock.patch.object(
+            AvailabilityEngine, 'compute_chunks', autospec=True, side_effect=AvailabilityEngine.compute_chunks
+        ) as compute_chunks:
+            precompute_availability_cache(
+                self.organizer.id, date_ranges=[[affected_date.isoformat(), affected_date.isoformat()]]
+            )
+        
+        computed_weeks = [week for call in compute_chunks.call_args_list for week in call.args[3]]
+        self.assertEqual(computed_weeks, [next_week])
+    
+    def test_scheduled_refresh_skips_unchanged_inputs(self):
+        """Test the periodic refresh recomputes only organizers whose inputs changed."""
+        from .tasks import precompute_availability_cache
+        
+        self.assertTrue(precompute_availability_cache(self.organizer.id, skip_unchanged=True).startswith('Precomputed'))
+        self.assertTrue(precompute_availability_cache(self.organizer.id, skip_unchanged=True).startswith('Skipped'))
+        
+        DateOverrideRule.objects.create(
+            organizer=self.organizer,
+            date=self.start_date,
+            is_available=False
+        )
+        self.assertTrue(precompute_availability_cache(self.organizer.id, skip_unchanged=True).startswith('Precomputed'))
+    
+    def test_refresh_shards_prioritize_traffic(self):
+        """Test organizers with recent public page traffic are refreshed first."""
+        from .scheduler import get_refresh_shards, record_public_page_view
+        
+        busy_organizer = User.objects.create_user(email='engine-busy@test.com', password='testpass123')
+        for _ in range(3):
+            record_public_page_view(busy_organizer.id)
+        
+        shards = get_refresh_shards([self.organizer.id, busy_organizer.id], 1)
+        self.assertEqual(shards, [[busy_organizer.id], [self.organizer.id]])
+    
+    def test_undated_change_bumps_generation(self):
+        """Test a rule change retires every chunk with one generation bump."""
+        from .engine import get_availability_engine
+        from .tasks import clear_availability_cache
+        
+        engine = get_availability_engine()
+        week_start = self.start_date - timedelta(days=self.start_date.weekday()) + timedelta(days=7)
+        weeks = [week_start, week_start + timedelta(days=7)]
+        
+        # A chunk computed before the change but written after it
+        stale_generation = engine.cache_backend.generation(self.organizer, self.event_type)
+        stale_chunks = engine.compute_chunks(self.organizer, self.event_type, weeks)
+        
+        engine.warm(self.organizer, self.event_type, week_start, week_start + timedelta(days=13))
+        clear_availability_cache(self.organizer.id, cache_type='availability_rule_change')
+        engine.cache_backend.set_chunks(self.organizer, self.event_type, stale_chunks, generation=stale_generation)
+        
+        self.assertNotEqual(engine.cache_backend.generation(self.organizer, self.event_type), stale_generation)
+        self.assertEqual(engine.cache_backend.get_chunks(self.organizer, self.event_type, weeks), {})
+    
+    def test_invalidations_are_debounced_and_coalesced(self):
+        """Test bursts of changes schedule one flush that clears only the touched weeks."""
+        from unittest import mock
+        from .engine import get_availability_engine
+        from .tasks import flush_cache_invalidations
+        from .utils import get_dirty_organizers
+        
+        # Flush the changes recorded while setting up
+        BufferTime.objects.create(organizer=self.organizer)
+        flush_cache_invalidations(self.organizer.id)
+        
+        engine = get_availability_engine()
+        week_start = self.start_date - timedelta(days=self.start_date.weekday()) + timedelta(days=7)
+        engine.warm(self.organizer, self.event_type, week_start, week_start + timedelta(days=20))
+        
+        paris = ZoneInfo('Europe/Paris')
+        with mock.patch.object(flush_cache_invalidations, 'apply_async') as apply_async:
+            for day in (1, 2, 3):
+                block_start = datetime.combine(week_start + timedelta(days=day), time(9, 0), tzinfo=paris)
+                BlockedTime.objects.create(
+                    organizer=self.organizer,
+                    start_datetime=block_start,
+                    end_datetime=block_start + timedelta(hours=1)
+                )
+        
+        self.assertEqual(apply_async.call_count, 1)
+        self.assertIn(str(self.organizer.id), get_dirty_organizers())
+        
+        # Nothing is invalidated until the window is flushed
+        weeks = [week_start, week_start + timedelta(days=7), week_start + timedelta(days=14)]
+        self.assertEqual(len(engine.cache_backend.get_chunks(self.organizer, self.event_type, weeks)), 3)
+        
+        flush_cache_invalidations(self.organizer.id)
+        
+        chunks = engine.cache_backend.get_chunks(self.organizer, self.event_type, weeks)
+        self.assertNotIn(week_start, chunks)
+        self.assertIn(week_start + timedelta(days=14), chunks)
+        self.assertNotIn(str(self.organizer.id), get_dirty_organizers())
+    
+    def test_process_dirty_cache_flags_drains_in_bounded_batches(self):
+        """Test the beat task flushes the oldest dirty organizers, one batch at a time."""
+        from django.test import override_settings
+        from .tasks import process_dirty_cache_flags
+        from .utils import get_dirty_organizers, mark_cache_dirty, pop_dirty_changes
+        
+        other_organizer = User.objects.create_user(email='engine-other@test.com', password='testpass123')
+        for organizer_id in get_dirty_organizers():
+            pop_dirty_changes(organizer_id)
+        
+        mark_cache_dirty(self.organizer.id, 'buffer_time_change')
+        mark_cache_dirty(other_organizer.id, 'buffer_time_change')
+        mark_cache_dirty(self.organizer.id, 'date_override_change', affected_date=self.start_date.isoformat())
+        self.assertEqual(get_dirty_organizers(), [str(self.organizer.id), str(other_organizer.id)])
+        
+        with override_settings(AVAILABILITY_CACHE_DEBOUNCE_SECONDS=0):
+            process_dirty_cache_flags(batch_size=1, max_batches=1)
+            self.assertEqual(get_dirty_organizers(), [str(other_organizer.id)])
+            
+            process_dirty_cache_flags(batch_size=1)
+            self.assertEqual(get_dirty_organizers(), [])
+    
+    def test_public_slots_api_serializes_slot_set(self):
+        """Test the public slots endpoint returns serialized slots."""
+        from rest_framework.test import APIRequestFactory
+        from apps.events.views import get_available_slots_api
+        
+        request = APIRequestFactory().get('/', {
+            'start_date': self.start_date.isoformat(),
+            'end_date': (self.start_date + timedelta(days=1)).isoformat(),
+            'timezone': 'America/Chicago'
+        })
+        response = get_available_slots_api(
+            request, self.profile.organizer_slug, self.event_type.event_type_slug
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_slots'], len(response.data['slots']))
+        self.assertGreater(response.data['total_slots'], 0)
+        self.assertIn('local_start_time', response.data['slots'][0])
+    
+    def test_local_cache_tier_serves_hot_chunks(self):
+        """Test public pages read chunks from the process-local cache in front of Redis."""
+        from unittest import mock
+        from django.core.cache import cache
+        from .engine import DjangoCacheBackend, get_availability_engine, invalidate_availability_chunks
+        from .local_cache import get_local_cache
+        
+        get_local_cache().clear()
+        backend = DjangoCacheBackend(local_cache=get_local_cache())
+        engine = get_availability_engine(cache_backend=backend)
+        engine.warm(self.organizer, self.event_type, self.start_date, self.start_date + timedelta(days=6))
+        
+        week_starts = [self.start_date - timedelta(days=self.start_date.weekday())]
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as get_many:
+            self.assertEqual(len(backend.get_chunks(self.organizer, self.event_type, week_starts)), 1)
+        self.assertEqual(get_many.call_count, 0)
+        
+        # A generation bump in this process evicts the local generation at once
+        invalidate_availability_chunks(self.organizer, event_type_ids=[self.event_type.id])
+        self.assertEqual(backend.get_chunks(self.organizer, self.event_type, week_starts), {})
+    
+    def test_concurrent_miss_serves_stale_chunks(self):
+        """Test a miss on weeks another request is computing serves their stale chunks."""
+        from unittest import mock
+        from django.core.cache import cache
+        from .engine import AvailabilityEngine, get_availability_engine
+        from .utils import get_chunk_lock_key, get_week_starts
+        
+        engine = get_availability_engine()
+        end_date = self.start_date + timedelta(days=6)
+        fresh = engine.get_available_slots(self.organizer, self.event_type, self.start_date, end_date)
+        
+        # Invalidate, then hold the lock as if another request were recomputing
+        engine.cache_backend.invalidate_all(self.organizer)
+        week_starts = get_week_starts(self.start_date, end_date)
+        generation = engine.cache_backend.generation(self.organizer, self.event_type)
+        cache.add(get_chunk_lock_key(self.organizer.id, self.event_type.id, week_starts, generation), True)
+        
+        with mock.patch.object(AvailabilityEngine, 'compute_chunks') as compute_chunks:
+            stale = engine.get_available_slots(self.organizer, self.event_type, self.start_date, end_date)
+        
+        compute_chunks.assert_not_called()
+        self.assertEqual(len(stale['slots']), len(fresh['slots']))
+    
+    def test_local_lru_cache_evicts_and_expires(self):
+        """Test the local cache drops the least recently used and expired entries."""
+        from .local_cache import LocalLRUCache
+        
+        local_cache = LocalLRUCache(2, 60)
+        local_cache.set('a', 1)
+        local_cache.set('b', 2)
+        local_cache.get('a')
+        local_cache.set('c', 3)
+        self.assertEqual(local_cache.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+        
+        local_cache.set('d', 4, timeout=0)
+        self.assertIsNone(local_cache.get('d'))
+    
+    def test_requests_record_cache_metrics(self):
+        """Test served requests are counted as misses then hits and exported."""
+        from .engine import get_availability_engine
+        from .metrics import get_metrics_summary, render_prometheus
+        
+        engine = get_availability_engine()
+        end_date = self.start_date + timedelta(days=6)
+        engine.get_available_slots(self.organizer, self.event_type, self.start_date, end_date)
+        engine.get_available_slots(self.organizer, self.event_type, self.start_date, end_date)
+        
+        summary = get_metrics_summary(organizer_id=self.organizer.id)
+        self.assertEqual(summary['cache_misses'], 1)
+        self.assertEqual(summary['cache_hits'], 1)
+        self.assertEqual(summary['cache_hit_rate'], 0.5)
+        self.assertGreater(summary['recomputes'], 0)
+        self.assertIn('cache_lookup', summary['average_stage_ms'])
+        
+        exposition = render_prometheus()
+        self.assertIn('# TYPE availability_cache_hits_total counter', exposition)
+        self.assertIn('availability_stage_seconds_total{stage="cache_lookup"}', exposition)
+    
+    def test_metrics_endpoint_is_not_throttled(self):
+        """Test token-authorized scrapes are not held to the anonymous rate."""
+        from unittest import mock
+        from django.test import override_settings
+        from django.urls import reverse
+        from rest_framework.test import APIClient
+        from rest_framework.throttling import AnonRateThrottle
+        
+        client = APIClient()
+        url = reverse('availability:availability-metrics')
+        
+        with override_settings(AVAILABILITY_METRICS_TOKEN='scrape-token'), \
+                mock.patch.dict(AnonRateThrottle.THROTTLE_RATES, {'anon': '2/hour'}):
+            for _ in range(3):
+                response = client.get(url, HTTP_AUTHORIZATION='Bearer scrape-token')
+                self.assertEqual(response.status_code, 200)
+            
+            response = client.get(url, HTTP_AUTHORIZATION='Bearer wrong-token')
+            self.assertEqual(response.status_code, 403)
+    
+    def test_external_busy_times_read_synced_store_while_fresh(self):
+        """Test fresh integrations skip the live fetch and stale ones fall back to it."""
+        from unittest import mock
+        from apps.integrations.models import CalendarIntegration
+        from .utils import get_external_busy_times
+        
+        integration = CalendarIntegration.objects.create(
+            organizer=self.organizer,
+            provider='google',
+            access_token='token',
+            busy_synced_at=timezone.now()
+        )
+        start_date = timezone.now().date()
+        end_date = start_date + timedelta(days=7)
+        live_event = {
+            'start_datetime': timezone.now() + timedelta(days=1),
+            'end_datetime': timezone.now() + timedelta(days=1, hours=1),
+            'summary': 'Live'
+        }
+        
+        with mock.patch('apps.integrations.google_client.GoogleCalendarClient') as client_class:
+            client_class.return_value.get_busy_times.return_value = [live_event]
+            
+            self.assertEqual(get_external_busy_times(self.organizer, start_date, end_date), [])
+            client_class.return_value.get_busy_times.assert_not_called()
+            
+            integration.busy_synced_at = timezone.now() - timedelta(hours=2)
+            integration.save(update_fields=['busy_synced_at'])
+            busy_times = get_external_busy_times(self.organizer, start_date, end_date)
+        
+        self.assertEqual(len(busy_times), 1)
+        self.assertEqual(busy_times[0]['source'], 'google_calendar')
+
+
+class AvailabilityBenchmarkTestCase(TestCase):
+    """Test the availability benchmark suite on a small synthetic organizer."""
+    
+    def test_benchmark_command_emits_json(self):
+        """Test the benchmark command measures every target on both cache paths."""
+        import json
+        from io import StringIO
+        from django.core.management import call_command
+        
+        out = StringIO()
+        call_command(
+            'benchmark_availability', days=3, rules=7, overrides=1, recurring_blocks=1,
+            blocked_times=2, bookings=3, group_bookings=2, external_busy=2, repeat=1, stdout=out
+        )
+        results = json.loads(out.getvalue())
+        
+        self.assertEqual(results['scenario']['counts']['bookings'], 3)
+        self.assertEqual(set(results['results']), {
+            'calculate_available_slots', 'calculate_available_slots_group',
+            'availability_calculator', 'calculated_slots_view'
+        })
+        for result in results['results'].values():
+            self.assertGreater(result['slots'], 0)
+            self.assertGreater(result['cache_miss']['queries']['min'], 0)
+            self.assertIn('peak_bytes', result['cache_hit']['allocations'])
+        
+        # Synthetic data is rolled back
+        self.assertFalse(User.objects.filter(email__endswith='@benchmark.local').exists())
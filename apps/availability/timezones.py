@@ -0,0 +1,149 @@
+"""
+Shared timezone service for availability calculations.
+
+``get_zone`` caches ZoneInfo lookups for hot helpers. ``get_transition_table``
+precomputes the UTC offset transitions of a zone over a window, so converting
+many UTC instants into local wall-clock values (hour, date, DST flag) is a
+bisect into a handful of entries instead of a full ``astimezone()`` call per
+slot per zone.
+"""
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Offsets are sampled at this step and transitions located by bisection.
+# Real zones never change offset twice within this step.
+SAMPLE_STEP_SECONDS = 6 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def get_zone(timezone_name):
+    """
+    Return the ZoneInfo for an IANA timezone name.
+
+    Raises:
+        ZoneInfoNotFoundError: If the timezone does not exist
+    """
+    return ZoneInfo(timezone_name)
+
+
+def _offsets_at(zone, epoch_seconds):
+    """Return (utcoffset, dst) in seconds for a zone at a UTC instant."""
+    local = (EPOCH + timedelta(seconds=epoch_seconds)).astimezone(zone)
+    return int(local.utcoffset().total_seconds()), int(local.dst().total_seconds())
+
+
+class TransitionTable:
+    """
+    UTC offsets of one zone over a window of UTC epoch seconds.
+
+    ``points[i]`` is the instant from which ``offsets[i]`` and ``dst[i]``
+    apply, up to ``points[i + 1]``. Instants outside the window are
+    clamped to the first or last entry, so callers should request a
+    window covering every instant they convert.
+    """
+
+    __slots__ = ('timezone_name', 'points', 'offsets', 'dst')
+
+    def __init__(self, timezone_name, start_seconds, end_seconds):
+        zone = get_zone(timezone_name)
+        self.timezone_name = timezone_name
+        self.points = array('q', [start_seconds])
+        first_offset, first_dst = _offsets_at(zone, start_seconds)
+        self.offsets = array('i', [first_offset])
+        self.dst = array('i', [first_dst])
+
+        previous = start_seconds
+        previous_state = (first_offset, first_dst)
+
+        while previous < end_seconds:
+            sample = min(previous + SAMPLE_STEP_SECONDS, end_seconds)
+            state = _offsets_at(zone, sample)
+
+            if state != previous_state:
+                # Bisect down to the exact second the offset changes
+                low, high = previous, sample
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if _offsets_at(zone, middle) == previous_state:
+                        low = middle
+                    else:
+                        high = middle
+
+                self.points.append(high)
+                self.offsets.append(state[0])
+                self.dst.append(state[1])
+                previous_state = state
+
+            previous = sample
+
+    def __len__(self):
+        return len(self.points)
+
+    def index(self, epoch_seconds):
+        """Return the table entry that applies at a UTC instant."""
+        return max(bisect_right(self.points, epoch_seconds) - 1, 0)
+
+    def utcoffset(self, epoch_seconds):
+        """Return the UTC offset in seconds at a UTC instant."""
+        return self.offsets[self.index(epoch_seconds)]
+
+    def is_dst(self, epoch_seconds):
+        """Return whether DST is in effect at a UTC instant."""
+        return self.dst[self.index(epoch_seconds)] != 0
+
+    def local_seconds(self, epoch_seconds):
+        """Return local wall-clock time as seconds since the local epoch."""
+        return epoch_seconds + self.offsets[self.index(epoch_seconds)]
+
+    def local_hour(self, epoch_seconds):
+        """Return the local hour (0-23) at a UTC instant."""
+        return self.local_seconds(epoch_seconds) // 3600 % 24
+
+    def local_day(self, epoch_seconds):
+        """Return the local calendar day (days since 1970-01-01) at a UTC instant."""
+        return self.local_seconds(epoch_seconds) // SECONDS_PER_DAY
+
+
+@lru_cache(maxsize=512)
+def _cached_transition_table(timezone_name, first_day, last_day):
+    return TransitionTable(
+        timezone_name, first_day * SECONDS_PER_DAY, (last_day + 1) * SECONDS_PER_DAY
+    )
+
+
+def get_transition_table(timezone_name, start_seconds, end_seconds):
+    """
+    Return the (cached) transition table of a zone covering a UTC window.
+
+    The window is widened to whole UTC days plus one day either side, so
+    requests for overlapping ranges share tables.
+
+    Args:
+        timezone_name: IANA timezone string
+        start_seconds: First UTC epoch second to convert
+        end_seconds: Last UTC epoch second to convert
+
+    Returns:
+        TransitionTable
+    """
+    return _cached_transition_table(
+        timezone_name,
+        start_seconds // SECONDS_PER_DAY - 1,
+        end_seconds // SECONDS_PER_DAY + 1
+    )
+
+
+def to_epoch_seconds(value):
+    """Convert an aware datetime to integer UTC epoch seconds."""
+    return (value - EPOCH) // timedelta(seconds=1)
+
+
+def from_epoch_seconds(seconds):
+    """Convert UTC epoch seconds back to an aware UTC datetime."""
+    return EPOCH + timedelta(seconds=seconds)
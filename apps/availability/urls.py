@@ -28,6 +28,7 @@ urlpatterns = [
     
     # Statistics and Management
     path('stats/', views.availability_stats, name='availability-stats'),
+    path('metrics/', views.availability_metrics, name='availability-metrics'),
     path('cache/clear/', views.clear_availability_cache_manual, name='clear-cache'),
     path('cache/precompute/', views.precompute_availability_cache_manual, name='precompute-cache'),
     
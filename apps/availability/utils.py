@@ -1,12 +1,14 @@
 from datetime import datetime, timedelta, time
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
-from django.db import models
-from zoneinfo import ZoneInfo
-from .models import AvailabilityRule, BlockedTime, BufferTime, DateOverrideRule, RecurringBlockedTime
-from apps.events.models import Booking, EventTypeAvailabilityCache
+from .busy_index import (
+    BookingIntervalIndex, IntervalSet, sweep_slot_starts, confirmed_attendee_count
+)
+from .slot_set import fairness_score_for_hour
+from .timezones import SECONDS_PER_DAY, get_transition_table, get_zone, to_epoch_seconds
 import logging
 import time as time_module
-from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,12 @@ def get_external_busy_times(organizer, start_date, end_date):
     """
     Get busy times from external calendar integrations.
     
+    Calendar sync materializes external events as ``BlockedTime`` rows, which
+    availability already loads. With AVAILABILITY_EXTERNAL_BUSY_SOURCE set to
+    'synced', integrations whose synced store is fresh (see
+    ``CalendarIntegration.has_fresh_busy_store``) contribute nothing here;
+    only stale integrations fall back to a live API fetch.
+    
     Args:
         organizer: User instance
         start_date: Start date for busy time search
@@ -35,7 +43,12 @@ def get_external_busy_times(organizer, start_date, end_date):
             sync_enabled=True
         )
         
+        use_synced_store = settings.AVAILABILITY_EXTERNAL_BUSY_SOURCE == 'synced'
+        
         for integration in calendar_integrations:
+            if use_synced_store and integration.has_fresh_busy_store(end_date):
+                continue
+            
             try:
                 if integration.provider == 'google':
                     from apps.integrations.google_client import GoogleCalendarClient
@@ -48,6 +61,9 @@ def get_external_busy_times(organizer, start_date, end_date):
                 else:
                     continue
                 
+                if use_synced_store:
+                    logger.info(f"Synced busy times of {integration.provider} integration {integration.id} are stale, fetched live")
+                
                 # Convert to our format
                 for event in events:
                     busy_times.append({
@@ -93,10 +109,12 @@ class PerformanceProfiler:
             self.metrics[name] = time_module.time() - self.start_time
 
 def calculate_available_slots(organizer, event_type, start_date, end_date, invitee_timezone='UTC', 
-                            attendee_count=1, invitee_timezones=None):
+                            attendee_count=1, invitee_timezones=None, engine=None, use_cache=True):
     """
     Enhanced calculate available time slots with comprehensive conflict resolution.
     
+    Runs the configured ``AvailabilityEngine`` (see ``apps.availability.engine``).
+    
     Args:
         organizer: User instance (organizer)
         event_type: EventType instance
@@ -105,216 +123,35 @@ def calculate_available_slots(organizer, event_type, start_date, end_date, invit
         invitee_timezone: IANA timezone string (primary invitee)
         attendee_count: Number of attendees for this booking (default: 1)
         invitee_timezones: List of IANA timezone strings for multi-invitee scheduling
+        engine: Slot engine, 'sweep' or 'loop' (default: AVAILABILITY_SLOT_ENGINE)
+        use_cache: Whether to read and write the availability cache
     
     Returns:
         Dict with 'slots', 'warnings', and performance metrics
     """
-    with PerformanceProfiler(f"calculate_available_slots for {organizer.email}") as profiler:
-        warnings = []
-        
-        # Validate timezone strings
-        if not validate_timezone(invitee_timezone):
-            raise ValueError(f"Invalid timezone: {invitee_timezone}")
-        
-        if invitee_timezones:
-            valid_timezones = []
-            for tz in invitee_timezones:
-                if validate_timezone(tz):
-                    valid_timezones.append(tz)
-                else:
-                    warnings.append(f"Invalid timezone '{tz}' was skipped")
-                    logger.warning(f"Invalid timezone '{tz}' provided for multi-invitee scheduling")
-            invitee_timezones = valid_timezones
-        
-        profiler.checkpoint('timezone_validation')
-        
-        # Check cache first
-        cache_key = f"availability:{organizer.id}:{event_type.id}:{start_date}:{end_date}:{invitee_timezone}:{attendee_count}"
-        cached_result = cache.get(cache_key)
-        
-        if cached_result and not _is_cache_dirty(organizer, start_date, end_date):
-            profiler.checkpoint('cache_hit')
-            cached_result['performance_metrics'] = profiler.metrics
-            cached_result['cache_hit'] = True
-            return cached_result
-    
-        # Get organizer's timezone
-        organizer_timezone = organizer.profile.timezone_name
-        
-        # Get availability rules that apply to this event type
-        availability_rules = AvailabilityRule.objects.filter(
-            organizer=organizer,
-            is_active=True
-        ).filter(
-            models.Q(event_types__isnull=True) | models.Q(event_types=event_type)
-        ).distinct()
-        
-        profiler.checkpoint('rules_query')
-        
-        # Get date overrides that apply to this event type
-        date_overrides = DateOverrideRule.objects.filter(
-            organizer=organizer,
-            is_active=True,
-            date__gte=start_date,
-            date__lte=end_date
-        ).filter(
-            models.Q(event_types__isnull=True) | models.Q(event_types=event_type)
-        ).distinct()
-        
-        # Get blocked times
-        blocked_times = BlockedTime.objects.filter(
-            organizer=organizer,
-            is_active=True,
-            start_datetime__date__lte=end_date,
-            end_datetime__date__gte=start_date
-        )
-        
-        # Get recurring blocked times
-        recurring_blocks = RecurringBlockedTime.objects.filter(
-            organizer=organizer,
-            is_active=True
-        )
-        
-        # Get existing bookings (ALL event types for this organizer)
-        existing_bookings = Booking.objects.filter(
-            organizer=organizer,
-            status='confirmed',
-            start_time__date__lte=end_date,
-            end_time__date__gte=start_date
-        ).select_related('event_type')
-        
-        # Get external calendar busy times
-        external_busy_times = get_external_busy_times(organizer, start_date, end_date)
-        
-        # Get buffer settings
-        buffer_settings, _ = BufferTime.objects.get_or_create(organizer=organizer)
-        
-        profiler.checkpoint('data_queries')
-        
-        available_slots = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            # Skip past dates
-            if current_date < timezone.now().date():
-                current_date += timedelta(days=1)
-                continue
-            
-            # Check if event type can be booked on this date
-            if not event_type.can_book_on_date(current_date):
-                current_date += timedelta(days=1)
-                continue
-            
-            # Check for date-specific overrides first
-            date_override = date_overrides.filter(date=current_date).first()
-            
-            if date_override:
-                if not date_override.is_available:
-                    # Entire day is blocked
-                    current_date += timedelta(days=1)
-                    continue
-                else:
-                    # Use override times instead of regular rules
-                    slots = generate_slots_for_override(
-                        override=date_override,
-                        date=current_date,
-                        event_type=event_type,
-                        organizer_timezone=organizer_timezone,
-                        invitee_timezone=invitee_timezone,
-                        blocked_times=blocked_times,
-                        recurring_blocks=recurring_blocks,
-                        existing_bookings=existing_bookings,
-                        external_busy_times=external_busy_times,
-                        buffer_settings=buffer_settings,
-                        attendee_count=attendee_count
-                    )
-                    available_slots.extend(slots)
-            else:
-                # Use regular availability rules
-                day_of_week = current_date.weekday()  # 0=Monday, 6=Sunday
-                day_rules = availability_rules.filter(day_of_week=day_of_week)
-                
-                for rule in day_rules:
-                    if rule.applies_to_event_type(event_type):
-                        slots = generate_slots_for_rule(
-                            rule=rule,
-                            date=current_date,
-                            event_type=event_type,
-                            organizer_timezone=organizer_timezone,
-                            invitee_timezone=invitee_timezone,
-                            blocked_times=blocked_times,
-                            recurring_blocks=recurring_blocks,
-                            existing_bookings=existing_bookings,
-                            external_busy_times=external_busy_times,
-                            buffer_settings=buffer_settings,
-                            attendee_count=attendee_count
-                        )
-                        available_slots.extend(slots)
-            
-            current_date += timedelta(days=1)
-        
-        profiler.checkpoint('slot_generation')
-        
-        # Merge overlapping or adjacent slots
-        available_slots = merge_overlapping_slots(available_slots)
-        
-        # Sort slots by start time
-        available_slots.sort(key=lambda x: x['start_time'])
-        
-        # Apply DST safety checks
-        available_slots = calculate_dst_safe_time_slots(
-            organizer_timezone, invitee_timezone, available_slots
-        )
-        
-        profiler.checkpoint('slot_processing')
-        
-        # Handle multi-invitee timezone intersection if needed
-        if invitee_timezones and len(invitee_timezones) > 1:
-            available_slots = calculate_multi_invitee_intersection(
-                available_slots, invitee_timezones, invitee_timezone, organizer
-            )
-        
-        profiler.checkpoint('multi_invitee_processing')
-        
-        result = {
-            'slots': available_slots,
-            'warnings': warnings,
-            'cache_hit': False,
-            'total_slots': len(available_slots),
-            'performance_metrics': profiler.metrics
-        }
-        
-        # Cache the result (for single-day requests)
-        if start_date == end_date and len(available_slots) > 0:
-            cache.set(cache_key, result, timeout=900)  # Cache for 15 minutes
-        
-        return result
-
-
-def _is_cache_dirty(organizer, start_date, end_date):
-    """Check if cache is dirty for the given date range."""
-    # Check if any cache entries are marked as dirty
-    dirty_entries = EventTypeAvailabilityCache.objects.filter(
-        organizer=organizer,
-        date__gte=start_date,
-        date__lte=end_date,
-        is_dirty=True
-    ).exists()
-    
-    return dirty_entries
+    from .engine import get_availability_engine
+    
+    return get_availability_engine(slot_engine=engine).get_available_slots(
+        organizer, event_type, start_date, end_date,
+        invitee_timezone=invitee_timezone,
+        attendee_count=attendee_count,
+        invitee_timezones=invitee_timezones,
+        use_cache=use_cache
+    )
 
 
 def generate_slots_for_rule(rule, date, event_type, organizer_timezone, invitee_timezone, 
                           blocked_times, recurring_blocks, existing_bookings, 
-                          external_busy_times, buffer_settings, attendee_count=1):
+                          external_busy_times, buffer_settings, attendee_count=1,
+                          forbidden_starts=None, daily_booking_counts=None):
     """
     Generate available slots for a specific availability rule on a specific date.
     """
     slots = []
     
     # Create timezone objects
-    org_tz = ZoneInfo(organizer_timezone)
-    invitee_tz = ZoneInfo(invitee_timezone)
+    org_tz = get_zone(organizer_timezone)
+    invitee_tz = get_zone(invitee_timezone)
     
     # Handle midnight-crossing rules
     if rule.spans_midnight():
@@ -323,7 +160,8 @@ def generate_slots_for_rule(rule, date, event_type, organizer_timezone, invitee_
         slots.extend(_generate_slots_for_time_range(
             date, rule.start_time, time(23, 59, 59),
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         ))
         
         # Part 2: midnight to end_time (next day)
@@ -331,14 +169,16 @@ def generate_slots_for_rule(rule, date, event_type, organizer_timezone, invitee_
         slots.extend(_generate_slots_for_time_range(
             next_date, time(0, 0), rule.end_time,
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         ))
     else:
         # Normal rule within same day
         slots.extend(_generate_slots_for_time_range(
             date, rule.start_time, rule.end_time,
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         ))
     
     return slots
@@ -346,7 +186,8 @@ def generate_slots_for_rule(rule, date, event_type, organizer_timezone, invitee_
 
 def generate_slots_for_override(override, date, event_type, organizer_timezone, invitee_timezone,
                               blocked_times, recurring_blocks, existing_bookings, 
-                              external_busy_times, buffer_settings, attendee_count=1):
+                              external_busy_times, buffer_settings, attendee_count=1,
+                              forbidden_starts=None, daily_booking_counts=None):
     """
     Generate available slots for a date override rule.
     """
@@ -354,8 +195,8 @@ def generate_slots_for_override(override, date, event_type, organizer_timezone,
         return []
     
     # Create timezone objects
-    org_tz = ZoneInfo(organizer_timezone)
-    invitee_tz = ZoneInfo(invitee_timezone)
+    org_tz = get_zone(organizer_timezone)
+    invitee_tz = get_zone(invitee_timezone)
     
     # Handle midnight-crossing overrides
     if override.spans_midnight():
@@ -366,7 +207,8 @@ def generate_slots_for_override(override, date, event_type, organizer_timezone,
         slots.extend(_generate_slots_for_time_range(
             date, override.start_time, time(23, 59, 59),
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         ))
         
         # Part 2: midnight to end_time (next day)
@@ -374,7 +216,8 @@ def generate_slots_for_override(override, date, event_type, organizer_timezone,
         slots.extend(_generate_slots_for_time_range(
             next_date, time(0, 0), override.end_time,
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         ))
         
         return slots
@@ -383,15 +226,21 @@ def generate_slots_for_override(override, date, event_type, organizer_timezone,
         return _generate_slots_for_time_range(
             date, override.start_time, override.end_time,
             event_type, org_tz, invitee_tz, blocked_times, recurring_blocks,
-            existing_bookings, external_busy_times, buffer_settings, attendee_count
+            existing_bookings, external_busy_times, buffer_settings, attendee_count,
+            forbidden_starts, daily_booking_counts
         )
 
 
 def _generate_slots_for_time_range(date, start_time, end_time, event_type, org_tz, invitee_tz,
                                  blocked_times, recurring_blocks, existing_bookings, 
-                                 external_busy_times, buffer_settings, attendee_count):
+                                 external_busy_times, buffer_settings, attendee_count,
+                                 forbidden_starts=None, daily_booking_counts=None):
     """
     Internal helper to generate slots for a specific time range on a specific date.
+    
+    When ``forbidden_starts`` (merged ranges from
+    ``BusyIntervalIndex.forbidden_start_ranges``) is given, slots are placed
+    by the sweep engine instead of testing every candidate start.
     """
     import time as time_module
     start_computation = time_module.time()
@@ -419,71 +268,89 @@ def _generate_slots_for_time_range(date, start_time, end_time, event_type, org_t
     else:
         slot_interval = timedelta(minutes=getattr(buffer_settings, 'slot_interval_minutes', 15))
     
-    # Generate slots
-    current_slot_start = range_start_utc
-    
-    while current_slot_start + slot_duration <= range_end_utc:
-        slot_end = current_slot_start + slot_duration
-        
-        # Check if this slot conflicts with blocked times
-        if is_slot_blocked(current_slot_start, slot_end, blocked_times):
-            current_slot_start += slot_interval
-            continue
-        
-        # Check if this slot conflicts with recurring blocked times
-        if is_slot_blocked_by_recurring(current_slot_start, slot_end, recurring_blocks, org_tz):
-            current_slot_start += slot_interval
-            continue
-        
-        # Check if this slot conflicts with external calendar events
-        if is_slot_blocked_by_external_calendar(current_slot_start, slot_end, external_busy_times):
-            current_slot_start += slot_interval
-            continue
-        
-        # Check if this slot conflicts with existing bookings (including buffers)
-        buffered_start = current_slot_start - buffer_before
-        buffered_end = slot_end + buffer_after
-        
-        if is_slot_conflicting_with_bookings(buffered_start, buffered_end, existing_bookings, event_type, attendee_count):
-            current_slot_start += slot_interval
-            continue
-        
-        # Check minimum booking notice
-        min_notice = timedelta(minutes=event_type.min_scheduling_notice)
-        if current_slot_start < timezone.now() + min_notice:
-            current_slot_start += slot_interval
-            continue
-        
-        # Check maximum booking advance
-        max_advance = timedelta(minutes=event_type.max_scheduling_horizon)
-        if current_slot_start > timezone.now() + max_advance:
-            break
-        
-        # Check daily booking limits
-        if _exceeds_daily_booking_limit(event_type, current_slot_start):
-            current_slot_start += slot_interval
-            continue
+    min_notice = timedelta(minutes=event_type.min_scheduling_notice)
+    max_advance = timedelta(minutes=event_type.max_scheduling_horizon)
+    
+    if forbidden_starts is not None:
+        # Sweep engine: one pass over the window, jumping over busy ranges
+        now = timezone.now()
+        slot_starts = sweep_slot_starts(
+            range_start_utc, range_end_utc, slot_duration, slot_interval,
+            max(slot_interval, minimum_gap), forbidden_starts,
+            earliest_start=now + min_notice,
+            latest_start=now + max_advance,
+            accept=lambda candidate: not _exceeds_daily_booking_limit(
+                event_type, candidate, org_tz, daily_booking_counts
+            )
+        )
+    else:
+        slot_starts = []
+        current_slot_start = range_start_utc
         
-        # This slot is available
+        while current_slot_start + slot_duration <= range_end_utc:
+            slot_end = current_slot_start + slot_duration
+            
+            # Check if this slot conflicts with blocked times
+            if is_slot_blocked(current_slot_start, slot_end, blocked_times):
+                current_slot_start += slot_interval
+                continue
+            
+            # Check if this slot conflicts with recurring blocked times
+            if is_slot_blocked_by_recurring(current_slot_start, slot_end, recurring_blocks, org_tz):
+                current_slot_start += slot_interval
+                continue
+            
+            # Check if this slot conflicts with external calendar events
+            if is_slot_blocked_by_external_calendar(current_slot_start, slot_end, external_busy_times):
+                current_slot_start += slot_interval
+                continue
+            
+            # Check if this slot conflicts with existing bookings (including buffers)
+            buffered_start = current_slot_start - buffer_before
+            buffered_end = slot_end + buffer_after
+            
+            if is_slot_conflicting_with_bookings(buffered_start, buffered_end, existing_bookings, event_type, attendee_count):
+                current_slot_start += slot_interval
+                continue
+            
+            # Check minimum booking notice
+            if current_slot_start < timezone.now() + min_notice:
+                current_slot_start += slot_interval
+                continue
+            
+            # Check maximum booking advance
+            if current_slot_start > timezone.now() + max_advance:
+                break
+            
+            # Check daily booking limits
+            if _exceeds_daily_booking_limit(event_type, current_slot_start, org_tz, daily_booking_counts):
+                current_slot_start += slot_interval
+                continue
+            
+            # This slot is available
+            slot_starts.append(current_slot_start)
+            
+            # Move to next slot (15-minute intervals + minimum gap)
+            next_increment = max(slot_interval, minimum_gap)
+            current_slot_start += next_increment
+    
+    for slot_start in slot_starts:
+        slot_end = slot_start + slot_duration
         slot = {
-            'start_time': current_slot_start,
+            'start_time': slot_start,
             'end_time': slot_end,
             'duration_minutes': event_type.duration,
             'available_spots': _get_available_spots_for_slot(
-                event_type, current_slot_start, slot_end, existing_bookings, attendee_count
+                event_type, slot_start, slot_end, existing_bookings, attendee_count
             ),
         }
         
         # Add localized times for display
-        if invitee_timezone != 'UTC':
-            slot['local_start_time'] = current_slot_start.astimezone(invitee_tz)
+        if invitee_tz.key != 'UTC':
+            slot['local_start_time'] = slot_start.astimezone(invitee_tz)
             slot['local_end_time'] = slot_end.astimezone(invitee_tz)
         
         slots.append(slot)
-        
-        # Move to next slot (15-minute intervals + minimum gap)
-        next_increment = max(slot_interval, minimum_gap)
-        current_slot_start += next_increment
     
     # Log computation time for performance monitoring
     computation_time = time_module.time() - start_computation
@@ -495,6 +362,9 @@ def _generate_slots_for_time_range(date, start_time, end_time, event_type, org_t
 
 def is_slot_blocked_by_external_calendar(start_time, end_time, external_busy_times):
     """Check if a time slot conflicts with external calendar events."""
+    if isinstance(external_busy_times, IntervalSet):
+        return external_busy_times.overlaps(start_time, end_time)
+    
     for busy_period in external_busy_times:
         busy_start = busy_period['start_time']
         busy_end = busy_period['end_time']
@@ -508,6 +378,9 @@ def is_slot_blocked_by_external_calendar(start_time, end_time, external_busy_tim
 
 def is_slot_blocked(start_time, end_time, blocked_times):
     """Check if a time slot conflicts with blocked times."""
+    if isinstance(blocked_times, IntervalSet):
+        return blocked_times.overlaps(start_time, end_time)
+    
     for blocked in blocked_times:
         blocked_start = blocked.start_datetime
         blocked_end = blocked.end_datetime
@@ -521,6 +394,9 @@ def is_slot_blocked(start_time, end_time, blocked_times):
 
 def is_slot_blocked_by_recurring(start_time, end_time, recurring_blocks, organizer_tz):
     """Check if a time slot conflicts with recurring blocked times."""
+    if isinstance(recurring_blocks, IntervalSet):
+        return recurring_blocks.overlaps(start_time, end_time)
+    
     for recurring_block in recurring_blocks:
         # Check if this recurring block applies to the date
         slot_date = start_time.astimezone(organizer_tz).date()
@@ -568,18 +444,10 @@ def is_slot_blocked_by_recurring(start_time, end_time, recurring_blocks, organiz
 def is_slot_conflicting_with_bookings(start_time, end_time, existing_bookings, event_type, attendee_count=1):
     """Check if a time slot conflicts with existing bookings across ALL event types."""
     # Get overlapping bookings
-    overlapping_bookings = []
-    for booking in existing_bookings:
-        # Apply booking's own buffer times
-        booking_buffer_before = timedelta(minutes=booking.event_type.buffer_time_before)
-        booking_buffer_after = timedelta(minutes=booking.event_type.buffer_time_after)
-        
-        buffered_booking_start = booking.start_time - booking_buffer_before
-        buffered_booking_end = booking.end_time + booking_buffer_after
-        
-        # Check for overlap using proper interval logic
-        if (start_time < buffered_booking_end and end_time > buffered_booking_start):
-            overlapping_bookings.append(booking)
+    if isinstance(existing_bookings, BookingIntervalIndex):
+        overlapping_bookings = existing_bookings.overlapping(start_time, end_time)
+    else:
+        overlapping_bookings = _find_overlapping_bookings(start_time, end_time, existing_bookings)
     
     # If no overlapping bookings, slot is available
     if not overlapping_bookings:
@@ -594,7 +462,7 @@ def is_slot_conflicting_with_bookings(start_time, end_time, existing_bookings, e
             booking.end_time == end_time):
             
             # Check if there's room in this specific booking
-            current_attendees = booking.attendees.filter(status='confirmed').count()
+            current_attendees = confirmed_attendee_count(booking)
             if current_attendees + attendee_count <= event_type.max_attendees:
                 continue  # This booking has capacity
         
@@ -604,23 +472,47 @@ def is_slot_conflicting_with_bookings(start_time, end_time, existing_bookings, e
     return False
 
 
-def _exceeds_daily_booking_limit(event_type, start_time):
-    """Check if booking would exceed daily limits."""
+def _find_overlapping_bookings(start_time, end_time, existing_bookings):
+    """Linear fallback for callers passing a plain list of bookings."""
+    overlapping_bookings = []
+    for booking in existing_bookings:
+        # Apply booking's own buffer times
+        booking_buffer_before = timedelta(minutes=booking.event_type.buffer_time_before)
+        booking_buffer_after = timedelta(minutes=booking.event_type.buffer_time_after)
+        
+        buffered_booking_start = booking.start_time - booking_buffer_before
+        buffered_booking_end = booking.end_time + booking_buffer_after
+        
+        # Check for overlap using proper interval logic
+        if (start_time < buffered_booking_end and end_time > buffered_booking_start):
+            overlapping_bookings.append(booking)
+    
+    return overlapping_bookings
+
+
+def _exceeds_daily_booking_limit(event_type, start_time, organizer_tz=None, daily_booking_counts=None):
+    """
+    Check if booking would exceed daily limits.
+    
+    Args:
+        event_type: EventType instance
+        start_time: UTC start of the candidate slot
+        organizer_tz: ZoneInfo of the organizer (resolved from the profile if omitted)
+        daily_booking_counts: Optional {local date: confirmed count} map preloaded
+            for the request; otherwise the counter row for the date is read
+    """
     if not event_type.max_bookings_per_day:
         return False
     
-    # Count existing bookings for this event type on this date
-    org_tz = ZoneInfo(event_type.organizer.profile.timezone_name)
-    booking_date = start_time.astimezone(org_tz).date()
+    if organizer_tz is None:
+        organizer_tz = get_zone(event_type.organizer.profile.timezone_name)
+    booking_date = start_time.astimezone(organizer_tz).date()
     
-    existing_count = Booking.objects.filter(
-        organizer=event_type.organizer,
-        event_type=event_type,
-        status='confirmed',
-        start_time__date=booking_date
-    ).count()
+    if daily_booking_counts is None:
+        from apps.events.utils import get_daily_booking_counts
+        daily_booking_counts = get_daily_booking_counts(event_type, booking_date, booking_date)
     
-    return existing_count >= event_type.max_bookings_per_day
+    return daily_booking_counts.get(booking_date, 0) >= event_type.max_bookings_per_day
 
 
 def _get_available_spots_for_slot(event_type, start_time, end_time, existing_bookings, requested_attendee_count):
@@ -630,6 +522,10 @@ def _get_available_spots_for_slot(event_type, start_time, end_time, existing_boo
     
     # Find existing booking at this exact time
     existing_booking = None
+    if isinstance(existing_bookings, BookingIntervalIndex):
+        existing_booking = existing_bookings.find_exact(event_type.id, start_time, end_time)
+        existing_bookings = ()
+    
     for booking in existing_bookings:
         if (booking.event_type.id == event_type.id and
             booking.start_time == start_time and
@@ -639,7 +535,7 @@ def _get_available_spots_for_slot(event_type, start_time, end_time, existing_boo
             break
     
     if existing_booking:
-        current_attendees = existing_booking.attendees.filter(status='confirmed').count()
+        current_attendees = confirmed_attendee_count(existing_booking)
         return max(0, event_type.max_attendees - current_attendees)
     
     return event_type.max_attendees
@@ -708,22 +604,28 @@ def calculate_dst_safe_time_slots(organizer_timezone, invitee_timezone, base_slo
         list: DST-safe slots with corrected times
     """
     try:
-        org_tz = ZoneInfo(organizer_timezone)
-        invitee_tz = ZoneInfo(invitee_timezone)
+        get_zone(organizer_timezone)
+        invitee_tz = get_zone(invitee_timezone)
+        
+        if not base_slots:
+            return []
+        
+        # One transition table per zone for the whole window, then a bisect per instant
+        window_start = to_epoch_seconds(min(slot['start_time'] for slot in base_slots))
+        window_end = to_epoch_seconds(max(slot['end_time'] for slot in base_slots))
+        org_table = get_transition_table(organizer_timezone, window_start, window_end)
+        invitee_table = get_transition_table(invitee_timezone, window_start, window_end)
         
         dst_safe_slots = []
         
         for slot in base_slots:
             start_time = slot['start_time']
             end_time = slot['end_time']
+            start_seconds = to_epoch_seconds(start_time)
             
             # Check if this slot crosses a DST boundary
-            start_local_org = start_time.astimezone(org_tz)
-            end_local_org = end_time.astimezone(org_tz)
-            
-            # Check for DST transition
-            start_dst = start_local_org.dst()
-            end_dst = end_local_org.dst()
+            start_dst = org_table.is_dst(start_seconds)
+            end_dst = org_table.is_dst(to_epoch_seconds(end_time))
             
             if start_dst != end_dst:
                 # DST transition during this slot - log warning
@@ -739,8 +641,8 @@ def calculate_dst_safe_time_slots(organizer_timezone, invitee_timezone, base_slo
             
             # Add DST information for debugging
             slot_copy['dst_info'] = {
-                'organizer_dst': bool(start_dst),
-                'invitee_dst': bool(start_time.astimezone(invitee_tz).dst()),
+                'organizer_dst': start_dst,
+                'invitee_dst': invitee_table.is_dst(start_seconds),
                 'dst_transition': start_dst != end_dst
             }
             
@@ -769,55 +671,61 @@ def calculate_multi_invitee_intersection(organizer_slots, invitee_timezones, pri
     if not invitee_timezones or len(invitee_timezones) <= 1:
         return organizer_slots
     
-    # Get reasonable hours from organizer's profile if available
-    if organizer and hasattr(organizer, 'profile'):
-        reasonable_start_hour = organizer.profile.reasonable_hours_start
-        reasonable_end_hour = organizer.profile.reasonable_hours_end
-    else:
-        reasonable_start_hour = 7
-        reasonable_end_hour = 22
+    reasonable_start_hour, reasonable_end_hour = _get_reasonable_hours(organizer)
+    
+    if not organizer_slots:
+        return []
+    
+    # Transition tables for the whole window replace per-slot astimezone() calls
+    window_start = to_epoch_seconds(min(slot['start_time'] for slot in organizer_slots))
+    window_end = to_epoch_seconds(max(slot['end_time'] for slot in organizer_slots))
+    tables = {}
+    
+    for tz_name in invitee_timezones:
+        try:
+            tables[tz_name] = get_transition_table(tz_name, window_start, window_end)
+        except Exception as e:
+            logger.warning(f"Invalid timezone {tz_name}: {e}")
+            return []
     
     # For each slot, check if it falls within reasonable hours for all invitees
     reasonable_slots = []
     
     for slot in organizer_slots:
-        slot_start_utc = slot['start_time']
-        slot_end_utc = slot['end_time']
+        slot_start_seconds = to_epoch_seconds(slot['start_time'])
+        slot_end_seconds = to_epoch_seconds(slot['end_time'])
         
         # Check if this slot is reasonable for all invitees
         is_reasonable_for_all = True
         invitee_times = {}
         
         for tz_name in invitee_timezones:
-            try:
-                invitee_tz = ZoneInfo(tz_name)
-                local_start = slot_start_utc.astimezone(invitee_tz)
-                local_end = slot_end_utc.astimezone(invitee_tz)
-                
-                # Get reasonable hours for this timezone
-                tz_reasonable_start, tz_reasonable_end = get_reasonable_hours_for_timezone(
-                    tz_name, reasonable_start_hour, reasonable_end_hour
-                )
-                
-                # Check if slot falls within reasonable hours
-                if (local_start.hour < tz_reasonable_start or 
-                    local_end.hour > tz_reasonable_end or
-                    local_start.date() != local_end.date()):  # Avoid cross-date slots
-                    is_reasonable_for_all = False
-                    break
-                
-                # Store timezone information
-                invitee_times[tz_name] = {
-                    'start_time': local_start,
-                    'end_time': local_end,
-                    'start_hour': local_start.hour,
-                    'end_hour': local_end.hour
-                }
-                    
-            except Exception as e:
-                logger.warning(f"Invalid timezone {tz_name}: {e}")
+            table = tables[tz_name]
+            local_start = table.local_seconds(slot_start_seconds)
+            local_end = table.local_seconds(slot_end_seconds)
+            start_hour = local_start // 3600 % 24
+            end_hour = local_end // 3600 % 24
+            
+            # Get reasonable hours for this timezone
+            tz_reasonable_start, tz_reasonable_end = get_reasonable_hours_for_timezone(
+                tz_name, reasonable_start_hour, reasonable_end_hour
+            )
+            
+            # Check if slot falls within reasonable hours
+            if (start_hour < tz_reasonable_start or 
+                end_hour > tz_reasonable_end or
+                local_start // SECONDS_PER_DAY != local_end // SECONDS_PER_DAY):  # Avoid cross-date slots
                 is_reasonable_for_all = False
                 break
+            
+            # Store timezone information
+            invitee_tz = get_zone(tz_name)
+            invitee_times[tz_name] = {
+                'start_time': slot['start_time'].astimezone(invitee_tz),
+                'end_time': slot['end_time'].astimezone(invitee_tz),
+                'start_hour': start_hour,
+                'end_hour': end_hour
+            }
         
         if is_reasonable_for_all:
             # Add timezone information for all invitees
@@ -835,6 +743,13 @@ def calculate_multi_invitee_intersection(organizer_slots, invitee_timezones, pri
     return reasonable_slots
 
 
+def _get_reasonable_hours(organizer=None):
+    """Get reasonable hours from the organizer's profile if available."""
+    if organizer and hasattr(organizer, 'profile'):
+        return organizer.profile.reasonable_hours_start, organizer.profile.reasonable_hours_end
+    return 7, 22
+
+
 def calculate_slot_fairness_score(invitee_times):
     """
     Calculate a fairness score for a slot across multiple timezones.
@@ -846,21 +761,8 @@ def calculate_slot_fairness_score(invitee_times):
     total_score = 0
     
     for tz_name, time_info in invitee_times.items():
-        local_hour = time_info['start_hour']
-        
         # Score based on how reasonable the hour is (peak = 10 AM - 4 PM)
-        if 10 <= local_hour <= 16:
-            tz_score = 100  # Perfect time
-        elif 8 <= local_hour <= 18:
-            tz_score = 80   # Good time
-        elif 7 <= local_hour <= 20:
-            tz_score = 60   # Acceptable time
-        elif 6 <= local_hour <= 22:
-            tz_score = 40   # Early/late but manageable
-        else:
-            tz_score = 0    # Too early/late
-        
-        total_score += tz_score
+        total_score += fairness_score_for_hour(time_info['start_hour'])
     
     # Return average score
     return total_score / len(invitee_times)
@@ -869,7 +771,7 @@ def calculate_slot_fairness_score(invitee_times):
 def validate_timezone(timezone_string):
     """Validate that a timezone string is a valid IANA timezone."""
     try:
-        ZoneInfo(timezone_string)
+        get_zone(timezone_string)
         return True
     except Exception:
         return False
@@ -908,8 +810,8 @@ def calculate_timezone_offset_hours(from_timezone, to_timezone, reference_date=N
         reference_date = timezone.now().date()
     
     try:
-        from_tz = ZoneInfo(from_timezone)
-        to_tz = ZoneInfo(to_timezone)
+        from_tz = get_zone(from_timezone)
+        to_tz = get_zone(to_timezone)
         
         # Create a reference datetime at noon to avoid DST edge cases
         reference_dt = datetime.combine(reference_date, time(12, 0)).replace(tzinfo=from_tz)
@@ -958,116 +860,227 @@ def mark_cache_dirty(organizer_id, cache_type, **kwargs):
         cache_type: Type of change that triggered the dirty flag
         **kwargs: Additional parameters for specific dirty flag types
     """
-    dirty_key = f"dirty_cache:{organizer_id}"
-    
-    # Get existing dirty data or create new
-    dirty_data = cache.get(dirty_key, {
-        'organizer_id': str(organizer_id),
-        'changes': [],
-        'last_updated': timezone.now().isoformat()
-    })
+    from .dirty_index import get_dirty_index
     
-    # Add new change
     change_entry = {
         'cache_type': cache_type,
         'timestamp': timezone.now().isoformat(),
         **kwargs
     }
-    dirty_data['changes'].append(change_entry)
-    dirty_data['last_updated'] = timezone.now().isoformat()
-    
-    # Store dirty flag for 10 minutes (enough time for batch processing)
-    cache.set(dirty_key, dirty_data, timeout=600)
+    get_dirty_index().mark(organizer_id, change_entry)
     
     logger.debug(f"Marked cache dirty for organizer {organizer_id}: {cache_type}")
 
 
-def get_dirty_organizers():
+def get_dirty_organizers(limit=None, older_than=None):
     """
     Get list of organizers with dirty cache flags.
     
+    Args:
+        limit: Maximum number of organizers to return
+        older_than: Only organizers whose oldest change is at least this many seconds old
+    
+    Returns:
+        List of organizer IDs that need cache refresh, oldest change first
+    """
+    from .dirty_index import get_dirty_index
+    
+    return get_dirty_index().organizers(limit=limit, older_than=older_than)
+
+
+def pop_dirty_changes(organizer_id):
+    """
+    Claim the pending changes of an organizer and clear its dirty flags.
+    
     Returns:
-        List of organizer IDs that need cache refresh
+        List of change dicts (with 'cache_type', 'timestamp' and details)
     """
-    # This would require Redis SCAN in production
-    # For now, return empty list as this is a future enhancement
-    return []
+    from .dirty_index import get_dirty_index
+    
+    return get_dirty_index().pop(organizer_id)
 
 
 def clear_dirty_flags(organizer_id):
     """Clear dirty flags for an organizer after processing."""
-    dirty_key = f"dirty_cache:{organizer_id}"
-    cache.delete(dirty_key)
+    pop_dirty_changes(organizer_id)
     logger.debug(f"Cleared dirty flags for organizer {organizer_id}")
 
 
-def get_cache_key_for_availability(organizer_id, event_type_id, start_date, end_date, 
-                                 invitee_timezone='UTC', attendee_count=1):
+def merge_date_ranges(date_ranges):
+    """
+    Merge overlapping or adjacent date ranges.
+    
+    Args:
+        date_ranges: Iterable of (start_date, end_date) tuples
+    
+    Returns:
+        Sorted list of disjoint (start_date, end_date) tuples
+    """
+    merged = []
+    
+    for start_date, end_date in sorted(date_ranges):
+        if merged and start_date <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end_date))
+        else:
+            merged.append((start_date, end_date))
+    
+    return merged
+
+
+def get_week_start(date):
+    """Return the Monday of the week containing a date (start of a cache chunk)."""
+    return date - timedelta(days=date.weekday())
+
+
+def get_week_starts(start_date, end_date):
+    """
+    Return the week starts of every cache chunk covering a date range.
+    
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range
+    
+    Returns:
+        List of Mondays, in order
+    """
+    week_starts = []
+    week_start = get_week_start(start_date)
+    
+    while week_start <= end_date:
+        week_starts.append(week_start)
+        week_start += timedelta(days=7)
+    
+    return week_starts
+
+
+def get_availability_chunk_key(organizer_id, event_type_id, week_start, generation=None):
     """
-    Generate a consistent cache key for availability data.
+    Generate the cache key of one weekly availability chunk.
+    
+    Chunks hold raw UTC slots for a single attendee with per-slot capacity,
+    so one key serves every invitee timezone and attendee count.
     
     Args:
         organizer_id: UUID of the organizer
         event_type_id: UUID of the event type
-        start_date: Start date for availability
-        end_date: End date for availability
-        invitee_timezone: Timezone for the invitee
-        attendee_count: Number of attendees
+        week_start: Monday of the chunk's week (organizer's local dates)
+        generation: Cache generation from ``get_availability_generations``
+            (default: looked up)
     
     Returns:
         String cache key
     """
-    return f"availability:{organizer_id}:{event_type_id}:{start_date}:{end_date}:{invitee_timezone}:{attendee_count}"
+    if generation is None:
+        generation = get_availability_generations(organizer_id, [event_type_id])[event_type_id]
+    
+    week_end = week_start + timedelta(days=6)
+    return f"availability:{organizer_id}:{event_type_id}:{week_start}:{week_end}:g{generation}"
 
 
-def get_weekly_cache_keys_for_date_range(organizer_id, event_type_id, start_date, end_date):
+def get_stale_chunk_key(organizer_id, event_type_id, week_start):
     """
-    Generate weekly cache keys that cover a date range.
+    Generate the cache key of the last chunk cached for a week, of any generation.
     
     Args:
         organizer_id: UUID of the organizer
         event_type_id: UUID of the event type
-        start_date: Start date
-        end_date: End date
+        week_start: Monday of the chunk's week
     
     Returns:
-        List of cache key patterns
+        String cache key
+    """
+    return f"availability_stale:{organizer_id}:{event_type_id}:{week_start}"
+
+
+def get_chunk_lock_key(organizer_id, event_type_id, week_starts, generation):
     """
-    cache_keys = []
-    current_date = start_date
+    Generate the cache key of the lock held while computing missing chunks.
     
-    while current_date <= end_date:
-        # Calculate week boundaries
-        week_start = current_date - timedelta(days=current_date.weekday())
-        week_end = week_start + timedelta(days=6)
-        
-        # Generate base cache key for this week
-        base_key = f"availability:{organizer_id}:{event_type_id}:{week_start}:{week_end}"
-        cache_keys.append(base_key)
-        
-        # Move to next week
-        current_date = week_end + timedelta(days=1)
+    Args:
+        organizer_id: UUID of the organizer
+        event_type_id: UUID of the event type
+        week_starts: List of Mondays being computed
+        generation: Cache generation the chunks are computed for
     
-    return cache_keys
+    Returns:
+        String cache key
+    """
+    return f"availability_lock:{organizer_id}:{event_type_id}:{week_starts[0]}:{week_starts[-1]}:g{generation}"
+
 
+def _generation_key(organizer_id, event_type_id=None):
+    if event_type_id is None:
+        return f"availability_generation:{organizer_id}"
+    return f"availability_generation:{organizer_id}:{event_type_id}"
 
-def generate_cache_key_variations(base_key):
+
+def get_availability_generations(organizer_id, event_type_ids):
     """
-    Generate variations of a cache key to handle different timezone/attendee combinations.
+    Get the cache generations of an organizer's event types in one cache read.
+    
+    A generation combines the organizer counter and the event type counter,
+    e.g. ``'3.1'``, and is part of every chunk key, so bumping either counter
+    makes all older chunks unreachable.
+    
+    Args:
+        organizer_id: UUID of the organizer
+        event_type_ids: List of event type UUIDs
+    
+    Returns:
+        dict: {event_type_id: generation string}
+    """
+    organizer_key = _generation_key(organizer_id)
+    event_type_keys = {event_type_id: _generation_key(organizer_id, event_type_id) for event_type_id in event_type_ids}
+    counters = cache.get_many([organizer_key, *event_type_keys.values()])
+    
+    organizer_generation = counters.get(organizer_key, 0)
+    return {
+        event_type_id: f"{organizer_generation}.{counters.get(key, 0)}"
+        for event_type_id, key in event_type_keys.items()
+    }
+
+
+def bump_availability_generation(organizer_id, event_type_id=None):
+    """
+    Invalidate every cached chunk of an organizer, or of one event type.
+    
+    The counter is incremented atomically (INCR with Redis); chunks stored
+    under the previous generation are never read again and expire by TTL.
     
     Args:
-        base_key: Base cache key pattern
+        organizer_id: UUID of the organizer
+        event_type_id: UUID of the event type (default: all event types)
     
     Returns:
-        List of cache key variations to clear
+        int: New counter value
     """
-    # Common timezone variations
-    common_timezones = ['UTC', 'America/New_York', 'Europe/London', 'Asia/Tokyo', 'America/Los_Angeles']
-    attendee_counts = [1, 2, 3, 4, 5]  # Common attendee counts
+    key = _generation_key(organizer_id, event_type_id)
     
-    variations = []
-    for tz in common_timezones:
-        for count in attendee_counts:
-            variations.append(f"{base_key}:{tz}:{count}")
+    # Counters never expire; add() is a no-op when the counter exists
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.add(key, 1, timeout=None)
+        return 1
+
+
+def get_weekly_cache_keys_for_date_range(organizer_id, event_type_id, start_date, end_date):
+    """
+    Generate weekly cache keys that cover a date range.
     
-    return variations
\ No newline at end of file
+    Args:
+        organizer_id: UUID of the organizer
+        event_type_id: UUID of the event type
+        start_date: Start date
+        end_date: End date
+    
+    Returns:
+        List of chunk cache keys
+    """
+    generation = get_availability_generations(organizer_id, [event_type_id])[event_type_id]
+    return [
+        get_availability_chunk_key(organizer_id, event_type_id, week_start, generation)
+        for week_start in get_week_starts(start_date, end_date)
+    ]
@@ -1,8 +1,10 @@
 from rest_framework import generics, permissions, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.conf import settings
 from django.core.cache import cache
 from django.db.models import Count, Q
 from datetime import datetime, timedelta
@@ -12,8 +14,10 @@ from .serializers import (
     DateOverrideRuleSerializer, RecurringBlockedTimeSerializer,
     AvailableSlotSerializer, CalculatedSlotsRequestSerializer, AvailabilityStatsSerializer
 )
-from .utils import calculate_available_slots, get_cache_key_for_availability, get_weekly_cache_keys_for_date_range
+from .metrics import get_metrics_summary, render_prometheus
+from .utils import calculate_available_slots
 from apps.users.models import User
+import hmac
 import logging
 
 logger = logging.getLogger(__name__)
@@ -155,43 +159,29 @@ def calculated_slots(request, organizer_slug):
             is_active=True
         )
         
-        # Check cache first
-        cache_key = f"availability:{organizer.id}:{event_type.id}:{start_date}:{end_date}:{invitee_timezone}:{attendee_count}"
-        
-        # For multi-invitee requests, create a specialized cache key
-        if invitee_timezones and len(invitee_timezones) > 1:
-            timezones_hash = hash(tuple(sorted(invitee_timezones)))
-            cache_key = f"availability_multi:{organizer.id}:{event_type.id}:{start_date}:{end_date}:{timezones_hash}:{attendee_count}"
-        
-        cached_slots = cache.get(cache_key)
-        cache_hit = cached_slots is not None
+        # Calculate available slots through the availability engine, which
+        # serves and fills the shared availability cache
+        slot_calculation_start = time_module.time()
+        result = calculate_available_slots(
+            organizer=organizer,
+            event_type=event_type,
+            start_date=start_date,
+            end_date=end_date,
+            invitee_timezone=invitee_timezone,
+            attendee_count=attendee_count,
+            invitee_timezones=invitee_timezones
+        )
+        available_slots = result['slots']
+        cache_hit = result['cache_hit']
+        slot_calculation_time = time_module.time() - slot_calculation_start
         
-        if cached_slots is not None:
-            logger.info(f"Cache HIT for {organizer_slug}/{event_type_slug}")
-            available_slots = cached_slots
-        else:
-            logger.info(f"Cache MISS for {organizer_slug}/{event_type_slug}")
-            
-            # Calculate available slots
-            slot_calculation_start = time_module.time()
-            available_slots = calculate_available_slots(
-                organizer=organizer,
-                event_type=event_type,
-                start_date=start_date,
-                end_date=end_date,
-                invitee_timezone=invitee_timezone,
-                attendee_count=attendee_count,
-                invitee_timezones=invitee_timezones
-            )
-            slot_calculation_time = time_module.time() - slot_calculation_start
-            
-            # Log computation time for performance monitoring
-            logger.info(f"Slot calculation took {slot_calculation_time:.3f}s for {organizer_slug}/{event_type_slug}")
-            
-            # Cache the result for 15 minutes
-            cache.set(cache_key, available_slots, timeout=900)
+        # Log computation time for performance monitoring
+        logger.info(
+            f"Slot calculation took {slot_calculation_time:.3f}s for {organizer_slug}/{event_type_slug} "
+            f"(cache {'HIT' if cache_hit else 'MISS'})"
+        )
         
-        # Serialize the slots
+        # Serialize the slots (slot dicts are only built here)
         response_serializer = AvailableSlotSerializer(available_slots, many=True)
         
         # Calculate total request time
@@ -207,6 +197,7 @@ def calculated_slots(request, organizer_slug):
             'available_slots': response_serializer.data,
             'cache_hit': cache_hit,
             'total_slots': len(available_slots),
+            'warnings': result['warnings'],
             'computation_time_ms': round(total_request_time * 1000, 2)
         }
         
@@ -215,6 +206,8 @@ def calculated_slots(request, organizer_slug):
             response_data['invitee_timezones'] = invitee_timezones
             response_data['multi_invitee_mode'] = True
         
+        return Response(response_data)
+        
     except ValueError as e:
         return Response(
             {'error': str(e)},
@@ -273,8 +266,8 @@ def availability_stats(request):
         if daily_minutes[busiest_day_num] > 0:
             busiest_day = day_mapping[busiest_day_num]
     
-    # Calculate cache hit rate (simplified - would need more sophisticated tracking in production)
-    cache_hit_rate = 0.85  # Placeholder - in production, track this via Redis metrics
+    # Cache hit rate of the organizer's availability requests over the last hour
+    performance_summary = get_metrics_summary(window_seconds=3600, organizer_id=organizer.id)
     
     stats = {
         'total_rules': total_rules,
@@ -285,13 +278,38 @@ def availability_stats(request):
         'average_weekly_hours': round(average_weekly_hours, 2),
         'busiest_day': busiest_day,
         'daily_hours': {day_mapping[k]: round(v / 60.0, 2) for k, v in daily_minutes.items()},
-        'cache_hit_rate': cache_hit_rate
+        'cache_hit_rate': performance_summary['cache_hit_rate'],
+        'performance_summary': performance_summary
     }
     
     response_serializer = AvailabilityStatsSerializer(stats)
     return Response(response_serializer.data)
 
 
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([])
+def availability_metrics(request):
+    """
+    Expose availability cache and latency counters in the Prometheus text format.
+    
+    Not throttled: scrapers send a bearer token rather than authenticating,
+    so the anon rate would reject a regular scrape interval.
+    """
+    token = settings.AVAILABILITY_METRICS_TOKEN
+    if token:
+        authorized = hmac.compare_digest(
+            request.META.get('HTTP_AUTHORIZATION', '').encode(), f"Bearer {token}".encode()
+        )
+    else:
+        authorized = request.user.is_authenticated and request.user.is_staff
+    
+    if not authorized:
+        return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
+    
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4')
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def clear_availability_cache_manual(request):
@@ -0,0 +1,39 @@
+"""
+# Per-day Booking Counters
+
+1. New Features
+   - EventTypeDailyBookingCount stores confirmed bookings per event type and
+     organizer-local date, kept current by booking signals
+
+2. Performance
+   - max_bookings_per_day checks read counters instead of counting bookings
+"""
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_enterprise_booking_enhancements'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventTypeDailyBookingCount',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('booking_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event_type', models.ForeignKey(on_delete=models.CASCADE, related_name='daily_booking_counts', to='events.eventtype')),
+            ],
+            options={
+                'db_table': 'event_type_daily_booking_counts',
+                'verbose_name': 'Daily Booking Count',
+                'verbose_name_plural': 'Daily Booking Counts',
+                'unique_together': {('event_type', 'date')},
+            },
+        ),
+    ]
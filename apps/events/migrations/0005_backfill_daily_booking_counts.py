@@ -0,0 +1,70 @@
+"""
+# Backfill Per-day Booking Counters
+
+1. Data Migration
+   - Fills EventTypeDailyBookingCount from confirmed bookings starting on the
+     organizer-local yesterday, grouped by organizer-local date exactly like
+     count_daily_bookings
+   - Existing counter rows are left untouched
+"""
+
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def backfill_daily_booking_counts(apps, schema_editor):
+    EventType = apps.get_model('events', 'EventType')
+    Booking = apps.get_model('events', 'Booking')
+    EventTypeDailyBookingCount = apps.get_model('events', 'EventTypeDailyBookingCount')
+    Profile = apps.get_model('users', 'Profile')
+
+    organizer_timezones = dict(Profile.objects.values_list('user_id', 'timezone_name'))
+    now = timezone.now()
+    counters = []
+
+    for event_type in EventType.objects.only('id', 'organizer_id').iterator():
+        try:
+            organizer_tz = ZoneInfo(organizer_timezones.get(event_type.organizer_id) or 'UTC')
+        except (ZoneInfoNotFoundError, ValueError):
+            organizer_tz = ZoneInfo('UTC')
+
+        start_date = now.astimezone(organizer_tz).date() - timedelta(days=1)
+        window_start = datetime.combine(start_date, time(0, 0)).replace(tzinfo=organizer_tz)
+
+        rows = Booking.objects.filter(
+            event_type_id=event_type.id,
+            status='confirmed',
+            start_time__gte=window_start
+        ).annotate(
+            local_date=TruncDate('start_time', tzinfo=organizer_tz)
+        ).values('local_date').annotate(
+            booking_count=models.Count('id')
+        ).order_by()
+
+        counters.extend(
+            EventTypeDailyBookingCount(
+                event_type_id=event_type.id,
+                date=row['local_date'],
+                booking_count=row['booking_count']
+            )
+            for row in rows
+        )
+
+    EventTypeDailyBookingCount.objects.bulk_create(counters, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0004_event_type_daily_booking_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_daily_booking_counts, migrations.RunPython.noop),
+    ]
@@ -843,4 +843,30 @@ class EventTypeAvailabilityCache(models.Model):
     def mark_dirty(self):
         """Mark cache as dirty for recomputation."""
         self.is_dirty = True
-        self.save(update_fields=['is_dirty'])
\ No newline at end of file
+        self.save(update_fields=['is_dirty'])
+
+
+class EventTypeDailyBookingCount(models.Model):
+    """
+    Confirmed booking count per event type and organizer-local date.
+    
+    Maintained by booking signals so max_bookings_per_day checks read one row
+    per date instead of counting bookings.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    event_type = models.ForeignKey(EventType, on_delete=models.CASCADE, related_name='daily_booking_counts')
+    
+    # Date in the organizer's timezone
+    date = models.DateField()
+    booking_count = models.PositiveIntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'event_type_daily_booking_counts'
+        verbose_name = 'Daily Booking Count'
+        verbose_name_plural = 'Daily Booking Counts'
+        unique_together = ['event_type', 'date']
+    
+    def __str__(self):
+        return f"{self.event_type.name} - {self.date}: {self.booking_count}"
\ No newline at end of file
@@ -1,8 +1,11 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.db import transaction
 from .models import Booking, EventType, Attendee
-from .utils import create_booking_audit_log, invalidate_availability_cache
+from .utils import (
+    create_booking_audit_log, invalidate_availability_cache,
+    adjust_daily_booking_count, get_booking_local_date
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,54 @@ def invalidate_cache_on_booking_change(sender, instance, **kwargs):
         ))
 
 
+# Fields that decide which daily booking counter a booking contributes to
+DAILY_COUNT_FIELDS = {'status', 'start_time', 'event_type'}
+
+
+@receiver(pre_save, sender=Booking)
+def track_daily_booking_count_state(sender, instance, update_fields=None, **kwargs):
+    """Remember the counter a booking contributed to before this save."""
+    instance._daily_count_previous = None
+    
+    if instance._state.adding:
+        return
+    if update_fields is not None and not DAILY_COUNT_FIELDS.intersection(update_fields):
+        return
+    
+    previous = Booking.objects.filter(pk=instance.pk).select_related(
+        'organizer__profile'
+    ).first()
+    if previous and previous.status == 'confirmed':
+        instance._daily_count_previous = (previous.event_type_id, get_booking_local_date(previous))
+
+
+@receiver(post_save, sender=Booking)
+def update_daily_booking_counts(sender, instance, created, update_fields=None, **kwargs):
+    """Keep per-day confirmed booking counters in step with booking changes."""
+    if not created and update_fields is not None and not DAILY_COUNT_FIELDS.intersection(update_fields):
+        return
+    
+    previous = getattr(instance, '_daily_count_previous', None)
+    current = None
+    if instance.status == 'confirmed':
+        current = (instance.event_type_id, get_booking_local_date(instance))
+    
+    if previous == current:
+        return
+    
+    if previous:
+        adjust_daily_booking_count(previous[0], previous[1], -1)
+    if current:
+        adjust_daily_booking_count(current[0], current[1], 1)
+
+
+@receiver(post_delete, sender=Booking)
+def decrement_daily_booking_count(sender, instance, **kwargs):
+    """Release the daily counter slot held by a deleted confirmed booking."""
+    if instance.status == 'confirmed':
+        adjust_daily_booking_count(instance.event_type_id, get_booking_local_date(instance), -1)
+
+
 @receiver(post_save, sender=Booking)
 def handle_booking_calendar_integration(sender, instance, created, **kwargs):
     """Handle calendar integration when booking is created/updated."""
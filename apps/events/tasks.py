@@ -1,11 +1,13 @@
 from celery import shared_task
+from django.core.cache import cache
 from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
-from .models import Booking, WaitlistEntry, EventTypeAvailabilityCache
-from .utils import create_booking_audit_log, invalidate_availability_cache
+from .models import Booking, EventType, WaitlistEntry, EventTypeAvailabilityCache, EventTypeDailyBookingCount
+from .utils import create_booking_audit_log, invalidate_availability_cache, count_daily_bookings
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -249,49 +251,80 @@ def cleanup_expired_access_tokens():
 
 
 @shared_task
-def recompute_dirty_availability_cache():
-    """Recompute availability cache entries marked as dirty."""
+def recompute_dirty_availability_cache(time_budget_seconds=None):
+    """
+    Recompute availability cache entries marked as dirty, one organizer at a time.
+    
+    Each organizer's rules, blocks and bookings are loaded once for all of
+    its dirty entries, the chunks are recomputed in memory and written back
+    with one bulk upsert. No new organizer is started once the time budget
+    is spent; the remaining entries stay dirty for the next run.
+    
+    Args:
+        time_budget_seconds: Run time budget (default: AVAILABILITY_RECOMPUTE_TIME_BUDGET_SECONDS)
+    """
+    from apps.availability.engine import DatabaseCacheBackend, get_availability_engine
+    from apps.availability.utils import get_week_start
+    
+    started = time.monotonic()
+    deadline = started + (time_budget_seconds or settings.AVAILABILITY_RECOMPUTE_TIME_BUDGET_SECONDS)
+    
     dirty_entries = EventTypeAvailabilityCache.objects.filter(
         is_dirty=True,
         expires_at__gt=timezone.now()  # Only recompute non-expired entries
+    ).select_related('organizer__profile', 'event_type').order_by('organizer_id', 'event_type_id', 'date')
+    
+    # Entries are weekly slot chunks stored for UTC and one attendee;
+    # anything else predates the chunk format and is never read again
+    legacy_entries = dirty_entries.exclude(
+        timezone_name=DatabaseCacheBackend.CHUNK_TIMEZONE,
+        attendee_count=DatabaseCacheBackend.CHUNK_ATTENDEE_COUNT
     )
+    expired_count = legacy_entries.update(expires_at=timezone.now())
     
+    entries_by_organizer = {}
+    for entry in dirty_entries:
+        organizer_entries = entries_by_organizer.setdefault(entry.organizer_id, (entry.organizer, {}, []))
+        organizer_entries[1].setdefault(entry.event_type, set()).add(get_week_start(entry.date))
+        organizer_entries[2].append(entry.id)
+    
+    engine = get_availability_engine(cache_backend=DatabaseCacheBackend())
     recomputed_count = 0
+    organizer_count = 0
     
-    for entry in dirty_entries:
+    for organizer, weeks_by_event_type, entry_ids in entries_by_organizer.values():
+        if time.monotonic() >= deadline:
+            break
+        
         try:
-            from .utils import AvailabilityCalculator
-            
-            calculator = AvailabilityCalculator(
-                entry.organizer, 
-                entry.event_type, 
-                entry.timezone_name
-            )
-            
-            # Recompute availability
-            result = calculator.get_available_slots(
-                entry.date, 
-                entry.date, 
-                entry.attendee_count,
-                use_cache=False  # Don't use cache when recomputing
-            )
+            chunks_by_event_type = engine.compute_organizer_chunks(organizer, weeks_by_event_type)
+            # Rewriting the entries clears their dirty flags
+            engine.cache_backend.set_event_type_chunks(organizer, chunks_by_event_type)
             
-            # Update cache entry
-            entry.available_slots = result['slots']
-            entry.computed_at = timezone.now()
-            entry.is_dirty = False
-            entry.computation_time_ms = result.get('performance_metrics', {}).get('computation_time_ms')
-            entry.save()
-            
-            recomputed_count += 1
+            recomputed_count += len(entry_ids)
+            organizer_count += 1
             
         except Exception as e:
-            logger.error(f"Error recomputing cache entry {entry.id}: {str(e)}")
+            logger.error(f"Error recomputing cache entries for {organizer.email}: {str(e)}")
             # Mark as expired to remove from active cache
-            entry.expires_at = timezone.now()
-            entry.save(update_fields=['expires_at'])
+            EventTypeAvailabilityCache.objects.filter(id__in=entry_ids).update(expires_at=timezone.now())
+    
+    backlog = EventTypeAvailabilityCache.objects.filter(is_dirty=True, expires_at__gt=timezone.now()).count()
+    duration = time.monotonic() - started
+    
+    cache.set('availability_recompute_stats', {
+        'recomputed_entries': recomputed_count,
+        'organizers': organizer_count,
+        'expired_legacy_entries': expired_count,
+        'backlog': backlog,
+        'duration_seconds': round(duration, 3),
+        'timestamp': timezone.now().isoformat()
+    }, timeout=None)
     
-    return f"Recomputed {recomputed_count} dirty cache entries"
+    if backlog:
+        logger.warning(f"Availability recompute backlog: {backlog} dirty entries left after {duration:.1f}s")
+    
+    return f"Recomputed {recomputed_count} dirty cache entries for {organizer_count} organizers, {backlog} left"
 
 
 @shared_task
@@ -308,6 +341,71 @@ def cleanup_expired_cache_entries():
     return f"Cleaned up {count} expired cache entries"
 
 
+@shared_task
+def rebuild_daily_booking_counts():
+    """
+    Rebuild per-day booking counters from bookings for capped event types.
+    
+    Counters are maintained by booking signals; this backfills new event types
+    and corrects drift from writes that bypass signals (e.g. queryset updates).
+    """
+    from datetime import timedelta
+    
+    today = timezone.now().date()
+    event_types = EventType.objects.filter(
+        is_active=True,
+        max_bookings_per_day__isnull=False
+    ).select_related('organizer__profile')
+    
+    corrected_count = 0
+    
+    for event_type in event_types:
+        try:
+            start_date = today - timedelta(days=1)
+            end_date = today + timedelta(minutes=event_type.max_scheduling_horizon) + timedelta(days=1)
+            
+            actual_counts = count_daily_bookings(
+                event_type, start_date, end_date, event_type.organizer.profile.timezone_name
+            )
+            counters = {
+                counter.date: counter
+                for counter in EventTypeDailyBookingCount.objects.filter(
+                    event_type=event_type,
+                    date__gte=start_date,
+                    date__lte=end_date
+                )
+            }
+            
+            to_create = []
+            to_update = []
+            
+            for local_date, booking_count in actual_counts.items():
+                counter = counters.get(local_date)
+                if counter is None:
+                    to_create.append(EventTypeDailyBookingCount(
+                        event_type=event_type, date=local_date, booking_count=booking_count
+                    ))
+                elif counter.booking_count != booking_count:
+                    counter.booking_count = booking_count
+                    to_update.append(counter)
+            
+            for local_date, counter in counters.items():
+                if local_date not in actual_counts and counter.booking_count:
+                    counter.booking_count = 0
+                    to_update.append(counter)
+            
+            with transaction.atomic():
+                EventTypeDailyBookingCount.objects.bulk_create(to_create, ignore_conflicts=True)
+                EventTypeDailyBookingCount.objects.bulk_update(to_update, ['booking_count'])
+            
+            corrected_count += len(to_create) + len(to_update)
+            
+        except Exception as e:
+            logger.error(f"Error rebuilding daily booking counts for event type {event_type.id}: {str(e)}")
+    
+    return f"Corrected {corrected_count} daily booking counters"
+
+
 @shared_task
 def send_waitlist_notification(waitlist_entry_id):
     """Send notification to waitlist entry about available slot."""
@@ -5,24 +5,39 @@ import logging
 from datetime import datetime, timedelta, time
 from django.utils import timezone
 from django.db import models, transaction
+from django.db.models.functions import Greatest, TruncDate
 from django.core.cache import cache
 from django.conf import settings
 from zoneinfo import ZoneInfo
 import time as time_module
-from .models import Booking, EventType, Attendee, WaitlistEntry, BookingAuditLog, EventTypeAvailabilityCache
+from apps.availability.timezones import get_zone
+from .models import (
+    Booking, EventType, Attendee, WaitlistEntry, BookingAuditLog,
+    EventTypeDailyBookingCount
+)
 
 logger = logging.getLogger(__name__)
 
 
 class AvailabilityCalculator:
-    """Enterprise-grade availability calculation engine."""
+    """
+    Enterprise-grade availability calculation engine.
+    
+    Slot listing runs through the shared availability engine
+    (``apps.availability.engine``); this class adds the single-slot check
+    used when a booking is created or rescheduled.
+    """
     
-    def __init__(self, organizer, event_type, invitee_timezone='UTC'):
+    def __init__(self, organizer, event_type, invitee_timezone='UTC', engine=None, cache_backend=None):
         self.organizer = organizer
         self.event_type = event_type
         self.invitee_timezone = invitee_timezone
         self.organizer_timezone = organizer.profile.timezone_name
         
+        # Slot engine ('sweep' or 'loop') and cache backend for the shared engine
+        self.engine = engine
+        self.cache_backend = cache_backend
+        
         # Performance tracking
         self.computation_start = None
         self.cache_hits = 0
@@ -41,30 +56,25 @@ class AvailabilityCalculator:
         Returns:
             dict: Available slots with metadata
         """
+        from apps.availability.engine import get_availability_engine
+        
         self.computation_start = time_module.time()
         
         try:
-            # Check cache first
-            if use_cache:
-                cached_result = self._get_cached_availability(start_date, end_date, attendee_count)
-                if cached_result:
-                    self.cache_hits += 1
-                    return self._add_performance_metadata(cached_result)
-            
-            self.cache_misses += 1
+            engine = get_availability_engine(cache_backend=self.cache_backend, slot_engine=self.engine)
+            result = engine.get_available_slots(
+                self.organizer, self.event_type, start_date, end_date,
+                invitee_timezone=self.invitee_timezone,
+                attendee_count=attendee_count,
+                use_cache=use_cache
+            )
             
-            # Calculate fresh availability
-            available_slots = self._calculate_fresh_availability(start_date, end_date, attendee_count)
+            if result['cache_hit']:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
             
-            # Cache the result
-            if use_cache:
-                self._cache_availability(start_date, end_date, attendee_count, available_slots)
-            
-            return self._add_performance_metadata({
-                'slots': available_slots,
-                'cache_hit': False,
-                'total_slots': len(available_slots)
-            })
+            return self._add_performance_metadata(result)
             
         except Exception as e:
             logger.error(f"Error calculating availability: {str(e)}")
@@ -76,146 +86,6 @@ class AvailabilityCalculator:
                 'performance_metrics': self._get_performance_metrics()
             }
     
-    def _calculate_fresh_availability(self, start_date, end_date, attendee_count):
-        """Calculate availability without cache."""
-        available_slots = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            # Skip if event type can't be booked on this date
-            if not self.event_type.can_book_on_date(current_date):
-                current_date += timedelta(days=1)
-                continue
-            
-            # Get base availability for this day
-            day_slots = self._get_day_availability(current_date, attendee_count)
-            available_slots.extend(day_slots)
-            
-            current_date += timedelta(days=1)
-        
-        # Sort slots by start time
-        available_slots.sort(key=lambda x: x['start_time'])
-        
-        return available_slots
-    
-    def _get_day_availability(self, date, attendee_count):
-        """Get availability for a specific day."""
-        day_of_week = date.weekday()  # 0=Monday, 6=Sunday
-        
-        # Get organizer's availability rules for this day
-        from apps.availability.models import AvailabilityRule
-        availability_rules = AvailabilityRule.objects.filter(
-            organizer=self.organizer,
-            day_of_week=day_of_week,
-            is_active=True
-        ).filter(
-            models.Q(event_types__isnull=True) | models.Q(event_types=self.event_type)
-        )
-        
-        if not availability_rules.exists():
-            return []  # No availability on this day
-        
-        # Check for date overrides
-        from apps.availability.models import DateOverrideRule
-        date_override = DateOverrideRule.objects.filter(
-            organizer=self.organizer,
-            date=date,
-            is_active=True
-        ).filter(
-            models.Q(event_types__isnull=True) | models.Q(event_types=self.event_type)
-        ).first()
-        
-        if date_override:
-            if not date_override.is_available:
-                return []  # Entire day blocked
-            else:
-                # Use override times
-                return self._generate_slots_for_time_range(
-                    date, date_override.start_time, date_override.end_time, attendee_count
-                )
-        
-        # Generate slots from availability rules
-        day_slots = []
-        for rule in availability_rules:
-            rule_slots = self._generate_slots_for_availability_rule(rule, date, attendee_count)
-            day_slots.extend(rule_slots)
-        
-        # Remove overlapping slots and merge adjacent ones
-        return self._merge_and_deduplicate_slots(day_slots)
-    
-    def _generate_slots_for_availability_rule(self, rule, date, attendee_count):
-        """Generate slots for a specific availability rule."""
-        if rule.spans_midnight():
-            # Handle midnight-spanning rules
-            slots = []
-            
-            # Part 1: start_time to midnight
-            slots.extend(self._generate_slots_for_time_range(
-                date, rule.start_time, time(23, 59, 59), attendee_count
-            ))
-            
-            # Part 2: midnight to end_time (next day)
-            next_date = date + timedelta(days=1)
-            slots.extend(self._generate_slots_for_time_range(
-                next_date, time(0, 0), rule.end_time, attendee_count
-            ))
-            
-            return slots
-        else:
-            # Normal rule within same day
-            return self._generate_slots_for_time_range(
-                date, rule.start_time, rule.end_time, attendee_count
-            )
-    
-    def _generate_slots_for_time_range(self, date, start_time, end_time, attendee_count):
-        """Generate slots for a specific time range on a date."""
-        slots = []
-        
-        # Create timezone-aware datetime objects
-        org_tz = ZoneInfo(self.organizer_timezone)
-        
-        range_start = datetime.combine(date, start_time).replace(tzinfo=org_tz)
-        range_end = datetime.combine(date, end_time).replace(tzinfo=org_tz)
-        
-        # Convert to UTC for calculations
-        range_start_utc = range_start.astimezone(timezone.utc)
-        range_end_utc = range_end.astimezone(timezone.utc)
-        
-        # Get slot parameters
-        slot_duration = timedelta(minutes=self.event_type.duration)
-        buffer_before = timedelta(minutes=self.event_type.buffer_time_before)
-        buffer_after = timedelta(minutes=self.event_type.buffer_time_after)
-        
-        # Get slot interval
-        slot_interval = self._get_slot_interval()
-        
-        # Generate slots
-        current_slot_start = range_start_utc
-        
-        while current_slot_start + slot_duration <= range_end_utc:
-            slot_end = current_slot_start + slot_duration
-            
-            # Check all conflict types
-            if self._is_slot_available(current_slot_start, slot_end, attendee_count, buffer_before, buffer_after):
-                # Convert to invitee timezone for display
-                invitee_tz = ZoneInfo(self.invitee_timezone)
-                
-                slot = {
-                    'start_time': current_slot_start,
-                    'end_time': slot_end,
-                    'duration_minutes': self.event_type.duration,
-                    'local_start_time': current_slot_start.astimezone(invitee_tz),
-                    'local_end_time': slot_end.astimezone(invitee_tz),
-                    'attendee_count': attendee_count,
-                    'available_spots': self._get_available_spots(current_slot_start, slot_end),
-                }
-                
-                slots.append(slot)
-            
-            current_slot_start += slot_interval
-        
-        return slots
-    
     def _is_slot_available(self, start_time, end_time, attendee_count, buffer_before, buffer_after):
         """Check if a slot is available considering all constraints."""
         # Apply buffers for conflict checking
@@ -270,7 +140,7 @@ class AvailabilityCalculator:
         from apps.availability.models import RecurringBlockedTime
         
         # Get organizer timezone for date calculations
-        org_tz = ZoneInfo(self.organizer_timezone)
+        org_tz = get_zone(self.organizer_timezone)
         local_start = start_time.astimezone(org_tz)
         local_date = local_start.date()
         day_of_week = local_date.weekday()
@@ -315,13 +185,15 @@ class AvailabilityCalculator:
     
     def _is_blocked_by_existing_bookings(self, start_time, end_time, attendee_count):
         """Check conflicts with existing bookings across ALL event types."""
+        from apps.availability.busy_index import annotate_confirmed_attendees, confirmed_attendee_count
+        
         # Get ALL confirmed bookings for this organizer in the time range
-        existing_bookings = Booking.objects.filter(
+        existing_bookings = annotate_confirmed_attendees(Booking.objects.filter(
             organizer=self.organizer,
             status='confirmed',
             start_time__lt=end_time,
             end_time__gt=start_time
-        )
+        ).select_related('event_type'))
         
         for booking in existing_bookings:
             # Apply booking's own buffer times
@@ -337,7 +209,7 @@ class AvailabilityCalculator:
                 if (booking.event_type.is_group_event() and 
                     booking.event_type.id == self.event_type.id):
                     
-                    current_attendees = booking.attendees.filter(status='confirmed').count()
+                    current_attendees = confirmed_attendee_count(booking)
                     if current_attendees + attendee_count <= self.event_type.max_attendees:
                         continue  # Slot still has capacity
                 
@@ -346,35 +218,16 @@ class AvailabilityCalculator:
         return False
     
     def _is_blocked_by_external_calendars(self, start_time, end_time):
-        """Check conflicts with external calendar events."""
+        """Check conflicts with external calendar events not yet in the synced blocked times."""
         try:
-            from apps.integrations.models import CalendarIntegration
-            from apps.integrations.utils import get_external_busy_times
+            from apps.availability.utils import get_external_busy_times
             
-            # Get active calendar integrations
-            calendar_integrations = CalendarIntegration.objects.filter(
-                organizer=self.organizer,
-                is_active=True,
-                sync_enabled=True
-            )
+            busy_times = get_external_busy_times(self.organizer, start_time.date(), end_time.date())
             
-            for integration in calendar_integrations:
-                try:
-                    busy_times = get_external_busy_times(
-                        integration, 
-                        start_time.date(), 
-                        end_time.date()
-                    )
-                    
-                    for busy_period in busy_times:
-                        if (start_time < busy_period['end_time'] and 
-                            end_time > busy_period['start_time']):
-                            return True
-                            
-                except Exception as e:
-                    logger.warning(f"Error checking external calendar {integration.provider}: {str(e)}")
-                    # Continue checking other integrations
-                    continue
+            for busy_period in busy_times:
+                if (start_time < busy_period['end_time'] and 
+                    end_time > busy_period['start_time']):
+                    return True
             
             return False
             
@@ -388,133 +241,13 @@ class AvailabilityCalculator:
         if not self.event_type.max_bookings_per_day:
             return False
         
-        # Count existing bookings for this event type on this date
-        booking_date = start_time.astimezone(ZoneInfo(self.organizer_timezone)).date()
-        
-        existing_count = Booking.objects.filter(
-            organizer=self.organizer,
-            event_type=self.event_type,
-            status='confirmed',
-            start_time__date=booking_date
-        ).count()
-        
-        return existing_count >= self.event_type.max_bookings_per_day
-    
-    def _get_available_spots(self, start_time, end_time):
-        """Get number of available spots for group events."""
-        if not self.event_type.is_group_event():
-            return 1
-        
-        # Find existing booking at this exact time
-        existing_booking = Booking.objects.filter(
-            organizer=self.organizer,
-            event_type=self.event_type,
-            status='confirmed',
-            start_time=start_time,
-            end_time=end_time
-        ).first()
-        
-        if existing_booking:
-            current_attendees = existing_booking.attendees.filter(status='confirmed').count()
-            return max(0, self.event_type.max_attendees - current_attendees)
-        
-        return self.event_type.max_attendees
-    
-    def _get_slot_interval(self):
-        """Get slot interval for this event type."""
-        if self.event_type.slot_interval_minutes > 0:
-            return timedelta(minutes=self.event_type.slot_interval_minutes)
-        
-        # Use organizer's default or system default
-        from apps.availability.models import BufferTime
-        buffer_settings, _ = BufferTime.objects.get_or_create(organizer=self.organizer)
-        return timedelta(minutes=getattr(buffer_settings, 'slot_interval_minutes', 15))
-    
-    def _merge_and_deduplicate_slots(self, slots):
-        """Merge overlapping slots and remove duplicates."""
-        if not slots:
-            return slots
-        
-        # Sort by start time
-        sorted_slots = sorted(slots, key=lambda x: x['start_time'])
-        merged_slots = []
-        
-        current_slot = sorted_slots[0].copy()
-        
-        for next_slot in sorted_slots[1:]:
-            # Check if slots are adjacent or overlapping
-            if current_slot['end_time'] >= next_slot['start_time']:
-                # Merge slots
-                current_slot['end_time'] = max(current_slot['end_time'], next_slot['end_time'])
-                # Update duration
-                duration_minutes = int((current_slot['end_time'] - current_slot['start_time']).total_seconds() / 60)
-                current_slot['duration_minutes'] = duration_minutes
-                
-                # Update local times
-                if 'local_end_time' in current_slot:
-                    invitee_tz = ZoneInfo(self.invitee_timezone)
-                    current_slot['local_end_time'] = current_slot['end_time'].astimezone(invitee_tz)
-            else:
-                # No overlap, add current slot and move to next
-                merged_slots.append(current_slot)
-                current_slot = next_slot.copy()
-        
-        # Add the last slot
-        merged_slots.append(current_slot)
-        
-        return merged_slots
-    
-    def _get_cached_availability(self, start_date, end_date, attendee_count):
-        """Get cached availability if available and valid."""
-        # For now, only cache single-day requests for performance
-        if start_date != end_date:
-            return None
-        
-        try:
-            cache_entry = EventTypeAvailabilityCache.objects.get(
-                organizer=self.organizer,
-                event_type=self.event_type,
-                date=start_date,
-                timezone_name=self.invitee_timezone,
-                attendee_count=attendee_count,
-                is_dirty=False
-            )
-            
-            if not cache_entry.is_expired():
-                return {
-                    'slots': cache_entry.available_slots,
-                    'cache_hit': True,
-                    'total_slots': len(cache_entry.available_slots),
-                    'cached_at': cache_entry.computed_at
-                }
-        
-        except EventTypeAvailabilityCache.DoesNotExist:
-            pass
-        
-        return None
-    
-    def _cache_availability(self, start_date, end_date, attendee_count, slots):
-        """Cache availability results."""
-        # Only cache single-day results
-        if start_date != end_date:
-            return
-        
-        computation_time = int((time_module.time() - self.computation_start) * 1000)
-        
-        # Create or update cache entry
-        cache_entry, created = EventTypeAvailabilityCache.objects.update_or_create(
-            organizer=self.organizer,
-            event_type=self.event_type,
-            date=start_date,
-            timezone_name=self.invitee_timezone,
-            attendee_count=attendee_count,
-            defaults={
-                'available_slots': slots,
-                'expires_at': timezone.now() + timedelta(hours=1),  # Cache for 1 hour
-                'is_dirty': False,
-                'computation_time_ms': computation_time
-            }
+        # Count bookings for the one date; counters only back the availability listing
+        booking_date = start_time.astimezone(get_zone(self.organizer_timezone)).date()
+        daily_booking_counts = count_daily_bookings(
+            self.event_type, booking_date, booking_date, self.organizer_timezone
         )
+        
+        return daily_booking_counts.get(booking_date, 0) >= self.event_type.max_bookings_per_day
     
     def _add_performance_metadata(self, result):
         """Add performance metadata to result."""
@@ -535,7 +268,7 @@ class AvailabilityCalculator:
 
 
 def get_available_time_slots(organizer, event_type, start_date, end_date, 
-                           invitee_timezone='UTC', attendee_count=1, use_cache=True):
+                           invitee_timezone='UTC', attendee_count=1, use_cache=True, cache_backend=None):
     """
     Main function to get available time slots.
     
@@ -547,11 +280,12 @@ def get_available_time_slots(organizer, event_type, start_date, end_date,
         invitee_timezone: IANA timezone string for the invitee
         attendee_count: Number of attendees for group events
         use_cache: Whether to use cached results
+        cache_backend: Cache backend instance or name (default: from settings)
     
     Returns:
         dict: Available slots with metadata
     """
-    calculator = AvailabilityCalculator(organizer, event_type, invitee_timezone)
+    calculator = AvailabilityCalculator(organizer, event_type, invitee_timezone, cache_backend=cache_backend)
     return calculator.get_available_slots(start_date, end_date, attendee_count, use_cache)
 
 
@@ -1007,22 +741,18 @@ def invalidate_availability_cache(organizer, date=None):
         date: Specific date to invalidate (None for all)
     """
     try:
-        queryset = EventTypeAvailabilityCache.objects.filter(organizer=organizer)
-        
-        if date:
-            queryset = queryset.filter(date=date)
+        from apps.availability.engine import invalidate_availability_chunks
+        from apps.availability.tasks import precompute_availability_cache
         
-        # Mark as dirty instead of deleting for better performance
-        queryset.update(is_dirty=True)
+        # Only the weekly chunks covering the date are affected; cache rows
+        # are marked dirty for recomputation, cache keys are deleted
+        invalidate_availability_chunks(organizer, date, date)
         
-        # Also clear Django cache
         if date:
-            cache_pattern = f"availability:{organizer.id}:*:{date}:*"
-        else:
-            cache_pattern = f"availability:{organizer.id}:*"
-        
-        # Clear cache entries (Redis pattern matching would be ideal here)
-        # For now, we'll rely on the database cache invalidation
+            # Recompute the booking's week only
+            precompute_availability_cache.delay(
+                str(organizer.id), date_ranges=[[date.isoformat(), date.isoformat()]]
+            )
         
         logger.info(f"Invalidated availability cache for {organizer.email}" + 
                    (f" on {date}" if date else ""))
@@ -1031,6 +761,95 @@ def invalidate_availability_cache(organizer, date=None):
         logger.error(f"Error invalidating cache: {str(e)}")
 
 
+def get_booking_local_date(booking):
+    """Return the booking's start date in the organizer's timezone."""
+    profile = getattr(booking.organizer, 'profile', None)
+    organizer_tz = get_zone(profile.timezone_name if profile else 'UTC')
+    return booking.start_time.astimezone(organizer_tz).date()
+
+
+def adjust_daily_booking_count(event_type_id, local_date, delta):
+    """
+    Atomically add delta to the confirmed booking counter of an event type and date.
+    
+    Args:
+        event_type_id: UUID of the event type
+        local_date: Date in the organizer's timezone
+        delta: Change in confirmed bookings (positive or negative)
+    """
+    if not delta:
+        return
+    
+    with transaction.atomic():
+        counters = EventTypeDailyBookingCount.objects.filter(event_type_id=event_type_id, date=local_date)
+        
+        # Decrements never create rows, so they are safe during cascade deletes
+        if delta > 0:
+            EventTypeDailyBookingCount.objects.get_or_create(event_type_id=event_type_id, date=local_date)
+        
+        counters.update(
+            booking_count=Greatest(models.F('booking_count') + delta, 0),
+            updated_at=timezone.now()
+        )
+
+
+def get_daily_booking_counts(event_type, start_date, end_date):
+    """
+    Read confirmed booking counters for an event type in one query.
+    
+    Args:
+        event_type: EventType instance
+        start_date: First organizer-local date
+        end_date: Last organizer-local date
+    
+    Returns:
+        dict: {date: confirmed booking count}; dates without bookings are absent
+    """
+    return dict(
+        EventTypeDailyBookingCount.objects.filter(
+            event_type=event_type,
+            date__gte=start_date,
+            date__lte=end_date,
+            booking_count__gt=0
+        ).values_list('date', 'booking_count')
+    )
+
+
+def count_daily_bookings(event_type, start_date, end_date, organizer_timezone):
+    """
+    Count confirmed bookings per organizer-local date with a single grouped aggregate.
+    
+    Authoritative count used when a booking is created and to rebuild the
+    persistent counters; the availability listing reads the counters via
+    get_daily_booking_counts instead.
+    
+    Args:
+        event_type: EventType instance
+        start_date: First organizer-local date
+        end_date: Last organizer-local date
+        organizer_timezone: IANA timezone string of the organizer
+    
+    Returns:
+        dict: {date: confirmed booking count}
+    """
+    organizer_tz = get_zone(organizer_timezone)
+    window_start = datetime.combine(start_date, time(0, 0)).replace(tzinfo=organizer_tz)
+    window_end = datetime.combine(end_date + timedelta(days=1), time(0, 0)).replace(tzinfo=organizer_tz)
+    
+    rows = Booking.objects.filter(
+        event_type=event_type,
+        status='confirmed',
+        start_time__gte=window_start,
+        start_time__lt=window_end
+    ).annotate(
+        local_date=TruncDate('start_time', tzinfo=organizer_tz)
+    ).values('local_date').annotate(
+        booking_count=models.Count('id')
+    ).order_by()
+    
+    return {row['local_date']: row['booking_count'] for row in rows}
+
+
 def process_waitlist_for_cancelled_booking(booking_id):
     """
     Process waitlist when a booking is cancelled.
@@ -1197,6 +1016,9 @@ def calculate_dst_safe_time_slots(organizer_timezone, invitee_timezone, base_slo
     """
     Ensure time slots are correctly calculated across DST transitions.
     
+    Shares the availability app's implementation, which uses cached
+    timezone transition tables.
+    
     Args:
         organizer_timezone: Organizer's IANA timezone
         invitee_timezone: Invitee's IANA timezone
@@ -1205,51 +1027,9 @@ def calculate_dst_safe_time_slots(organizer_timezone, invitee_timezone, base_slo
     Returns:
         list: DST-safe slots with corrected times
     """
-    try:
-        org_tz = ZoneInfo(organizer_timezone)
-        invitee_tz = ZoneInfo(invitee_timezone)
-        
-        dst_safe_slots = []
-        
-        for slot in base_slots:
-            start_time = slot['start_time']
-            end_time = slot['end_time']
-            
-            # Check if this slot crosses a DST boundary
-            start_local_org = start_time.astimezone(org_tz)
-            end_local_org = end_time.astimezone(org_tz)
-            
-            # Check for DST transition
-            start_dst = start_local_org.dst()
-            end_dst = end_local_org.dst()
-            
-            if start_dst != end_dst:
-                # DST transition during this slot - log warning
-                logger.warning(f"DST transition during slot {start_time} - {end_time}")
-                
-                # Adjust slot to avoid transition if possible
-                # For now, skip slots that cross DST boundaries
-                continue
-            
-            # Convert to invitee timezone
-            slot_copy = slot.copy()
-            slot_copy['local_start_time'] = start_time.astimezone(invitee_tz)
-            slot_copy['local_end_time'] = end_time.astimezone(invitee_tz)
-            
-            # Add DST information
-            slot_copy['dst_info'] = {
-                'organizer_dst': bool(start_dst),
-                'invitee_dst': bool(start_time.astimezone(invitee_tz).dst()),
-                'dst_transition': start_dst != end_dst
-            }
-            
-            dst_safe_slots.append(slot_copy)
-        
-        return dst_safe_slots
-        
-    except Exception as e:
-        logger.error(f"Error calculating DST-safe slots: {str(e)}")
-        return base_slots  # Return original slots if DST calculation fails
+    from apps.availability.utils import calculate_dst_safe_time_slots as calculate_slots
+    
+    return calculate_slots(organizer_timezone, invitee_timezone, base_slots)
 
 
 def validate_timezone_for_booking(timezone_name):
@@ -14,6 +14,10 @@ from .serializers import (
     BookingManagementSerializer, CustomQuestionSerializer
 )
 from .tasks import process_booking_confirmation, trigger_event_type_workflows
+from apps.availability.engine import get_public_cache_backend
+from apps.availability.local_cache import get_local_cache
+from apps.availability.scheduler import record_public_page_view
+from apps.availability.serializers import AvailableSlotSerializer
 from .utils import (
     get_available_time_slots, create_booking_with_validation, 
     handle_booking_cancellation, handle_booking_rescheduling,
@@ -62,9 +66,16 @@ def public_organizer_page(request, organizer_slug):
             is_organizer=True
         )
         
-        # Check cache first
+        # Traffic raises the organizer's cache refresh priority
+        record_public_page_view(organizer.id)
+        
+        # Check the process-local cache, then Redis
         cache_key = f"public_organizer:{organizer_slug}"
-        cached_data = cache.get(cache_key)
+        cached_data = get_local_cache().get(cache_key)
+        if cached_data is None:
+            cached_data = cache.get(cache_key)
+            if cached_data:
+                get_local_cache().set(cache_key, cached_data)
         
         if cached_data:
             return Response(cached_data)
@@ -102,6 +113,7 @@ def public_organizer_page(request, organizer_slug):
         
         # Cache for 15 minutes
         cache.set(cache_key, organizer_data, timeout=900)
+        get_local_cache().set(cache_key, organizer_data)
         
         return Response(organizer_data)
         
@@ -126,6 +138,8 @@ def public_event_type_page(request, organizer_slug, event_type_slug):
             is_active=True
         )
         
+        record_public_page_view(event_type.organizer_id)
+        
         # Get query parameters
         start_date_str = request.GET.get('start_date')
         end_date_str = request.GET.get('end_date')
@@ -151,14 +165,15 @@ def public_event_type_page(request, organizer_slug, event_type_slug):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get available slots
+        # Get available slots, reading hot chunks from the process-local cache
         availability_result = get_available_time_slots(
             organizer=event_type.organizer,
             event_type=event_type,
             start_date=start_date,
             end_date=end_date,
             invitee_timezone=invitee_timezone,
-            attendee_count=attendee_count
+            attendee_count=attendee_count,
+            cache_backend=get_public_cache_backend()
         )
         
         # Get custom questions
@@ -172,7 +187,7 @@ def public_event_type_page(request, organizer_slug, event_type_slug):
         
         # Add availability and questions
         event_type_data.update({
-            'available_slots': availability_result.get('slots', []),
+            'available_slots': AvailableSlotSerializer(availability_result.get('slots', []), many=True).data,
             'custom_questions': CustomQuestionSerializer(custom_questions, many=True).data,
             'cache_hit': availability_result.get('cache_hit', False),
             'total_slots': availability_result.get('total_slots', 0),
@@ -629,9 +644,15 @@ def get_available_slots_api(request, organizer_slug, event_type_slug):
             start_date=start_date,
             end_date=end_date,
             invitee_timezone=invitee_timezone,
-            attendee_count=attendee_count
+            attendee_count=attendee_count,
+            cache_backend=get_public_cache_backend()
         )
         
+        # Slots are built as dicts only here, at the serializer
+        availability_result['slots'] = AvailableSlotSerializer(
+            availability_result.get('slots', []), many=True
+        ).data
+        
         return Response(availability_result)
         
     except Exception as e:
@@ -6,9 +6,13 @@ from datetime import datetime, timedelta
 from django.conf import settings
 from django.utils import timezone
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from .utils import make_api_request, ensure_valid_token, log_integration_activity, parse_google_calendar_event
+from .utils import (
+    make_api_request, ensure_valid_token, log_integration_activity, parse_google_calendar_event,
+    SyncTokenExpiredError
+)
 from .models import IntegrationLog
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,7 @@ class GoogleCalendarClient:
         """
         self.integration = integration
         self.organizer = integration.organizer
+        self.next_sync_token = ''
         
     def _get_service(self):
         """Get authenticated Google Calendar service."""
@@ -129,6 +134,125 @@ class GoogleCalendarClient:
             )
             raise
     
+    def get_event_changes(self, start_date, end_date, sync_token=None):
+        """
+        Get events changed since a sync token, or every event in the window.
+        
+        Collects ``iter_event_changes`` into one list.
+        
+        Args:
+            start_date: Start date for a full sync
+            end_date: End date for a full sync
+            sync_token: ``nextSyncToken`` of the previous sync (None: full sync)
+        
+        Returns:
+            tuple: (list of parsed events, next sync token)
+        
+        Raises:
+            SyncTokenExpiredError: If Google no longer accepts sync_token (410 Gone)
+        """
+        events = [event for page in self.iter_event_changes(start_date, end_date, sync_token) for event in page]
+        return events, self.next_sync_token
+    
+    def iter_event_changes(self, start_date, end_date, sync_token=None):
+        """
+        Yield pages of events changed since a sync token, or of every event in the window.
+        
+        Unlike ``get_busy_times``, cancelled and free events are returned too
+        so reconciliation can remove the blocked times they replace. Google
+        applies no time window to incremental requests; ``start_date`` and
+        ``end_date`` only bound the full sync that issues the first token.
+        Once the pages are exhausted, ``self.next_sync_token`` holds the
+        token to resume from.
+        
+        Args:
+            start_date: Start date for a full sync
+            end_date: End date for a full sync
+            sync_token: ``nextSyncToken`` of the previous sync (None: full sync)
+        
+        Yields:
+            list: Parsed events of one API page
+        
+        Raises:
+            SyncTokenExpiredError: If Google no longer accepts sync_token (410 Gone)
+        """
+        self.next_sync_token = ''
+        
+        try:
+            service = self._get_service()
+            calendar_id = self.integration.calendar_id or 'primary'
+            
+            if sync_token:
+                params = {'syncToken': sync_token}
+            else:
+                params = {
+                    'timeMin': datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc).isoformat(),
+                    'timeMax': datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc).isoformat(),
+                }
+            
+            event_count = 0
+            page_token = None
+            
+            while True:
+                try:
+                    events_result = service.events().list(
+                        calendarId=calendar_id,
+                        singleEvents=True,  # Must match between full and incremental requests
+                        maxResults=250,
+                        pageToken=page_token,
+                        **params
+                    ).execute()
+                except HttpError as e:
+                    if e.resp.status == 410:
+                        raise SyncTokenExpiredError("Google sync token expired, full sync required")
+                    raise
+                
+                events = []
+                for event in events_result.get('items', []):
+                    # Deleted events carry little more than their ID
+                    if event.get('status') == 'cancelled' or 'start' not in event or 'end' not in event:
+                        events.append({'external_id': event['id'], 'status': 'cancelled'})
+                        continue
+                    
+                    try:
+                        events.append(parse_google_calendar_event(event))
+                    except Exception as e:
+                        logger.warning(f"Error parsing Google Calendar event {event.get('id')}: {str(e)}")
+                        continue
+                
+                event_count += len(events)
+                yield events
+                
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
+            
+            # The token is on the last page
+            self.next_sync_token = events_result.get('nextSyncToken', '')
+            
+            log_integration_activity(
+                organizer=self.organizer,
+                log_type='calendar_sync',
+                integration_type='google',
+                message=f"Fetched {event_count} changed events from Google Calendar",
+                success=True,
+                details={'event_count': event_count, 'incremental': bool(sync_token)}
+            )
+            
+        except SyncTokenExpiredError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching Google Calendar changes: {str(e)}")
+            log_integration_activity(
+                organizer=self.organizer,
+                log_type='calendar_sync',
+                integration_type='google',
+                message=f"Failed to fetch changes: {str(e)}",
+                success=False,
+                details={'error': str(e)}
+            )
+            raise
+    
     def create_event(self, booking):
         """
         Create an event in Google Calendar.
@@ -0,0 +1,31 @@
+"""
+# Synced Busy Time Watermark
+
+1. New Features
+   - CalendarIntegration.busy_synced_at records when reconciled blocked times
+     last matched the external calendar
+
+2. Performance
+   - Availability reads busy times from synced blocked times while the
+     watermark is fresh instead of calling the calendar API per request
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_initial_integrations_enhancements'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarintegration',
+            name='busy_synced_at',
+            field=models.DateTimeField(
+                blank=True, null=True,
+                help_text='When the synced blocked times last matched the external calendar'
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+"""
+# Incremental Calendar Sync
+
+1. New Features
+   - CalendarIntegration.full_sync_at records when the window behind the
+     stored sync token was last fetched in full
+
+2. Performance
+   - Calendar sync fetches only changes since sync_token (Google syncToken,
+     Microsoft Graph delta link) between daily full syncs
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0002_calendar_integration_busy_synced_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarintegration',
+            name='full_sync_at',
+            field=models.DateTimeField(
+                blank=True, null=True,
+                help_text="When the sync token's window was last fetched in full"
+            ),
+        ),
+    ]
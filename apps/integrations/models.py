@@ -1,5 +1,7 @@
 from django.db import models
+from django.conf import settings
 from django.utils import timezone
+from datetime import timedelta
 import uuid
 
 
@@ -28,7 +30,15 @@ class CalendarIntegration(models.Model):
     # Sync tracking
     last_sync_at = models.DateTimeField(null=True, blank=True)
     sync_token = models.TextField(blank=True, help_text="Token for incremental sync")
+    full_sync_at = models.DateTimeField(
+        null=True, blank=True,
+        help_text="When the sync token's window was last fetched in full"
+    )
     sync_errors = models.IntegerField(default=0, help_text="Consecutive sync error count")
+    busy_synced_at = models.DateTimeField(
+        null=True, blank=True,
+        help_text="When the synced blocked times last matched the external calendar"
+    )
     
     # Settings
     is_active = models.BooleanField(default=True)
@@ -64,6 +74,38 @@ class CalendarIntegration(models.Model):
             self.is_active = False
         self.save(update_fields=['sync_errors', 'is_active'])
     
+    def has_fresh_busy_store(self, end_date):
+        """
+        Check whether synced blocked times can stand in for a live busy-time fetch.
+        
+        Args:
+            end_date: Last date the caller needs busy times for
+        
+        Returns:
+            bool: True if the last reconciled sync is recent enough and covers end_date
+        """
+        if not self.busy_synced_at:
+            return False
+        
+        max_age = timedelta(seconds=settings.AVAILABILITY_EXTERNAL_BUSY_MAX_AGE_SECONDS)
+        if timezone.now() - self.busy_synced_at > max_age:
+            return False
+        
+        # Incremental syncs keep the window of the last full sync
+        window_start = self.full_sync_at or self.busy_synced_at
+        synced_until = window_start.date() + timedelta(days=settings.CALENDAR_SYNC_DAYS_AHEAD)
+        return end_date <= synced_until
+    
+    @property
+    def needs_full_sync(self):
+        """Check whether the next sync must refetch the whole window instead of using sync_token."""
+        if not self.sync_token or not self.full_sync_at:
+            return True
+        
+        # A full sync moves the window forward with the calendar
+        max_age = timedelta(hours=settings.CALENDAR_FULL_SYNC_INTERVAL_HOURS)
+        return timezone.now() - self.full_sync_at > max_age
+    
     def mark_sync_success(self):
         """Mark successful sync and reset error count."""
         self.sync_errors = 0
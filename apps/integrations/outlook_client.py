@@ -6,7 +6,10 @@ from datetime import datetime, timedelta
 from django.conf import settings
 from django.utils import timezone
 import requests
-from .utils import make_api_request, ensure_valid_token, log_integration_activity, parse_outlook_calendar_event
+from .utils import (
+    make_api_request, ensure_valid_token, log_integration_activity, parse_outlook_calendar_event,
+    SyncTokenExpiredError
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,7 @@ class OutlookCalendarClient:
         self.integration = integration
         self.organizer = integration.organizer
         self.base_url = "https://graph.microsoft.com/v1.0"
+        self.next_sync_token = ''
     
     def _get_headers(self):
         """Get authenticated headers for Microsoft Graph API."""
@@ -118,6 +122,119 @@ class OutlookCalendarClient:
             )
             raise
     
+    def get_event_changes(self, start_date, end_date, sync_token=None):
+        """
+        Get events changed since a delta link, or every event in the window.
+        
+        Collects ``iter_event_changes`` into one list.
+        
+        Args:
+            start_date: Start date for a full sync
+            end_date: End date for a full sync
+            sync_token: ``@odata.deltaLink`` of the previous sync (None: full sync)
+        
+        Returns:
+            tuple: (list of parsed events, next delta link)
+        
+        Raises:
+            SyncTokenExpiredError: If Graph no longer accepts the delta link (410 Gone)
+        """
+        events = [event for page in self.iter_event_changes(start_date, end_date, sync_token) for event in page]
+        return events, self.next_sync_token
+    
+    def iter_event_changes(self, start_date, end_date, sync_token=None):
+        """
+        Yield pages of events changed since a delta link, or of every event in the window.
+        
+        Uses the ``calendarView/delta`` query. Unlike ``get_busy_times``,
+        removed, cancelled and free events are returned too so reconciliation
+        can remove the blocked times they replace. Once the pages are
+        exhausted, ``self.next_sync_token`` holds the delta link to resume from.
+        
+        Args:
+            start_date: Start date for a full sync
+            end_date: End date for a full sync
+            sync_token: ``@odata.deltaLink`` of the previous sync (None: full sync)
+        
+        Yields:
+            list: Parsed events of one API page
+        
+        Raises:
+            SyncTokenExpiredError: If Graph no longer accepts the delta link (410 Gone)
+        """
+        self.next_sync_token = ''
+        
+        try:
+            headers = self._get_headers()
+            headers['Prefer'] = 'odata.maxpagesize=100'
+            
+            if sync_token:
+                # The delta link carries the original window and state
+                url = sync_token
+                params = None
+            else:
+                url = f"{self.base_url}/me/calendarView/delta"
+                params = {
+                    'startDateTime': datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc).isoformat(),
+                    'endDateTime': datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc).isoformat(),
+                }
+            
+            event_count = 0
+            delta_link = ''
+            
+            while url:
+                response = make_api_request(
+                    'GET', url, headers=headers, params=params,
+                    provider='outlook', organizer_id=self.organizer.id
+                )
+                
+                data = response.json()
+                
+                events = []
+                for event in data.get('value', []):
+                    if '@removed' in event:
+                        events.append({'external_id': event['id'], 'status': 'cancelled'})
+                        continue
+                    
+                    try:
+                        events.append(parse_outlook_calendar_event(event))
+                    except Exception as e:
+                        logger.warning(f"Error parsing Outlook event {event.get('id')}: {str(e)}")
+                        continue
+                
+                event_count += len(events)
+                yield events
+                
+                # Pages carry a next link; the last page carries the delta link
+                url = data.get('@odata.nextLink')
+                delta_link = data.get('@odata.deltaLink', delta_link)
+                params = None
+            
+            self.next_sync_token = delta_link
+            
+            log_integration_activity(
+                organizer=self.organizer,
+                log_type='calendar_sync',
+                integration_type='outlook',
+                message=f"Fetched {event_count} changed events from Outlook Calendar",
+                success=True,
+                details={'event_count': event_count, 'incremental': bool(sync_token)}
+            )
+            
+        except SyncTokenExpiredError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching Outlook Calendar changes: {str(e)}")
+            log_integration_activity(
+                organizer=self.organizer,
+                log_type='calendar_sync',
+                integration_type='outlook',
+                message=f"Failed to fetch changes: {str(e)}",
+                success=False,
+                details={'error': str(e)}
+            )
+            raise
+    
     def create_event(self, booking):
         """
         Create an event in Outlook Calendar.
@@ -1,6 +1,8 @@
 from celery import shared_task
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 import requests
 from datetime import datetime, timedelta
 import json
@@ -8,11 +10,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 from .models import CalendarIntegration, VideoConferenceIntegration, WebhookIntegration, IntegrationLog
-from .utils import log_integration_activity, ensure_valid_token, detect_integration_conflicts
+from .utils import (
+    log_integration_activity, ensure_valid_token, detect_integration_conflicts, get_calendar_sync_window,
+    SyncTokenExpiredError
+)
 from .google_client import GoogleCalendarClient, GoogleMeetClient
 from .outlook_client import OutlookCalendarClient
 from .zoom_client import ZoomClient
 
+# Rows per bulk insert or update during reconciliation
+RECONCILE_BATCH_SIZE = 500
+
 
 @shared_task
 def create_calendar_event(booking_id):
@@ -209,8 +217,19 @@ def send_webhook(webhook_id, event_type, data):
 
 
 @shared_task
-def sync_calendar_events(integration_id):
-    """Sync events from external calendar."""
+def sync_calendar_events(integration_id, full_sync=False):
+    """
+    Sync events from external calendar.
+    
+    Fetches only the changes since the stored sync token (Google syncToken,
+    Microsoft Graph delta link). The whole window is fetched when there is no
+    token, when the provider rejects it (410 Gone), or once every
+    CALENDAR_FULL_SYNC_INTERVAL_HOURS so the window moves with the calendar.
+    
+    Args:
+        integration_id: CalendarIntegration ID
+        full_sync: Fetch the whole window even if a sync token is stored
+    """
     try:
         integration = CalendarIntegration.objects.get(id=integration_id)
         
@@ -218,30 +237,44 @@ def sync_calendar_events(integration_id):
             return f"Sync disabled for {integration.provider} integration"
         
         # Calculate sync date range
-        today = timezone.now().date()
-        start_date = today - timedelta(days=getattr(settings, 'CALENDAR_SYNC_DAYS_BEHIND', 7))
-        end_date = today + timedelta(days=getattr(settings, 'CALENDAR_SYNC_DAYS_AHEAD', 90))
-        
-        # Get external events
-        external_events = []
+        start_date, end_date = get_calendar_sync_window()
         
         if integration.provider == 'google':
             client = GoogleCalendarClient(integration)
-            external_events = client.get_busy_times(start_date, end_date)
         elif integration.provider == 'outlook':
             client = OutlookCalendarClient(integration)
-            external_events = client.get_busy_times(start_date, end_date)
         else:
             logger.warning(f"Calendar sync not implemented for {integration.provider}")
             return f"Sync not implemented for {integration.provider}"
         
-        # Reconcile with existing blocked times
-        reconcile_calendar_events.delay(integration.id, external_events)
+        fetched_at = timezone.now()
+        sync_token = '' if full_sync or integration.needs_full_sync else integration.sync_token
+        incremental = bool(sync_token)
+        
+        # Pages are reconciled as they are fetched, in this task, so events
+        # never travel through the broker and memory stays flat
+        try:
+            counts = _reconcile_event_pages(
+                integration,
+                client.iter_event_changes(start_date, end_date, sync_token=sync_token or None),
+                incremental=incremental
+            )
+        except SyncTokenExpiredError:
+            logger.info(f"Sync token of {integration.provider} integration {integration.id} expired, running a full sync")
+            incremental = False
+            counts = _reconcile_event_pages(integration, client.iter_event_changes(start_date, end_date))
+        
+        # The token and watermark advance only once the changes are stored
+        _save_sync_state(integration, fetched_at, incremental, client.next_sync_token)
         
         # Mark successful sync
         integration.mark_sync_success()
         
-        return f"Calendar sync completed for {integration.provider}"
+        sync_type = 'incremental' if incremental else 'full'
+        return (
+            f"Calendar sync completed for {integration.provider} ({sync_type}, {counts['events']} events: "
+            f"{counts['created']} created, {counts['updated']} updated, {counts['removed']} removed)"
+        )
     
     except CalendarIntegration.DoesNotExist:
         return f"Calendar integration {integration_id} not found"
@@ -257,130 +290,245 @@ def sync_calendar_events(integration_id):
 
 
 @shared_task
-def reconcile_calendar_events(integration_id, external_events):
+def reconcile_calendar_events(integration_id, external_events, synced_at=None, incremental=False, sync_token=None):
     """
     Reconcile external calendar events with internal blocked times.
     
+    ``sync_calendar_events`` reconciles page by page inline; this task
+    remains for callers that already hold a list of events.
+    
     Args:
         integration_id: CalendarIntegration ID
         external_events: List of external events from calendar API
+        synced_at: ISO time the events were fetched (default: now)
+        incremental: Whether external_events are changes since sync_token
+        sync_token: Token to resume from next sync, stored once reconciled
     """
     try:
         integration = CalendarIntegration.objects.get(id=integration_id)
-        organizer = integration.organizer
         
-        from apps.availability.models import BlockedTime
-        
-        # Get existing synced blocked times for this provider
-        source_name = f"{integration.provider}_calendar"
-        existing_blocks = BlockedTime.objects.filter(
-            organizer=organizer,
-            source=source_name,
-            is_active=True
+        counts = _reconcile_event_pages(integration, [external_events], incremental=incremental)
+        _save_sync_state(
+            integration,
+            datetime.fromisoformat(synced_at) if synced_at else None,
+            incremental,
+            sync_token
         )
         
-        # Create lookup for existing blocks by external_id
-        existing_blocks_map = {
-            block.external_id: block 
-            for block in existing_blocks 
-            if block.external_id
-        }
-        
-        # Track what we've processed
-        processed_external_ids = set()
-        created_count = 0
-        updated_count = 0
+        return (
+            f"Reconciled {integration.provider} calendar: {counts['created']} created, "
+            f"{counts['updated']} updated, {counts['removed']} removed"
+        )
         
-        # Process external events
-        for event in external_events:
-            external_id = event['external_id']
-            processed_external_ids.add(external_id)
-            
-            # Skip transparent (free) events
-            if event.get('transparency') == 'transparent':
-                continue
+    except CalendarIntegration.DoesNotExist:
+        return f"Calendar integration {integration_id} not found"
+    except Exception as e:
+        logger.error(f"Error reconciling calendar events: {str(e)}")
+        return f"Error reconciling calendar events: {str(e)}"
+
+
+def _reconcile_event_pages(integration, event_pages, incremental=False):
+    """
+    Reconcile pages of external calendar events with internal blocked times.
+    
+    Each page is applied as it arrives, with one lookup of the blocks it
+    touches and bulk writes. Only the external IDs seen so far are kept, as
+    64-bit hashes, so memory stays flat however large the calendar (a hash
+    collision could only keep a stale block, never remove a live one).
+    
+    A full reconciliation then removes synced blocks whose events were not
+    listed; an incremental one only applies the given changes. Cancelled and
+    free events, and events outside the sync window, remove their blocks.
+    The availability cache is cleared once, for every date touched, even
+    when a later page fails after earlier pages were committed.
+    
+    Args:
+        integration: CalendarIntegration instance
+        event_pages: Iterable of lists of external events from calendar API
+        incremental: Whether the events are changes since the last sync
+    
+    Returns:
+        dict: Event, created, updated and removed counts
+    """
+    from apps.availability.models import BlockedTime
+    from apps.availability.signals import suppress_cache_invalidation
+    from apps.availability.utils import merge_date_ranges
+    
+    organizer = integration.organizer
+    source_name = f"{integration.provider}_calendar"
+    start_date, end_date = get_calendar_sync_window()
+    window_start = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+    window_end = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).replace(tzinfo=timezone.utc)
+    
+    def blocks_time(event):
+        if event.get('status') == 'cancelled' or event.get('transparency') == 'transparent':
+            return False
+        return event['start_datetime'] < window_end and event['end_datetime'] > window_start
+    
+    synced_blocks = BlockedTime.objects.filter(organizer=organizer, source=source_name, is_active=True)
+    manual_blocks = BlockedTime.objects.filter(organizer=organizer, source='manual', is_active=True)
+    has_manual_blocks = manual_blocks.exists()
+    
+    seen_ids = set()
+    affected_ranges = []
+    counts = {'events': 0, 'created': 0, 'updated': 0, 'removed': 0, 'conflicts': 0, 'overlaps': 0}
+    
+    try:
+        for page in event_pages:
+            counts['events'] += len(page)
             
-            # Skip cancelled events
-            if event.get('status') == 'cancelled':
-                continue
+            # The last change of an event within a page wins
+            page_events = {event['external_id']: event for event in page}
+            existing_blocks_map = {
+                block.external_id: block
+                for block in synced_blocks.filter(external_id__in=list(page_events))
+            }
             
-            existing_block = existing_blocks_map.get(external_id)
+            # Work out the create, update and delete sets of the page in memory
+            blocks_to_create = []
+            blocks_to_update = []
+            blocks_to_remove = []
+            busy_events = []
+            now = timezone.now()
             
-            if existing_block:
-                # Update existing block if changed
-                needs_update = (
-                    existing_block.start_datetime != event['start_datetime'] or
-                    existing_block.end_datetime != event['end_datetime'] or
-                    existing_block.reason != event['summary']
-                )
+            for external_id, event in page_events.items():
+                existing_block = existing_blocks_map.get(external_id)
                 
-                if needs_update:
-                    existing_block.start_datetime = event['start_datetime']
-                    existing_block.end_datetime = event['end_datetime']
-                    existing_block.reason = event['summary']
-                    existing_block.external_updated_at = event.get('updated')
-                    existing_block.save()
-                    updated_count += 1
-            else:
-                # Create new blocked time
-                BlockedTime.objects.create(
-                    organizer=organizer,
-                    start_datetime=event['start_datetime'],
-                    end_datetime=event['end_datetime'],
-                    reason=event['summary'],
-                    source=source_name,
-                    external_id=external_id,
-                    external_updated_at=event.get('updated'),
-                    is_active=True
+                if not blocks_time(event):
+                    if existing_block:
+                        blocks_to_remove.append(existing_block.pk)
+                        affected_ranges.append((existing_block.start_datetime.date(), existing_block.end_datetime.date()))
+                    continue
+                
+                seen_ids.add(hash(external_id))
+                busy_events.append(event)
+                
+                if existing_block:
+                    # Update existing block if changed
+                    needs_update = (
+                        existing_block.start_datetime != event['start_datetime'] or
+                        existing_block.end_datetime != event['end_datetime'] or
+                        existing_block.reason != event['summary']
+                    )
+                    
+                    if needs_update:
+                        # Both the old and the new dates change availability
+                        affected_ranges.append((existing_block.start_datetime.date(), existing_block.end_datetime.date()))
+                        existing_block.start_datetime = event['start_datetime']
+                        existing_block.end_datetime = event['end_datetime']
+                        existing_block.reason = event['summary']
+                        existing_block.external_updated_at = event.get('updated')
+                        existing_block.updated_at = now
+                        blocks_to_update.append(existing_block)
+                        affected_ranges.append((event['start_datetime'].date(), event['end_datetime'].date()))
+                else:
+                    blocks_to_create.append(BlockedTime(
+                        organizer=organizer,
+                        start_datetime=event['start_datetime'],
+                        end_datetime=event['end_datetime'],
+                        reason=event['summary'],
+                        source=source_name,
+                        external_id=external_id,
+                        external_updated_at=event.get('updated'),
+                        is_active=True
+                    ))
+                    affected_ranges.append((event['start_datetime'].date(), event['end_datetime'].date()))
+            
+            # Apply the page in bulk; per-row invalidation is replaced by one below
+            with transaction.atomic(), suppress_cache_invalidation():
+                BlockedTime.objects.bulk_create(blocks_to_create, batch_size=RECONCILE_BATCH_SIZE)
+                BlockedTime.objects.bulk_update(
+                    blocks_to_update,
+                    ['start_datetime', 'end_datetime', 'reason', 'external_updated_at', 'updated_at'],
+                    batch_size=RECONCILE_BATCH_SIZE
                 )
-                created_count += 1
-        
-        # Remove blocks that no longer exist externally
-        blocks_to_remove = existing_blocks.exclude(external_id__in=processed_external_ids)
-        removed_count = blocks_to_remove.count()
-        blocks_to_remove.delete()
-        
-        # Detect conflicts with manual blocks
-        manual_blocks = BlockedTime.objects.filter(
-            organizer=organizer,
-            source='manual',
-            is_active=True
-        )
-        
-        conflict_analysis = detect_integration_conflicts(
-            organizer, external_events, manual_blocks
-        )
-        
-        # Clear availability cache if changes were made
-        if created_count > 0 or updated_count > 0 or removed_count > 0:
+                if blocks_to_remove:
+                    BlockedTime.objects.filter(pk__in=blocks_to_remove).delete()
+            
+            counts['created'] += len(blocks_to_create)
+            counts['updated'] += len(blocks_to_update)
+            counts['removed'] += len(blocks_to_remove)
+            
+            # Detect conflicts with manual blocks
+            if has_manual_blocks and busy_events:
+                conflict_analysis = detect_integration_conflicts(organizer, busy_events, manual_blocks)
+                counts['conflicts'] += len(conflict_analysis['conflicts'])
+                counts['overlaps'] += len(conflict_analysis['overlaps'])
+            
+            # Merged date ranges rather than blocks, so this stays small too
+            affected_ranges = merge_date_ranges(affected_ranges)
+        
+        if not incremental:
+            # Remove blocks whose events the full listing no longer contains
+            unseen_blocks = [
+                (pk, start_datetime, end_datetime)
+                for pk, external_id, start_datetime, end_datetime in synced_blocks.values_list(
+                    'pk', 'external_id', 'start_datetime', 'end_datetime'
+                ).iterator(chunk_size=RECONCILE_BATCH_SIZE)
+                if hash(external_id) not in seen_ids
+            ]
+            
+            with transaction.atomic(), suppress_cache_invalidation():
+                for index in range(0, len(unseen_blocks), RECONCILE_BATCH_SIZE):
+                    batch = unseen_blocks[index:index + RECONCILE_BATCH_SIZE]
+                    BlockedTime.objects.filter(pk__in=[pk for pk, _, _ in batch]).delete()
+            
+            counts['removed'] += len(unseen_blocks)
+            affected_ranges.extend(
+                (start_datetime.date(), end_datetime.date()) for _, start_datetime, end_datetime in unseen_blocks
+            )
+    finally:
+        # Clear the availability cache once for every date the changes touched,
+        # including pages already committed when a later page fails
+        if affected_ranges:
             from apps.availability.tasks import clear_availability_cache
+            
+            date_ranges = merge_date_ranges(affected_ranges)
             clear_availability_cache.delay(
                 organizer.id,
                 cache_type='calendar_sync',
-                provider=integration.provider
+                provider=integration.provider,
+                date_ranges=[[start.isoformat(), end.isoformat()] for start, end in date_ranges]
             )
-        
+    
+    if counts['created'] or counts['updated'] or counts['removed'] or not incremental:
         log_integration_activity(
             organizer=organizer,
             log_type='calendar_reconciliation',
             integration_type=integration.provider,
-            message=f"Reconciled calendar events: {created_count} created, {updated_count} updated, {removed_count} removed",
+            message=(
+                f"Reconciled calendar events: {counts['created']} created, "
+                f"{counts['updated']} updated, {counts['removed']} removed"
+            ),
             success=True,
-            details={
-                'created_count': created_count,
-                'updated_count': updated_count,
-                'removed_count': removed_count,
-                'conflict_analysis': conflict_analysis
-            }
+            details=dict(counts, incremental=incremental)
         )
-        
-        return f"Reconciled {integration.provider} calendar: {created_count} created, {updated_count} updated, {removed_count} removed"
-        
-    except CalendarIntegration.DoesNotExist:
-        return f"Calendar integration {integration_id} not found"
-    except Exception as e:
-        logger.error(f"Error reconciling calendar events: {str(e)}")
-        return f"Error reconciling calendar events: {str(e)}"
+    
+    return counts
+
+
+def _save_sync_state(integration, synced_at, incremental, sync_token):
+    """
+    Record a reconciled sync on the integration.
+    
+    Availability reads the integration from the synced store while
+    busy_synced_at is fresh, and the next sync resumes from sync_token.
+    
+    Args:
+        integration: CalendarIntegration instance
+        synced_at: Time the events were fetched (default: now)
+        incremental: Whether the sync fetched changes only
+        sync_token: Token to resume from, or None to keep the stored one
+    """
+    integration.busy_synced_at = synced_at or timezone.now()
+    update_fields = ['busy_synced_at']
+    if sync_token is not None:
+        integration.sync_token = sync_token
+        update_fields.append('sync_token')
+        if not incremental:
+            integration.full_sync_at = integration.busy_synced_at
+            update_fields.append('full_sync_at')
+    integration.save(update_fields=update_fields)
 
 
 @shared_task
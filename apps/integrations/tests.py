@@ -417,7 +417,6 @@ class IntegrationTasksTestCase(TestCase):
     
     def setUp(self):
         self.organizer = User.objects.create_user(
-            username='organizer@test.com',
             email='organizer@test.com',
             first_name='Test',
             last_name='Organizer',
@@ -439,7 +438,7 @@ class IntegrationTasksTestCase(TestCase):
         
         # Mock client
         mock_client = Mock()
-        mock_client.get_busy_times.return_value = [
+        mock_client.iter_event_changes.return_value = iter([[
             {
                 'external_id': 'event123',
                 'summary': 'Test Event',
@@ -449,7 +448,8 @@ class IntegrationTasksTestCase(TestCase):
                 'status': 'confirmed',
                 'transparency': 'opaque'
             }
-        ]
+        ]])
+        mock_client.next_sync_token = 'sync-token-1'
         mock_client_class.return_value = mock_client
         
         # Run sync task
@@ -457,10 +457,15 @@ class IntegrationTasksTestCase(TestCase):
         
         self.assertIn('Calendar sync completed', result)
         
+        # Events are reconciled in the same task
+        self.assertTrue(BlockedTime.objects.filter(organizer=self.organizer, external_id='event123').exists())
+        
         # Verify integration was marked as successful
         self.integration.refresh_from_db()
         self.assertIsNotNone(self.integration.last_sync_at)
         self.assertEqual(self.integration.sync_errors, 0)
+        self.assertEqual(self.integration.sync_token, 'sync-token-1')
+        self.assertIsNotNone(self.integration.full_sync_at)
     
     @patch('apps.integrations.tasks.GoogleCalendarClient')
     def test_sync_error_handling(self, mock_client_class):
@@ -469,7 +474,7 @@ class IntegrationTasksTestCase(TestCase):
         
         # Mock client to raise exception
         mock_client = Mock()
-        mock_client.get_busy_times.side_effect = Exception("API Error")
+        mock_client.iter_event_changes.side_effect = Exception("API Error")
         mock_client_class.return_value = mock_client
         
         # Run sync task (should handle error gracefully)
@@ -480,6 +485,227 @@ class IntegrationTasksTestCase(TestCase):
         # Verify integration error was recorded
         self.integration.refresh_from_db()
         self.assertEqual(self.integration.sync_errors, 1)
+    
+    @patch('apps.integrations.tasks.GoogleCalendarClient')
+    def test_expired_sync_token_falls_back_to_full_sync(self, mock_client_class):
+        """Test a 410 on the stored sync token refetches the whole window."""
+        from .tasks import sync_calendar_events
+        from .utils import SyncTokenExpiredError
+        
+        self.integration.sync_token = 'stale-token'
+        self.integration.full_sync_at = timezone.now()
+        self.integration.save()
+        
+        mock_client = Mock()
+        mock_client.iter_event_changes.side_effect = [SyncTokenExpiredError("Gone"), iter([[]])]
+        mock_client.next_sync_token = 'fresh-token'
+        mock_client_class.return_value = mock_client
+        
+        result = sync_calendar_events(self.integration.id)
+        
+        self.assertIn('full', result)
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.sync_token, 'fresh-token')
+        first_call, second_call = mock_client.iter_event_changes.call_args_list
+        self.assertEqual(first_call.kwargs['sync_token'], 'stale-token')
+        self.assertNotIn('sync_token', second_call.kwargs)
+    
+    def test_incremental_reconcile_applies_only_changes(self):
+        """Test incremental reconciliation keeps untouched blocks and removes deleted ones."""
+        from .tasks import reconcile_calendar_events
+        
+        start = timezone.now() + timedelta(days=1)
+        for external_id in ('kept', 'deleted'):
+            BlockedTime.objects.create(
+                organizer=self.organizer,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=1),
+                source='google_calendar',
+                external_id=external_id
+            )
+        
+        changes = [
+            {'external_id': 'deleted', 'status': 'cancelled'},
+            {
+                'external_id': 'new',
+                'summary': 'New Event',
+                'start_datetime': start + timedelta(hours=2),
+                'end_datetime': start + timedelta(hours=3),
+                'updated': timezone.now(),
+                'status': 'confirmed',
+                'transparency': 'opaque'
+            }
+        ]
+        reconcile_calendar_events(self.integration.id, changes, incremental=True, sync_token='next-token')
+        
+        external_ids = set(BlockedTime.objects.filter(organizer=self.organizer).values_list('external_id', flat=True))
+        self.assertEqual(external_ids, {'kept', 'new'})
+        
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.sync_token, 'next-token')
+        self.assertIsNotNone(self.integration.busy_synced_at)
+        self.assertIsNone(self.integration.full_sync_at)
+    
+    @patch('apps.availability.tasks.clear_availability_cache')
+    @patch('apps.availability.tasks.queue_cache_invalidation')
+    def test_reconcile_invalidates_once_for_the_batch(self, mock_queue_invalidation, mock_clear_cache):
+        """Test bulk reconciliation skips per-row invalidation and clears the affected dates once."""
+        from .tasks import reconcile_calendar_events
+        
+        start = timezone.now() + timedelta(days=1)
+        events = [
+            {
+                'external_id': f"event{index}",
+                'summary': 'Busy',
+                'start_datetime': start + timedelta(days=index * 10),
+                'end_datetime': start + timedelta(days=index * 10, hours=1),
+                'updated': timezone.now(),
+                'status': 'confirmed',
+                'transparency': 'opaque'
+            }
+            for index in range(3)
+        ]
+        
+        result = reconcile_calendar_events(self.integration.id, events, sync_token='token')
+        
+        self.assertIn('3 created', result)
+        self.assertEqual(BlockedTime.objects.filter(organizer=self.organizer).count(), 3)
+        mock_queue_invalidation.assert_not_called()
+        mock_clear_cache.delay.assert_called_once()
+        self.assertEqual(len(mock_clear_cache.delay.call_args.kwargs['date_ranges']), 3)
+        
+        # An incremental batch of an update and a cancellation is cleared once too
+        events[0]['end_datetime'] += timedelta(hours=1)
+        events[1]['status'] = 'cancelled'
+        result = reconcile_calendar_events(
+            self.integration.id, events[:2], incremental=True, sync_token='next-token'
+        )
+        
+        self.assertIn('1 updated, 1 removed', result)
+        mock_queue_invalidation.assert_not_called()
+        self.assertEqual(mock_clear_cache.delay.call_count, 2)
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.sync_token, 'next-token')
+    
+    @patch('apps.integrations.tasks.GoogleCalendarClient')
+    def test_full_sync_reconciles_page_by_page(self, mock_client_class):
+        """Test a full sync keeps blocks listed on any page and removes the rest."""
+        from .tasks import sync_calendar_events
+        
+        start = timezone.now() + timedelta(days=1)
+        for external_id in ('listed_later', 'gone'):
+            BlockedTime.objects.create(
+                organizer=self.organizer,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=1),
+                reason='Busy',
+                source='google_calendar',
+                external_id=external_id
+            )
+        
+        def event(external_id, hours):
+            return {
+                'external_id': external_id,
+                'summary': 'Busy',
+                'start_datetime': start + timedelta(hours=hours),
+                'end_datetime': start + timedelta(hours=hours + 1),
+                'updated': timezone.now(),
+                'status': 'confirmed',
+                'transparency': 'opaque'
+            }
+        
+        mock_client = Mock()
+        mock_client.iter_event_changes.return_value = iter([[event('first_page', 2)], [event('listed_later', 0)]])
+        mock_client.next_sync_token = 'token'
+        mock_client_class.return_value = mock_client
+        
+        result = sync_calendar_events(self.integration.id, full_sync=True)
+        
+        self.assertIn('1 created, 0 updated, 1 removed', result)
+        external_ids = set(BlockedTime.objects.filter(organizer=self.organizer).values_list('external_id', flat=True))
+        self.assertEqual(external_ids, {'first_page', 'listed_later'})
+    
+    @patch('apps.integrations.tasks.GoogleCalendarClient')
+    def test_full_sync_removes_blocks_missing_from_every_page(self, mock_client_class):
+        """Test blocks seen on earlier pages survive while a block listed on no page is removed."""
+        from .tasks import sync_calendar_events
+        
+        start = timezone.now() + timedelta(days=1)
+        existing = {'seen_on_first': 0, 'seen_on_second': 2, 'never_listed': 4}
+        for external_id, hours in existing.items():
+            BlockedTime.objects.create(
+                organizer=self.organizer,
+                start_datetime=start + timedelta(hours=hours),
+                end_datetime=start + timedelta(hours=hours + 1),
+                reason='Busy',
+                source='google_calendar',
+                external_id=external_id
+            )
+        
+        def event(external_id, hours):
+            return {
+                'external_id': external_id,
+                'summary': 'Busy',
+                'start_datetime': start + timedelta(hours=hours),
+                'end_datetime': start + timedelta(hours=hours + 1),
+                'updated': timezone.now(),
+                'status': 'confirmed',
+                'transparency': 'opaque'
+            }
+        
+        pages = [
+            [event('seen_on_first', 0)],
+            [event('seen_on_second', 2)],
+            [event('new_on_last', 6)],
+        ]
+        mock_client = Mock()
+        mock_client.iter_event_changes.return_value = iter(pages)
+        mock_client.next_sync_token = 'token'
+        mock_client_class.return_value = mock_client
+        
+        result = sync_calendar_events(self.integration.id, full_sync=True)
+        
+        self.assertIn('1 created, 0 updated, 1 removed', result)
+        external_ids = set(BlockedTime.objects.filter(organizer=self.organizer).values_list('external_id', flat=True))
+        self.assertEqual(external_ids, {'seen_on_first', 'seen_on_second', 'new_on_last'})
+
+    @patch('apps.availability.tasks.clear_availability_cache')
+    @patch('apps.integrations.tasks.GoogleCalendarClient')
+    def test_failed_page_still_invalidates_committed_pages(self, mock_client_class, mock_clear_cache):
+        """Test blocks committed before a failing page have their dates invalidated."""
+        from .tasks import sync_calendar_events
+        
+        start = timezone.now() + timedelta(days=1)
+        
+        def pages():
+            yield [{
+                'external_id': 'first_page',
+                'summary': 'Busy',
+                'start_datetime': start,
+                'end_datetime': start + timedelta(hours=1),
+                'updated': timezone.now(),
+                'status': 'confirmed',
+                'transparency': 'opaque'
+            }]
+            raise Exception("API Error")
+        
+        mock_client = Mock()
+        mock_client.iter_event_changes.return_value = pages()
+        mock_client_class.return_value = mock_client
+        
+        result = sync_calendar_events(self.integration.id, full_sync=True)
+        
+        self.assertIn('Error syncing calendar', result)
+        self.assertTrue(BlockedTime.objects.filter(organizer=self.organizer, external_id='first_page').exists())
+        mock_clear_cache.delay.assert_called_once()
+        self.assertEqual(
+            mock_clear_cache.delay.call_args.kwargs['date_ranges'],
+            [[start.date().isoformat(), (start + timedelta(hours=1)).date().isoformat()]]
+        )
+        
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.sync_errors, 1)
+        self.assertFalse(self.integration.sync_token)
 
 
 class OAuthFlowTestCase(TestCase):
@@ -487,7 +713,6 @@ class OAuthFlowTestCase(TestCase):
     
     def setUp(self):
         self.organizer = User.objects.create_user(
-            username='organizer@test.com',
             email='organizer@test.com',
             first_name='Test',
             last_name='Organizer',
@@ -564,6 +789,44 @@ class OAuthFlowTestCase(TestCase):
         )
         self.assertEqual(integration.access_token, 'new_access_token')
         self.assertTrue(integration.is_active)
+    
+    @patch('apps.integrations.views.exchange_oauth_code')
+    @patch('apps.integrations.views.get_provider_user_info')
+    def test_reconnect_resets_synced_busy_store(self, mock_get_user_info, mock_exchange_code):
+        """Test reconnecting a calendar stops availability from reading the previous account's blocks."""
+        from django.urls import reverse
+        
+        synced_at = timezone.now()
+        CalendarIntegration.objects.create(
+            organizer=self.organizer,
+            provider='google',
+            access_token='old_access_token',
+            sync_token='old-token',
+            busy_synced_at=synced_at,
+            full_sync_at=synced_at
+        )
+        
+        mock_exchange_code.return_value = {'access_token': 'new_access_token', 'expires_in': 3600}
+        mock_get_user_info.return_value = {'id': 'other-user', 'email': 'other@test.com'}
+        
+        self.client.force_login(self.organizer)
+        session = self.client.session
+        session['oauth_state_google_calendar'] = 'test_state'
+        session.save()
+        
+        response = self.client.post(reverse('integrations:oauth-callback'), {
+            'provider': 'google',
+            'integration_type': 'calendar',
+            'code': 'auth_code_123',
+            'state': 'google:calendar:test_state'
+        }, content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        integration = CalendarIntegration.objects.get(organizer=self.organizer, provider='google')
+        self.assertFalse(integration.sync_token)
+        self.assertIsNone(integration.busy_synced_at)
+        self.assertIsNone(integration.full_sync_at)
+        self.assertFalse(integration.has_fresh_busy_store(synced_at.date()))
 
 
 class IntegrationAPITestCase(TestCase):
@@ -29,6 +29,11 @@ class IntegrationError(Exception):
     pass
 
 
+class SyncTokenExpiredError(Exception):
+    """Custom exception for incremental sync tokens the provider no longer accepts."""
+    pass
+
+
 def rate_limit_key(provider, organizer_id):
     """Generate rate limit cache key."""
     return f"rate_limit:{provider}:{organizer_id}"
@@ -85,6 +90,7 @@ def make_api_request(method, url, headers=None, json_data=None, params=None, pro
     Raises:
         RateLimitError: If rate limit is exceeded
         TokenExpiredError: If token is expired
+        SyncTokenExpiredError: If an incremental sync link has expired (410 Gone)
         IntegrationError: For other API errors
     """
     if provider and organizer_id:
@@ -107,6 +113,8 @@ def make_api_request(method, url, headers=None, json_data=None, params=None, pro
         # Handle common HTTP error codes
         if response.status_code == 401:
             raise TokenExpiredError("Access token expired or invalid")
+        elif response.status_code == 410:
+            raise SyncTokenExpiredError("Sync state expired, full sync required")
         elif response.status_code == 403:
             raise IntegrationError("Insufficient permissions or quota exceeded")
         elif response.status_code == 429:
@@ -283,6 +291,20 @@ def log_integration_activity(organizer, log_type, integration_type, message, suc
     )
 
 
+def get_calendar_sync_window():
+    """
+    Get the date window calendar sync keeps in the synced blocked times.
+    
+    Returns:
+        tuple: (start_date, end_date)
+    """
+    today = timezone.now().date()
+    return (
+        today - timedelta(days=getattr(settings, 'CALENDAR_SYNC_DAYS_BEHIND', 7)),
+        today + timedelta(days=getattr(settings, 'CALENDAR_SYNC_DAYS_AHEAD', 90))
+    )
+
+
 def parse_google_calendar_event(event_data):
     """
     Parse Google Calendar event data into our format.
@@ -2,12 +2,19 @@ from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.conf import settings
+from datetime import timedelta
 from .models import CalendarIntegration, VideoConferenceIntegration, WebhookIntegration, IntegrationLog
 from .serializers import (
     CalendarIntegrationSerializer, VideoConferenceIntegrationSerializer,
     WebhookIntegrationSerializer, IntegrationLogSerializer,
     OAuthInitiateSerializer, OAuthCallbackSerializer
 )
+import logging
+import requests
+
+logger = logging.getLogger(__name__)
 
 
 class CalendarIntegrationListView(generics.ListAPIView):
@@ -175,7 +182,12 @@ def oauth_callback(request):
                         'calendar_id': user_info.get('calendar_id', ''),
                         'is_active': True,
                         'sync_enabled': True,
-                        'sync_errors': 0
+                        'sync_errors': 0,
+                        # A reconnected account may be a different calendar, so
+                        # its synced blocks are not fresh until the next full sync
+                        'sync_token': '',
+                        'busy_synced_at': None,
+                        'full_sync_at': None
                     }
                 )
             else:  # video
@@ -330,9 +342,9 @@ def force_calendar_sync(request, pk):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Trigger immediate sync
+    # Trigger immediate full sync
     from .tasks import sync_calendar_events
-    sync_calendar_events.delay(integration.id)
+    sync_calendar_events.delay(integration.id, full_sync=True)
     
     return Response({'message': 'Calendar sync initiated'})
 
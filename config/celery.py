@@ -42,6 +42,10 @@ app.conf.update(
             'task': 'apps.users.tasks.unlock_locked_accounts',
             'schedule': 1800.0,  # Run every 30 minutes
         },
+        'refresh-availability-cache': {
+            'task': 'apps.availability.tasks.refresh_availability_cache_for_all_organizers',
+            'schedule': 3600.0,  # Run every hour (AVAILABILITY_REFRESH_INTERVAL_SECONDS)
+        },
         'process-dirty-cache-flags': {
             'task': 'apps.availability.tasks.process_dirty_cache_flags',
             'schedule': 300.0,  # Run every 5 minutes
@@ -50,6 +54,14 @@ app.conf.update(
             'task': 'apps.availability.tasks.monitor_cache_performance_detailed',
             'schedule': 3600.0,  # Run every hour
         },
+        'recompute-dirty-availability-cache': {
+            'task': 'apps.events.tasks.recompute_dirty_availability_cache',
+            'schedule': 300.0,  # Run every 5 minutes
+        },
+        'rebuild-daily-booking-counts': {
+            'task': 'apps.events.tasks.rebuild_daily_booking_counts',
+            'schedule': 86400.0,  # Run daily
+        },
         'sync-all-calendar-integrations': {
             'task': 'apps.integrations.tasks.sync_all_calendar_integrations',
             'schedule': 900.0,  # Run every 15 minutes
@@ -287,6 +287,25 @@ AVAILABILITY_REASONABLE_HOURS_START = config('AVAILABILITY_REASONABLE_HOURS_STAR
 AVAILABILITY_REASONABLE_HOURS_END = config('AVAILABILITY_REASONABLE_HOURS_END', default=22, cast=int)
 AVAILABILITY_SLOT_INTERVAL_MINUTES = config('AVAILABILITY_SLOT_INTERVAL_MINUTES', default=15, cast=int)
 AVAILABILITY_CACHE_DEBOUNCE_SECONDS = config('AVAILABILITY_CACHE_DEBOUNCE_SECONDS', default=300, cast=int)  # 5 minutes
+AVAILABILITY_SLOT_ENGINE = config('AVAILABILITY_SLOT_ENGINE', default='sweep')  # 'sweep' or 'loop'
+AVAILABILITY_CACHE_BACKEND = config('AVAILABILITY_CACHE_BACKEND', default='redis')  # 'redis', 'redis_hash' or 'database'
+AVAILABILITY_DIRTY_BATCH_SIZE = config('AVAILABILITY_DIRTY_BATCH_SIZE', default=50, cast=int)
+AVAILABILITY_DIRTY_MAX_BATCHES = config('AVAILABILITY_DIRTY_MAX_BATCHES', default=10, cast=int)
+AVAILABILITY_REFRESH_INTERVAL_SECONDS = config('AVAILABILITY_REFRESH_INTERVAL_SECONDS', default=3600, cast=int)  # 1 hour
+AVAILABILITY_REFRESH_SHARD_SIZE = config('AVAILABILITY_REFRESH_SHARD_SIZE', default=100, cast=int)
+AVAILABILITY_LOCAL_CACHE_SIZE = config('AVAILABILITY_LOCAL_CACHE_SIZE', default=1000, cast=int)  # 0 disables
+AVAILABILITY_LOCAL_CACHE_TIMEOUT = config('AVAILABILITY_LOCAL_CACHE_TIMEOUT', default=10, cast=int)  # seconds
+AVAILABILITY_LOCAL_GENERATION_TIMEOUT = config('AVAILABILITY_LOCAL_GENERATION_TIMEOUT', default=2, cast=int)  # seconds
+AVAILABILITY_LOCK_TIMEOUT = config('AVAILABILITY_LOCK_TIMEOUT', default=30, cast=int)  # seconds
+AVAILABILITY_LOCK_WAIT_SECONDS = config('AVAILABILITY_LOCK_WAIT_SECONDS', default=2.0, cast=float)
+AVAILABILITY_STALE_TIMEOUT = config('AVAILABILITY_STALE_TIMEOUT', default=86400, cast=int)  # 24 hours
+AVAILABILITY_RECOMPUTE_TIME_BUDGET_SECONDS = config('AVAILABILITY_RECOMPUTE_TIME_BUDGET_SECONDS', default=120, cast=int)
+AVAILABILITY_METRICS_ENABLED = config('AVAILABILITY_METRICS_ENABLED', default=True, cast=bool)
+AVAILABILITY_METRICS_BUCKET_SECONDS = config('AVAILABILITY_METRICS_BUCKET_SECONDS', default=60, cast=int)
+AVAILABILITY_METRICS_RETENTION_SECONDS = config('AVAILABILITY_METRICS_RETENTION_SECONDS', default=86400, cast=int)  # 24 hours
+AVAILABILITY_METRICS_TOKEN = config('AVAILABILITY_METRICS_TOKEN', default='')  # Bearer token for the Prometheus endpoint
+AVAILABILITY_EXTERNAL_BUSY_SOURCE = config('AVAILABILITY_EXTERNAL_BUSY_SOURCE', default='synced')  # 'synced' or 'live'
+AVAILABILITY_EXTERNAL_BUSY_MAX_AGE_SECONDS = config('AVAILABILITY_EXTERNAL_BUSY_MAX_AGE_SECONDS', default=1800, cast=int)  # 2 sync intervals
 
 # Twilio Configuration (for SMS)
 TWILIO_ACCOUNT_SID = config('TWILIO_ACCOUNT_SID', default='')
@@ -343,6 +362,7 @@ INTEGRATION_RATE_LIMIT_ZOOM = config('INTEGRATION_RATE_LIMIT_ZOOM', default=80,
 CALENDAR_SYNC_DAYS_AHEAD = config('CALENDAR_SYNC_DAYS_AHEAD', default=90, cast=int)
 CALENDAR_SYNC_DAYS_BEHIND = config('CALENDAR_SYNC_DAYS_BEHIND', default=7, cast=int)
 CALENDAR_SYNC_BATCH_SIZE = config('CALENDAR_SYNC_BATCH_SIZE', default=50, cast=int)
+CALENDAR_FULL_SYNC_INTERVAL_HOURS = config('CALENDAR_FULL_SYNC_INTERVAL_HOURS', default=24, cast=int)  # Incremental syncs in between
 
 # SAML Configuration
 SAML_CONFIG = {